@@ -0,0 +1,37 @@
+"""Catálogos da PokéAPI já parseados em estruturas compactas e imutáveis."""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+
+class Catalog:
+    """Parsed catalog as parallel ``ids``/``names`` tuples sorted by id.
+
+    Built once per payload version and shared between requests, so it must
+    never be mutated. ``position`` maps an id to its index in both tuples.
+    """
+
+    __slots__ = ("ids", "names", "_positions")
+
+    def __init__(self, entries: Iterable[Tuple[int, str]]) -> None:
+        pairs = sorted((pokemon_id, name) for pokemon_id, name in entries if pokemon_id and name)
+        self.ids: Tuple[int, ...] = tuple(pokemon_id for pokemon_id, _name in pairs)
+        self.names: Tuple[str, ...] = tuple(name for _pokemon_id, name in pairs)
+        self._positions: Dict[int, int] = {pokemon_id: position for position, pokemon_id in enumerate(self.ids)}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "Catalog":
+        return cls((record["id"], record["name"]) for record in records)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, pokemon_id: object) -> bool:
+        return pokemon_id in self._positions
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for pokemon_id, name in zip(self.ids, self.names):
+            yield {"id": pokemon_id, "name": name}
+
+    def position(self, pokemon_id: int) -> int | None:
+        return self._positions.get(pokemon_id)
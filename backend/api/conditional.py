@@ -0,0 +1,51 @@
+"""Requisições condicionais (ETag/Last-Modified) das listagens da API."""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+# Listas anônimas podem ficar no CDN/navegador por pouco tempo; depois revalidam via ETag
+PUBLIC_MAX_AGE = 60
+
+
+def compute_etag(*parts: Any) -> str:
+    """Strong ETag over the JSON encoding of ``parts``."""
+    encoded = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return f'"{hashlib.sha256(encoded.encode()).hexdigest()[:32]}"'
+
+
+def add_cache_headers(
+    response: HttpResponseBase, etag: str, *, private: bool, last_modified: int | None = None
+) -> HttpResponseBase:
+    """Attach the validators and the caching policy to ``response``.
+
+    Responses that depend on the user are ``private`` and must be revalidated
+    on every use; ``Last-Modified`` is only sent for public ones, since the
+    catalog timestamp does not track favorites or team changes.
+    """
+    response["ETag"] = etag
+    if private:
+        patch_cache_control(response, private=True, no_cache=True)
+    else:
+        patch_cache_control(response, public=True, max_age=PUBLIC_MAX_AGE)
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+    patch_vary_headers(response, ["Authorization"])
+    return response
+
+
+def not_modified(
+    request, etag: str, *, private: bool, last_modified: int | None = None
+) -> HttpResponseBase | None:
+    """Return a 304 (or 412) response if the request preconditions allow it, else ``None``."""
+    response = get_conditional_response(
+        request, etag=etag, last_modified=None if private else last_modified
+    )
+    if response is None:
+        return None
+    return add_cache_headers(response, etag, private=private, last_modified=last_modified)
@@ -0,0 +1,36 @@
+"""Cache das respostas serializadas de ``GET /api/pokemon/``."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Tuple
+
+from django.core.cache import cache
+
+LIST_CACHE_TTL = int(os.environ.get("POKEMON_LIST_CACHE_TTL", "3600"))
+
+
+def list_cache_key(version: str, filters: Dict[str, Any]) -> str:
+    """Key of a list page: catalog version plus the normalized filters.
+
+    A new catalog version changes every key, so stale pages are never read
+    again and simply expire.
+    """
+    encoded = json.dumps(filters, sort_keys=True, separators=(",", ":"))
+    return f"pokemon-list:{version}:{hashlib.sha256(encoded.encode()).hexdigest()[:32]}"
+
+
+def is_complete(payload: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    """Whether every Pokémon of the page was hydrated (partial pages are not cached)."""
+    expected = max(0, min(filters["limit"], payload.get("count", 0) - filters["offset"]))
+    return not payload.get("partial") and len(payload.get("results", [])) == expected
+
+
+async def aget_page(key: str) -> Tuple[int, bytes] | None:
+    """Return ``(count, body)`` of a cached page, if any."""
+    return await cache.aget(key)
+
+
+async def aset_page(key: str, count: int, body: bytes) -> None:
+    await cache.aset(key, (count, body), LIST_CACHE_TTL)
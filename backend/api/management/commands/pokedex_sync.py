@@ -0,0 +1,76 @@
+"""Gera/atualiza o snapshot offline do Pokédex a partir da PokéAPI."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from api import pokedex_store
+from api.pokeapi_service import PokeAPIError, crawl_catalogs, fetch_pokemon_records
+from api.pokedex_snapshot import read_snapshot, snapshot_path, write_snapshot
+
+POKEMON_BATCH_SIZE = 100
+
+
+class Command(BaseCommand):
+    help = (
+        "Rastreia o catálogo global, todas as gerações e todos os tipos da PokéAPI "
+        "e grava um snapshot versionado (JSON gzip). Execuções seguintes só buscam "
+        "os Pokémon que ainda não estão no snapshot."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--output", type=Path, help="Caminho do snapshot (padrão: POKEDEX_SNAPSHOT_PATH).")
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Ignora o snapshot atual e busca novamente todos os Pokémon.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path: Path = options["output"] or snapshot_path()
+        previous = read_snapshot(path) or {}
+        known: Dict[int, Dict[str, Any]] = (
+            {} if options["full"] else {record["id"]: record for record in previous.get("pokemon", [])}
+        )
+
+        try:
+            catalog_ids, endpoints = crawl_catalogs()
+        except PokeAPIError as exc:
+            raise CommandError(str(exc)) from exc
+        missing = [pokemon_id for pokemon_id in catalog_ids if pokemon_id not in known]
+        fetched = self._fetch_pokemon(missing, refresh=options["full"])
+        known.update((record["id"], record) for record in fetched)
+        pokemon = [known[pokemon_id] for pokemon_id in catalog_ids if pokemon_id in known]
+
+        changed = endpoints != previous.get("endpoints") or pokemon != previous.get("pokemon")
+        version = previous.get("version", 0) + (1 if changed else 0)
+        if changed:
+            write_snapshot(
+                {
+                    "version": version,
+                    "created_at": timezone.now().isoformat(),
+                    "endpoints": endpoints,
+                    "pokemon": pokemon,
+                },
+                path,
+            )
+        pokedex_store.save_records(fetched)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Snapshot v{version} em {path}: {len(pokemon)} Pokémon "
+                f"({len(fetched)} novos, {len(missing) - len(fetched)} falhas), "
+                f"{len(endpoints)} endpoints{'' if changed else ' (sem mudanças)'}."
+            )
+        )
+
+    def _fetch_pokemon(self, ids: List[int], *, refresh: bool) -> List[Dict[str, Any]]:
+        fetched: List[Dict[str, Any]] = []
+        for start in range(0, len(ids), POKEMON_BATCH_SIZE):
+            batch = ids[start:start + POKEMON_BATCH_SIZE]
+            fetched += fetch_pokemon_records(batch, refresh=refresh)
+            self.stdout.write(f"Pokémon: {min(start + POKEMON_BATCH_SIZE, len(ids))}/{len(ids)}")
+        return fetched
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0003_update_constraints"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Pokemon",
+            fields=[
+                ("id", models.PositiveIntegerField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=100, unique=True)),
+                ("primary_type", models.CharField(blank=True, db_index=True, max_length=20)),
+                ("secondary_type", models.CharField(blank=True, db_index=True, max_length=20)),
+                ("sprite", models.URLField(blank=True, max_length=300, null=True)),
+                ("hp", models.PositiveSmallIntegerField(default=0)),
+                ("attack", models.PositiveSmallIntegerField(default=0)),
+                ("defense", models.PositiveSmallIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ["id"],
+            },
+        ),
+    ]
@@ -67,3 +67,23 @@ class TeamSlot(models.Model):
 
     def __str__(self) -> str:  # pragma: no cover - representação humana simples
         return f"#{self.slot} -> {self.user.username} ({self.pokemon_id})"
+
+
+class Pokemon(models.Model):
+    """Registro normalizado da PokéAPI mantido no Pokédex local."""
+
+    id = models.PositiveIntegerField(primary_key=True)
+    name = models.CharField(max_length=100, unique=True)
+    primary_type = models.CharField(max_length=20, blank=True, db_index=True)
+    secondary_type = models.CharField(max_length=20, blank=True, db_index=True)
+    sprite = models.URLField(max_length=300, blank=True, null=True)
+    hp = models.PositiveSmallIntegerField(default=0)
+    attack = models.PositiveSmallIntegerField(default=0)
+    defense = models.PositiveSmallIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["id"]
+
+    def __str__(self) -> str:  # pragma: no cover - representação humana simples
+        return f"#{self.id} {self.name}"
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from rest_framework.pagination import PageNumberPagination
+
+
+class OptionalPageNumberPagination(PageNumberPagination):
+    """Paginação ativada apenas quando o cliente envia ``page`` ou ``page_size``.
+
+    Sem esses parâmetros a resposta continua sendo a lista completa, formato
+    que o frontend já consome para marcar favoritos em todas as páginas.
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.page_query_param not in params and self.page_size_query_param not in params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
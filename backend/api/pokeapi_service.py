@@ -1,32 +1,104 @@
 """Integrações com a PokéAPI v2."""
 from __future__ import annotations
 
+import asyncio
+import base64
+import contextvars
+import hashlib
+import json
 import logging
 import os
-from typing import Any, Dict, List
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence, Tuple
 
 import requests
+from asgiref.sync import sync_to_async
 from django.core.cache import cache
+from django.db import close_old_connections
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from kogui_pokedex.request_context import get_metrics
+
+from . import pokedex_store, sprite_cache
+from .catalog import Catalog
+from .pokedex_snapshot import read_snapshot
+from .pokedex_table import STAT_COLUMNS, PokedexTable
+from .search_index import NameIndex
+from .upstream_guard import CLOSED, AdaptiveLimiter, CircuitBreaker, TokenBucket
+
 POKEAPI_BASE_URL = "https://pokeapi.co/api/v2"
 CACHE_TTL = int(os.environ.get("POKEAPI_CACHE_TTL", "3600"))  # 1 hour default
+POKEMON_CACHE_TTL = int(os.environ.get("POKEAPI_POKEMON_CACHE_TTL", "86400"))  # dados de Pokémon quase não mudam
+STALE_TTL = int(os.environ.get("POKEAPI_STALE_TTL", "604800"))  # janela extra servindo dado stale
+# TTLs por classe de endpoint: (soft, hard). Depois do soft o dado continua sendo
+# servido (stale) enquanto um refresh roda em background; só expira no hard.
+ENDPOINT_TTLS = {
+    "catalog": (CACHE_TTL, CACHE_TTL + STALE_TTL),
+    "type": (CACHE_TTL, CACHE_TTL + STALE_TTL),
+    "pokemon": (POKEMON_CACHE_TTL, POKEMON_CACHE_TTL + STALE_TTL),
+}
+MAX_WORKERS = max(1, int(os.environ.get("POKEAPI_MAX_WORKERS", "8")))
+# Lock entre processos (via cache.add no backend compartilhado) para cache misses
+DISTRIBUTED_LOCK = os.environ.get("POKEAPI_DISTRIBUTED_LOCK", "0") == "1"
+LOCK_TIMEOUT = int(os.environ.get("POKEAPI_LOCK_TIMEOUT", "20"))  # segundos
+DETAIL_LANGUAGE = os.environ.get("POKEAPI_DETAIL_LANGUAGE", "en")  # textos de espécie (genus/descrição)
+GLOBAL_CATALOG_ENDPOINT = "pokemon?limit=2000&offset=0"
+GENERATIONS_ENDPOINT = "generation?limit=100&offset=0"
+TYPES_ENDPOINT = "type?limit=100&offset=0"
+# Tempo máximo por chamada: poucas retentativas curtas e timeouts de conexão/leitura
+# separados, para uma PokéAPI lenta não prender o worker até o timeout do gunicorn
+REQUEST_TIMEOUT = (3.05, float(os.environ.get("POKEAPI_READ_TIMEOUT", "5")))
+MAX_RETRIES = int(os.environ.get("POKEAPI_MAX_RETRIES", "1"))
+BREAKER_THRESHOLD = int(os.environ.get("POKEAPI_BREAKER_THRESHOLD", "5"))  # falhas seguidas
+BREAKER_RESET = float(os.environ.get("POKEAPI_BREAKER_RESET", "30"))  # segundos até a sonda
+LATENCY_TARGET = float(os.environ.get("POKEAPI_LATENCY_TARGET", "2"))  # acima disso reduz a concorrência
+LIMITER_WAIT = float(os.environ.get("POKEAPI_LIMITER_WAIT", "5"))  # espera máxima por uma vaga
+# Tempo máximo esperando a PokéAPI ao montar uma página; o que faltar vira placeholder
+LIST_TIME_BUDGET = float(os.environ.get("POKEMON_LIST_TIME_BUDGET", "3"))
+# Quantos Pokémon ausentes uma requisição (ou uma rodada do backfill) busca de uma vez,
+# para um filtro por atributos num processo frio não ocupar o EXECUTOR inteiro
+HYDRATE_BATCH = max(1, int(os.environ.get("POKEMON_HYDRATE_BATCH", str(MAX_WORKERS * 2))))
+# Prefetch opcional da próxima página (e da próxima geração ao fim de uma)
+PREFETCH_ENABLED = os.environ.get("POKEMON_PREFETCH", "0") == "1"
+PREFETCH_RATE = float(os.environ.get("POKEMON_PREFETCH_RATE", "120"))  # Pokémon por minuto, por processo
+PREFETCH_MAX_PENDING = int(os.environ.get("POKEMON_PREFETCH_MAX_PENDING", "200"))
 
 SESSION = requests.Session()
 SESSION.headers.update({"User-Agent": "KoguiPokedex/1.0 (Fair Use Cache Implementation)"})
 
-# Exponential backoff for 429/5xx errors
+# Short exponential backoff for transient 5xx errors. A 429 is not retried here:
+# it goes straight to the circuit breaker and the adaptive limiter, which back
+# off for the whole process instead of hitting PokéAPI again 0.5s later.
 retry_strategy = Retry(
-    total=4,
-    backoff_factor=1.0,  # More aggressive backoff for fair use
-    status_forcelist=[429, 502, 503, 504],  # Include 429 rate limit
+    total=MAX_RETRIES,
+    backoff_factor=0.5,
+    status_forcelist=[502, 503, 504],
     allowed_methods=["GET"],
+    respect_retry_after_header=False,
+    raise_on_status=False,
 )
-adapter = HTTPAdapter(max_retries=retry_strategy)
+# Pool de conexões do tamanho do pool de threads para reaproveitar conexões keep-alive
+adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=MAX_WORKERS)
 SESSION.mount("https://", adapter)
 SESSION.mount("http://", adapter)
 
+# Pool limitado para buscar em paralelo os Pokémon ausentes do cache
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="pokeapi")
+# Preenchimento das lacunas de páginas parciais; separado porque usa o EXECUTOR por dentro
+BACKFILL_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pokeapi-backfill")
+PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pokeapi-prefetch")
+
+# Compartilhados por todas as threads do processo (views síncronas, pool e refresh)
+BREAKER = CircuitBreaker(failure_threshold=BREAKER_THRESHOLD, reset_timeout=BREAKER_RESET)
+LIMITER = AdaptiveLimiter(initial=MAX_WORKERS, maximum=MAX_WORKERS, latency_target=LATENCY_TARGET)
+PREFETCH_BUDGET = TokenBucket(rate=PREFETCH_RATE)
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,27 +106,370 @@ class PokeAPIError(RuntimeError):
     """Exceção lançada para erros na PokéAPI."""
 
 
+_snapshot_lock = threading.Lock()
+_snapshot: Dict[str, Any] | None = None
+
+
+def load_snapshot(*, reload: bool = False) -> Dict[str, Any]:
+    """Load the offline snapshot once per process (empty if none was generated).
+
+    Catalog, generation and type payloads are served from it whenever the
+    cache misses, and its normalized records seed the in-process
+    :class:`PokedexTable`, so a fresh container answers lists and filters
+    without calling PokéAPI. Reloading also resets the table.
+    """
+    global _snapshot
+    with _snapshot_lock:
+        if _snapshot is None or reload:
+            data = read_snapshot() or {}
+            created_at = data.get("created_at")
+            endpoints = data.get("endpoints", {})
+            _snapshot = {
+                "version": data.get("version"),
+                "modified": int(datetime.fromisoformat(created_at).timestamp()) if created_at else None,
+                "endpoints": endpoints,
+                "digests": {endpoint: _payload_digest(payload) for endpoint, payload in endpoints.items()},
+                "pokemon": PokedexTable(data.get("pokemon", [])),
+            }
+            _reset_content(_snapshot["modified"])
+            logger.info(
+                "pokeapi.snapshot.loaded",
+                extra={
+                    "event": "pokeapi.snapshot.loaded",
+                    "extra_data": {"version": _snapshot["version"], "pokemon": len(_snapshot["pokemon"])},
+                },
+            )
+        return _snapshot
+
+
+def _cache_key(endpoint: str) -> str:
+    return f"pokeapi:{endpoint}"
+
+
+def _pokemon_key(identifier: str | int) -> str:
+    """Cache key of a normalized Pokémon, by id or by name."""
+    return f"pokeapi:pokemon:{str(identifier).strip().lower()}"
+
+
+def _keep(data: Dict[str, Any], *fields: str) -> Dict[str, Any]:
+    return {field: data[field] for field in fields if field in data}
+
+
+def _prune_pokemon_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    sprites = data.get("sprites") or {}
+    artwork = (sprites.get("other") or {}).get("official-artwork") or {}
+    pruned = _keep(data, "id", "name", "types", "stats", "height", "weight", "species")
+    pruned["abilities"] = [_keep(entry, "ability", "is_hidden", "slot") for entry in data.get("abilities", [])]
+    pruned["sprites"] = {
+        "front_default": sprites.get("front_default"),
+        "other": {"official-artwork": {"front_default": artwork.get("front_default")}},
+    }
+    return pruned
+
+
+def _in_language(entries: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [entry for entry in entries if (entry.get("language") or {}).get("name") == DETAIL_LANGUAGE]
+
+
+def _prune_species_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    pruned = _keep(
+        data, "id", "name", "generation", "habitat", "is_legendary", "is_mythical", "evolution_chain"
+    )
+    pruned["genera"] = _in_language(data.get("genera", []))
+    pruned["flavor_text_entries"] = _in_language(data.get("flavor_text_entries", []))[:1]
+    return pruned
+
+
+# Payloads brutos são podados antes de ir para o cache: moves, game_indices,
+# damage_relations e afins ocupam >100 KB e nunca são lidos.
+_POKEMON_ENDPOINT = re.compile(r"^pokemon/[^/?]+/$")
+_GENERATION_ENDPOINT = re.compile(r"^generation/[^/?]+/$")
+_TYPE_ENDPOINT = re.compile(r"^type/[^/?]+/$")
+_SPECIES_ENDPOINT = re.compile(r"^pokemon-species/[^/?]+/$")
+_EVOLUTION_ENDPOINT = re.compile(r"^evolution-chain/[^/?]+/$")
+_PAYLOAD_PRUNERS: Tuple[Tuple[re.Pattern[str], Callable[[Dict[str, Any]], Dict[str, Any]]], ...] = (
+    (_POKEMON_ENDPOINT, _prune_pokemon_payload),
+    (_SPECIES_ENDPOINT, _prune_species_payload),
+    (_EVOLUTION_ENDPOINT, lambda data: _keep(data, "id", "chain")),
+    (_GENERATION_ENDPOINT, lambda data: _keep(data, "id", "name", "pokemon_species")),
+    (_TYPE_ENDPOINT, lambda data: _keep(data, "id", "name", "pokemon")),
+)
+
+
+def _prune_payload(endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    for pattern, prune in _PAYLOAD_PRUNERS:
+        if pattern.match(endpoint):
+            return prune(data)
+    return data
+
+
+def _endpoint_class(endpoint: str) -> str:
+    # Espécie e cadeia evolutiva são dados por Pokémon, como o próprio pokemon/
+    if any(pattern.match(endpoint) for pattern in (_POKEMON_ENDPOINT, _SPECIES_ENDPOINT, _EVOLUTION_ENDPOINT)):
+        return "pokemon"
+    if _TYPE_ENDPOINT.match(endpoint):
+        return "type"
+    return "catalog"
+
+
+def _cache_payload(endpoint: str, data: Dict[str, Any]) -> None:
+    """Store ``data`` wrapped with its soft expiry; the cache entry lives until the hard TTL.
+
+    Catalog, generation and type entries also carry the digest of their
+    content, which feeds the catalog version (see :func:`catalog_version`).
+    """
+    endpoint_class = _endpoint_class(endpoint)
+    soft_ttl, hard_ttl = ENDPOINT_TTLS[endpoint_class]
+    entry = {"payload": data, "fresh_until": time.time() + soft_ttl}
+    if endpoint_class != "pokemon":
+        entry["digest"] = _payload_digest(data)
+        _record_content(endpoint, entry["digest"])
+    cache.set(_cache_key(endpoint), entry, hard_ttl)
+
+
+def _payload_digest(data: Any) -> str:
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+_content_lock = threading.Lock()
+# Digest do payload de catálogo/geração/tipo que este processo serve, por endpoint
+_content_digests: Dict[str, str] = {}
+_content_version: Dict[str, Any] = {"token": _payload_digest([]), "modified": None}
+
+
+def _reset_content(modified: int | None) -> None:
+    with _content_lock:
+        _content_digests.clear()
+        _content_version.update(token=_payload_digest([]), modified=modified)
+
+
+def _record_content(endpoint: str, digest: str) -> None:
+    """Note that this process now serves ``digest`` for a catalog, generation or type endpoint."""
+    with _content_lock:
+        if _content_digests.get(endpoint) == digest:
+            return
+        _content_digests[endpoint] = digest
+        modified = int(time.time())
+        _content_version.update(token=_payload_digest(sorted(_content_digests.items())), modified=modified)
+    logger.info(
+        "pokeapi.catalog.version",
+        extra={"event": "pokeapi.catalog.version", "extra_data": {"endpoint": endpoint, "modified": modified}},
+    )
+
+
+def _record_served(endpoint: str, entry: Any, payload: Dict[str, Any]) -> None:
+    if _endpoint_class(endpoint) == "pokemon":
+        return
+    digest = entry.get("digest") if isinstance(entry, dict) else None
+    _record_content(endpoint, digest or _payload_digest(payload))
+
+
+def catalog_version() -> Dict[str, Any]:
+    """Return the current catalog version and the epoch it last changed.
+
+    ``version`` combines the offline snapshot version with a hash of the
+    digests of the catalog, generation and type payloads this process serves,
+    whether they came from the cache, the snapshot or PokéAPI. It depends on
+    that content alone: any change to a served payload yields a new version,
+    and workers serving the same payloads report the same one, across
+    restarts. Per-Pokémon records are not part of it. It is the validator
+    behind the API's ETags.
+    """
+    snapshot = load_snapshot()
+    with _content_lock:
+        token, modified = _content_version["token"], _content_version["modified"]
+    return {"version": f"{snapshot['version']}:{token}", "modified": modified}
+
+
+async def acatalog_version() -> Dict[str, Any]:
+    """Async variant of :func:`catalog_version`."""
+    return await sync_to_async(catalog_version, thread_sensitive=False)()
+
+
+def _unwrap(entry: Any) -> Tuple[Dict[str, Any], float | None]:
+    # Entradas gravadas antes dos soft TTLs guardavam o payload puro
+    if isinstance(entry, dict) and set(entry) - {"digest"} == {"payload", "fresh_until"}:
+        return entry["payload"], entry["fresh_until"]
+    return entry, None
+
+
+def _read_cached(endpoint: str, entry: Any) -> Dict[str, Any]:
+    """Return the cached payload, scheduling a background refresh if it is stale."""
+    payload, fresh_until = _unwrap(entry)
+    _record_served(endpoint, entry, payload)
+    if fresh_until is not None and time.time() >= fresh_until:
+        logger.info("pokeapi.cache.stale", extra={"event": "pokeapi.cache.stale", "extra_data": {"endpoint": endpoint}})
+        _schedule_refresh(endpoint)
+    return payload
+
+
+_refreshing_lock = threading.Lock()
+_refreshing: set[str] = set()
+
+
+def _schedule_refresh(endpoint: str) -> None:
+    with _refreshing_lock:
+        if endpoint in _refreshing:
+            return
+        _refreshing.add(endpoint)
+    EXECUTOR.submit(_refresh, endpoint)
+
+
+def _refresh(endpoint: str) -> None:
+    """Background revalidation: on failure the stale entry simply keeps being served."""
+    try:
+        _fetch_remote(endpoint)
+    except PokeAPIError:
+        logger.warning(
+            "pokeapi.refresh.error", extra={"event": "pokeapi.refresh.error", "extra_data": {"endpoint": endpoint}}
+        )
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(endpoint)
+
 
 def _fetch_json(endpoint: str) -> Dict[str, Any]:
     """Perform a GET request to PokéAPI with Django cache and backoff."""
-    cache_key = f"pokeapi:{endpoint}"
-
-    # Try cache first
-    cached_data = cache.get(cache_key)
-    if cached_data is not None:
+    # Try cache first (stale entries are served while revalidating in background)
+    cached_entry = cache.get(_cache_key(endpoint))
+    if cached_entry is not None:
         logger.info("pokeapi.cache.hit", extra={"event": "pokeapi.cache.hit", "extra_data": {"endpoint": endpoint}})
-        return cached_data
+        return _read_cached(endpoint, cached_entry)
+    snapshot_data = load_snapshot()["endpoints"].get(endpoint)
+    if snapshot_data is not None:
+        logger.info(
+            "pokeapi.snapshot.hit", extra={"event": "pokeapi.snapshot.hit", "extra_data": {"endpoint": endpoint}}
+        )
+        _record_content(endpoint, load_snapshot()["digests"][endpoint])
+        return snapshot_data
+    return _fetch_remote(endpoint)
+
+
+_inflight_lock = threading.Lock()
+_inflight: Dict[str, Future] = {}
+
+
+def _fetch_remote(endpoint: str) -> Dict[str, Any]:
+    """Fetch an endpoint from PokéAPI (cache miss path) with single-flight.
 
-    # Cache miss - fetch from API
+    Concurrent misses for the same endpoint in this process wait on the first
+    caller's request instead of issuing their own; they receive its payload or
+    its ``PokeAPIError``.
+    """
+    with _inflight_lock:
+        future = _inflight.get(endpoint)
+        leader = future is None
+        if leader:
+            future = _inflight[endpoint] = Future()
+    if not leader:
+        logger.info(
+            "pokeapi.fetch.coalesced", extra={"event": "pokeapi.fetch.coalesced", "extra_data": {"endpoint": endpoint}}
+        )
+        return future.result()
+
+    try:
+        data = _fetch_with_lock(endpoint) if DISTRIBUTED_LOCK else _request_json(endpoint)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(data)
+        return data
+    finally:
+        with _inflight_lock:
+            _inflight.pop(endpoint, None)
+
+
+def _fetch_with_lock(endpoint: str) -> Dict[str, Any]:
+    """Cross-process single-flight: one worker fetches, the others poll the cache.
+
+    The lock is a ``cache.add`` on the shared tier, so it only coordinates
+    processes when an L2 backend is configured. If the holder does not publish
+    the payload before ``LOCK_TIMEOUT`` the waiter fetches by itself.
+    """
+    lock_key = f"pokeapi:lock:{endpoint}"
+    if cache.add(lock_key, 1, LOCK_TIMEOUT):
+        try:
+            return _request_json(endpoint)
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        # Lê o lock antes do payload: quem segura o lock grava o cache antes de soltá-lo
+        released = not cache.has_key(lock_key)
+        entry = cache.get(_cache_key(endpoint))
+        if entry is not None:
+            return _read_cached(endpoint, entry)
+        if released:
+            break
+    return _request_json(endpoint)
+
+
+def _guarded_get(url: str) -> requests.Response:
+    """GET through the adaptive limiter and the circuit breaker, recording the outcome.
+
+    Fails fast with ``PokeAPIError`` when the circuit is open or no slot
+    frees up within ``LIMITER_WAIT``. 429/5xx and network errors count as
+    failures for both; 4xx answers (e.g. unknown Pokémon) count as healthy.
+    """
+    if not LIMITER.acquire(LIMITER_WAIT):
+        logger.warning(
+            "pokeapi.limiter.saturated",
+            extra={"event": "pokeapi.limiter.saturated", "extra_data": {"url": url, "limit": LIMITER.limit}},
+        )
+        raise PokeAPIError("PokéAPI sobrecarregada: limite de requisições simultâneas atingido.")
+    started = time.monotonic()
+    healthy: bool | None = None  # None: nada foi enviado
+    try:
+        if not BREAKER.allow():
+            logger.warning(
+                "pokeapi.circuit.open", extra={"event": "pokeapi.circuit.open", "extra_data": {"url": url}}
+            )
+            raise PokeAPIError("PokéAPI indisponível: circuito aberto após falhas seguidas.")
+        healthy = False
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+        healthy = response.status_code != 429 and response.status_code < 500
+        return response
+    finally:
+        if healthy is None:
+            LIMITER.release()
+        else:
+            latency = time.monotonic() - started
+            LIMITER.release(latency=latency, overloaded=not healthy)
+            metrics = get_metrics()
+            if metrics is not None:
+                metrics.add_upstream(latency)
+            if healthy:
+                BREAKER.record_success()
+            else:
+                BREAKER.record_failure()
+
+
+def _request_json(endpoint: str) -> Dict[str, Any]:
+    """Perform the HTTP request to PokéAPI and store the pruned payload in the cache."""
     url = f"{POKEAPI_BASE_URL}/{endpoint.lstrip('/')}"
-    logger.info("pokeapi.fetch", extra={"event": "pokeapi.fetch", "extra_data": {"url": url}})
     try:
-        response = SESSION.get(url, timeout=10)
+        started = time.perf_counter()
+        response = _guarded_get(url)
+        logger.info(
+            "pokeapi.fetch",
+            extra={
+                "event": "pokeapi.fetch",
+                "extra_data": {
+                    "url": url,
+                    "status": response.status_code,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                },
+            },
+        )
         response.raise_for_status()
-        data = response.json()
+        data = _prune_payload(endpoint, response.json())
 
         # Cache the result
-        cache.set(cache_key, data, CACHE_TTL)
+        _cache_payload(endpoint, data)
 
         logger.info(
             "pokeapi.fetch.success",
@@ -118,49 +533,486 @@ def _parse_id_from_url(url: str) -> int:
     return int(url.rstrip("/").split("/")[-1])
 
 
+def _cache_entries(records: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Normalized cache entries for ``records``, keyed by both id and name."""
+    entries: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        entries[_pokemon_key(record["id"])] = record
+        entries[_pokemon_key(record["name"])] = record
+    return entries
+
+
+def get_table() -> PokedexTable:
+    """The in-process Pokédex table (snapshot records plus every record resolved since)."""
+    return load_snapshot()["pokemon"]
+
+
 def get_pokemon(identifier: str | int) -> Dict[str, Any]:
-    """Get detailed Pokemon data with caching."""
-    data = _fetch_json(f"pokemon/{identifier}/")
-    return _normalize_pokemon(data)
+    """Get a normalized Pokemon from the table, cache or local Pokédex, filling them from PokéAPI."""
+    value = str(identifier).strip().lower()
+    table = get_table()
+    record = table.record(int(value)) if value.isdigit() else None
+    if record is not None:
+        return record
+    record = cache.get(_pokemon_key(identifier))
+    if record is None:
+        record = pokedex_store.get_record(identifier)
+        if record is None:
+            record = _normalize_pokemon(_fetch_json(f"pokemon/{identifier}/"))
+            pokedex_store.save_records([record])
+        cache.set_many(_cache_entries([record]), ENDPOINT_TTLS["pokemon"][1])
+    table.extend([record])
+    return record
+
+
+# Campos extras do detalhe -> recursos da PokéAPI necessários para montá-los
+DETAIL_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "stats": ("pokemon",),
+    "abilities": ("pokemon",),
+    "measurements": ("pokemon",),
+    "species": ("pokemon", "species"),
+    "evolution": ("pokemon", "species", "evolution"),
+}
+_EXTRA_STATS = ("special-attack", "special-defense", "speed")
+
+
+def normalize_detail_fields(fields: str | Sequence[str] | None) -> List[str]:
+    """Canonical list of extra detail fields; unknown fields raise ``PokeAPIError``."""
+    names = fields.split(",") if isinstance(fields, str) else list(fields or [])
+    requested = {name.strip().lower() for name in names if name.strip()}
+    unknown = requested - DETAIL_FIELDS.keys()
+    if unknown:
+        raise PokeAPIError(f"Campos inválidos: {', '.join(sorted(unknown))}.")
+    return [field for field in DETAIL_FIELDS if field in requested]
+
+
+def _pokemon_payload(pokemon_id: int) -> Dict[str, Any]:
+    payload = _fetch_json(f"pokemon/{pokemon_id}/")
+    if "height" not in payload:
+        # Entrada podada antes do detalhe existir: não guarda habilidades, medidas e espécie
+        payload = _fetch_remote(f"pokemon/{pokemon_id}/")
+    return payload
+
+
+def _species_summary(species: Dict[str, Any]) -> Dict[str, Any]:
+    genera = species.get("genera") or [{}]
+    flavor = species.get("flavor_text_entries") or [{}]
+    return {
+        "genus": genera[0].get("genus"),
+        "description": " ".join((flavor[0].get("flavor_text") or "").split()) or None,
+        "generation": (species.get("generation") or {}).get("name"),
+        "habitat": (species.get("habitat") or {}).get("name"),
+        "is_legendary": bool(species.get("is_legendary")),
+        "is_mythical": bool(species.get("is_mythical")),
+    }
+
+
+def _evolution_stages(chain: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Flatten an evolution chain tree into stages, parents before their evolutions."""
+    stages: List[Dict[str, Any]] = []
+    pending: List[Tuple[Dict[str, Any], int, str | None]] = [(chain, 1, None)]
+    while pending:
+        link, stage, evolves_from = pending.pop(0)
+        species = link.get("species") or {}
+        if species.get("url"):
+            stages.append(
+                {
+                    "id": _parse_id_from_url(species["url"]),
+                    "name": species.get("name"),
+                    "stage": stage,
+                    "evolves_from": evolves_from,
+                }
+            )
+        pending += [(child, stage + 1, species.get("name")) for child in link.get("evolves_to", [])]
+    return stages
+
+
+def get_pokemon_detail(pokemon_id: int, fields: Sequence[str] = ()) -> Dict[str, Any]:
+    """Normalized record of ``pokemon_id`` extended with the requested ``fields``.
+
+    Only the upstream resources those fields need are read (``pokemon/``,
+    ``pokemon-species/``, ``evolution-chain/``), each through its own cache
+    entry, so a detail without extra fields costs the same as a list row.
+    """
+    requested = normalize_detail_fields(fields)
+    resources = {resource for field in requested for resource in DETAIL_FIELDS[field]}
+    record = get_pokemon(pokemon_id)
+    detail = {**record, "stats": dict(record["stats"])}
+    if not resources:
+        return detail
+
+    pokemon = _pokemon_payload(pokemon_id)
+    species: Dict[str, Any] = {}
+    if "species" in resources and (pokemon.get("species") or {}).get("url"):
+        species = _fetch_json(f"pokemon-species/{_parse_id_from_url(pokemon['species']['url'])}/")
+
+    if "stats" in requested:
+        for stat in _EXTRA_STATS:
+            detail["stats"][stat.replace("-", "_")] = _normalize_stat_value(_extract_stat(pokemon, stat))
+    if "abilities" in requested:
+        abilities = sorted(pokemon.get("abilities", []), key=lambda entry: entry.get("slot", 0))
+        detail["abilities"] = [
+            {"name": (entry.get("ability") or {}).get("name"), "is_hidden": bool(entry.get("is_hidden"))}
+            for entry in abilities
+        ]
+    if "measurements" in requested:
+        # PokéAPI usa decímetros e hectogramas
+        detail["measurements"] = {
+            "height_m": (pokemon.get("height") or 0) / 10,
+            "weight_kg": (pokemon.get("weight") or 0) / 10,
+        }
+    if "species" in requested:
+        detail["species"] = _species_summary(species)
+    if "evolution" in requested:
+        chain_url = (species.get("evolution_chain") or {}).get("url")
+        chain = _fetch_json(f"evolution-chain/{_parse_id_from_url(chain_url)}/") if chain_url else {}
+        detail["evolution"] = _evolution_stages(chain.get("chain") or {})
+    return detail
+
+
+def get_sprite_file(pokemon_id: int, size: str = sprite_cache.FULL) -> Path:
+    """Local file with the artwork of ``pokemon_id`` at ``size`` (``full`` or a thumbnail side).
+
+    The original is downloaded from the record's ``sprite`` URL once and
+    kept on disk; thumbnails are derived from it (or alias it when Pillow is
+    not installed). The artwork host is not PokéAPI, so this bypasses the
+    PokéAPI circuit breaker and limiter.
+    """
+    path = sprite_cache.cached_path(pokemon_id, size)
+    if path is not None:
+        return path
+    original = sprite_cache.cached_path(pokemon_id, sprite_cache.FULL)
+    if original is None:
+        url = get_pokemon(pokemon_id).get("sprite")
+        if not url:
+            raise PokeAPIError(f"Pokémon {pokemon_id} sem arte.")
+        logger.info("pokeapi.sprite.fetch", extra={"event": "pokeapi.sprite.fetch", "extra_data": {"url": url}})
+        started = time.monotonic()
+        try:
+            response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            raise PokeAPIError(f"Erro ao baixar arte: {exc}") from exc
+        finally:
+            metrics = get_metrics()
+            if metrics is not None:
+                metrics.add_upstream(time.monotonic() - started)
+        original = sprite_cache.store(pokemon_id, sprite_cache.FULL, response.content)
+    if size == sprite_cache.FULL:
+        return original
+    data = original.read_bytes()
+    return sprite_cache.store(pokemon_id, size, sprite_cache.resize(data, int(size)) or data)
+
+
+def _fetch_many_json(
+    endpoints: Sequence[str], *, refresh: bool = False, timeout: float | None = None
+) -> Dict[str, Dict[str, Any] | PokeAPIError]:
+    """Fetch several endpoints: one bulk cache read, then misses in parallel.
+
+    Failures are returned as ``PokeAPIError`` values instead of raised, so a
+    caller can decide whether a single failure invalidates the whole batch.
+    ``refresh`` skips the cache read and fetches every endpoint upstream.
+    Misses still running after ``timeout`` seconds are reported as failures;
+    they keep running and fill the cache when they finish.
+    """
+    keys = {endpoint: _cache_key(endpoint) for endpoint in endpoints}
+    cached = {} if refresh else cache.get_many(list(keys.values()))
+    results: Dict[str, Dict[str, Any] | PokeAPIError] = {
+        endpoint: _read_cached(endpoint, cached[key]) for endpoint, key in keys.items() if key in cached
+    }
+    misses = [endpoint for endpoint in endpoints if endpoint not in results]
+    logger.info(
+        "pokeapi.cache.bulk",
+        extra={"event": "pokeapi.cache.bulk", "extra_data": {"hits": len(results), "misses": len(misses)}},
+    )
+    # Cada tarefa roda no contexto da requisição: request id nos logs e contabilidade do upstream
+    futures = {
+        endpoint: EXECUTOR.submit(contextvars.copy_context().run, _fetch_remote, endpoint) for endpoint in misses
+    }
+    wait(futures.values(), timeout=timeout)
+    for endpoint, future in futures.items():
+        if not future.done():
+            results[endpoint] = PokeAPIError(f"Tempo esgotado aguardando a PokéAPI: {endpoint}")
+            continue
+        try:
+            results[endpoint] = future.result()
+        except PokeAPIError as exc:
+            results[endpoint] = exc
+    return results
+
+
+def _merge_fetched(
+    missing: Sequence[int],
+    payloads: Dict[str, Dict[str, Any] | PokeAPIError],
+    records: Dict[int, Dict[str, Any]],
+    *,
+    skip_errors: bool,
+) -> List[Dict[str, Any]]:
+    """Normalize fetched payloads into ``records`` and return the new records."""
+    fetched: List[Dict[str, Any]] = []
+    for pokemon_id in missing:
+        payload = payloads[f"pokemon/{pokemon_id}/"]
+        if isinstance(payload, PokeAPIError):
+            if not skip_errors:
+                raise payload
+            logger.warning(
+                "pokeapi.hydrate.skip",
+                extra={"event": "pokeapi.hydrate.skip", "extra_data": {"id": pokemon_id}},
+            )
+            continue
+        record = _normalize_pokemon(payload)
+        records[pokemon_id] = record
+        fetched.append(record)
+    return fetched
+
+
+def _missing_ids(ids: Sequence[int], records: Dict[int, Dict[str, Any]]) -> List[int]:
+    return list(dict.fromkeys(pokemon_id for pokemon_id in ids if pokemon_id not in records))
+
+
+def get_pokemon_many(
+    ids: Sequence[int], *, skip_errors: bool = False, timeout: float | None = None
+) -> List[Dict[str, Any]]:
+    """Return normalized Pokemon for ``ids`` in input order.
+
+    Lookups go in-process table (snapshot included) → normalized cache (one
+    ``get_many``) → local Pokédex (one query) → PokéAPI, where the remaining
+    misses are fetched concurrently on a bounded thread pool. New records
+    are persisted, cached by id and name and added to the table. With
+    ``skip_errors`` failed fetches are logged and left out instead of
+    raising ``PokeAPIError``; ``timeout`` bounds the wait for PokéAPI (misses
+    still pending count as failures).
+    """
+    table = get_table()
+    records = table.records(ids)
+    missing = _missing_ids(ids, records)
+    if missing:
+        cached = cache.get_many([_pokemon_key(pokemon_id) for pokemon_id in missing])
+        resolved = list(cached.values())
+        records.update((record["id"], record) for record in resolved)
+        missing = _missing_ids(ids, records)
+        if missing:
+            stored = pokedex_store.get_records(missing)
+            records.update(stored)
+            fetched: List[Dict[str, Any]] = []
+            missing = _missing_ids(ids, records)
+            if missing:
+                payloads = _fetch_many_json([f"pokemon/{pokemon_id}/" for pokemon_id in missing], timeout=timeout)
+                fetched = _merge_fetched(missing, payloads, records, skip_errors=skip_errors)
+                if fetched:
+                    pokedex_store.save_records(fetched)
+            cache.set_many(_cache_entries([*stored.values(), *fetched]), ENDPOINT_TTLS["pokemon"][1])
+            resolved += [*stored.values(), *fetched]
+        table.extend(resolved)
+    return [records[pokemon_id] for pokemon_id in ids if pokemon_id in records]
+
+
+_catalog_lock = threading.Lock()
+_catalogs: Dict[str, Tuple[str, float, Any]] = {}
 
 
-def get_generation_catalog(generation_id: int) -> List[Dict[str, Any]]:
+def _memoized(endpoint: str, parse: Callable[[Dict[str, Any]], Any]) -> Any:
+    """Parse ``endpoint`` once per catalog version and share the result in-process.
+
+    The memo is re-read from the cache after the endpoint's soft TTL so the
+    stale-while-revalidate refresh still gets scheduled; a refresh that
+    changes the payload bumps the catalog version and invalidates the memo.
+    """
+    version = catalog_version()["version"]
+    with _catalog_lock:
+        entry = _catalogs.get(endpoint)
+    if entry is not None and entry[0] == version and time.time() < entry[1]:
+        return entry[2]
+    parsed = parse(_fetch_json(endpoint))
+    soft_ttl, _hard_ttl = ENDPOINT_TTLS[_endpoint_class(endpoint)]
+    with _catalog_lock:
+        _catalogs[endpoint] = (catalog_version()["version"], time.time() + soft_ttl, parsed)
+    return parsed
+
+
+def _parse_catalog(entries: Iterable[Dict[str, Any]]) -> Catalog:
+    return Catalog((_parse_id_from_url(entry.get("url", "")), entry.get("name")) for entry in entries)
+
+
+def get_generation_catalog(generation_id: int) -> Catalog:
     """Get Pokemon catalog for a specific generation with caching."""
-    payload = _fetch_json(f"generation/{generation_id}/")
-    catalog = []
-    for entry in payload.get("pokemon_species", []):
-        catalog.append({
-            "id": _parse_id_from_url(entry.get("url", "")),
-            "name": entry.get("name"),
-        })
-    catalog = [item for item in catalog if item["id"] and item["name"]]
-    catalog.sort(key=lambda item: item["id"])
-    return catalog
-
-
-def get_global_catalog() -> List[Dict[str, Any]]:
+    return _memoized(
+        f"generation/{generation_id}/", lambda payload: _parse_catalog(payload.get("pokemon_species", []))
+    )
+
+
+def get_global_catalog() -> Catalog:
     """Get global Pokemon catalog with caching."""
-    payload = _fetch_json("pokemon?limit=2000&offset=0")
-    catalog = []
-    for entry in payload.get("results", []):
-        catalog.append({
-            "id": _parse_id_from_url(entry.get("url", "")),
-            "name": entry.get("name"),
-        })
-    catalog = [item for item in catalog if item["id"] and item["name"]]
-    catalog.sort(key=lambda item: item["id"])
-    return catalog
+    return _memoized(GLOBAL_CATALOG_ENDPOINT, lambda payload: _parse_catalog(payload.get("results", [])))
 
 
-def list_pokemon(
+def get_generation_ids() -> frozenset[int]:
+    """Get the ids of every generation known to PokéAPI with caching."""
+    return _memoized(
+        GENERATIONS_ENDPOINT,
+        lambda payload: frozenset(_parse_id_from_url(entry.get("url", "")) for entry in payload.get("results", [])),
+    )
+
+
+def get_type_names() -> frozenset[str]:
+    """Get the names of every Pokémon type known to PokéAPI with caching."""
+    return _memoized(
+        TYPES_ENDPOINT,
+        lambda payload: frozenset(entry["name"] for entry in payload.get("results", []) if entry.get("name")),
+    )
+
+
+def get_type_index(type_name: str) -> frozenset[int]:
+    """Get the ids of every Pokémon with ``type_name`` (inverted type index)."""
+    return _memoized(
+        f"type/{type_name}/",
+        lambda payload: frozenset(
+            _parse_id_from_url(entry["pokemon"]["url"])
+            for entry in payload.get("pokemon", [])
+            if entry.get("pokemon", {}).get("url")
+        ),
+    )
+
+
+def _fetch_all(endpoints: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+    payloads = _fetch_many_json(endpoints, refresh=True)
+    failed = [endpoint for endpoint, payload in payloads.items() if isinstance(payload, PokeAPIError)]
+    if failed:
+        raise PokeAPIError(f"Falha ao consultar a PokéAPI: {', '.join(failed)}")
+    return dict(payloads)
+
+
+def crawl_catalogs() -> Tuple[List[int], Dict[str, Dict[str, Any]]]:
+    """Fetch the global catalog and every generation and type payload, bypassing the cache.
+
+    Returns the catalog's Pokémon ids (sorted) and the pruned payloads by
+    endpoint, as stored in the offline snapshot. Raises ``PokeAPIError``
+    naming the endpoints that failed.
+    """
+    endpoints = _fetch_all([GLOBAL_CATALOG_ENDPOINT, GENERATIONS_ENDPOINT, TYPES_ENDPOINT])
+    detail_endpoints = [
+        f"generation/{_parse_id_from_url(entry['url'])}/"
+        for entry in endpoints[GENERATIONS_ENDPOINT].get("results", [])
+        if entry.get("url")
+    ] + [
+        f"type/{entry['name']}/"
+        for entry in endpoints[TYPES_ENDPOINT].get("results", [])
+        if entry.get("name")
+    ]
+    endpoints.update(_fetch_all(detail_endpoints))
+    catalog = _parse_catalog(endpoints[GLOBAL_CATALOG_ENDPOINT].get("results", []))
+    return list(catalog.ids), endpoints
+
+
+def fetch_pokemon_records(ids: Sequence[int], *, refresh: bool = False) -> List[Dict[str, Any]]:
+    """Normalized records for ``ids`` fetched in parallel; failures are logged and left out.
+
+    Unlike :func:`get_pokemon_many` only the endpoint cache is consulted (and
+    ``refresh`` skips it), never the table or the local Pokédex, so the
+    records reflect PokéAPI.
+    """
+    payloads = _fetch_many_json([f"pokemon/{pokemon_id}/" for pokemon_id in ids], refresh=refresh)
+    return _merge_fetched(ids, payloads, {}, skip_errors=True)
+
+
+_name_index_lock = threading.Lock()
+_name_indexes: Dict[str, Tuple[str, NameIndex]] = {}
+
+
+def get_name_index(generation: int | None = None) -> NameIndex:
+    """Name index of the global (or a generation) catalog, built once per catalog version."""
+    source = f"generation/{generation}" if generation else "global"
+    version = catalog_version()["version"]
+    with _name_index_lock:
+        entry = _name_indexes.get(source)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    catalog = get_generation_catalog(generation) if generation else get_global_catalog()
+    index = NameIndex(catalog)
+    with _name_index_lock:
+        _name_indexes[source] = (version, index)
+    logger.info(
+        "pokeapi.name_index.built",
+        extra={"event": "pokeapi.name_index.built", "extra_data": {"source": source, "size": len(index)}},
+    )
+    return index
+
+
+def _normalize_stat_ranges(stats: Mapping[str, Sequence[Any]] | None) -> Dict[str, List[int | None]]:
+    ranges: Dict[str, List[int | None]] = {}
+    for stat, bounds in sorted((stats or {}).items()):
+        if stat not in STAT_COLUMNS:
+            raise PokeAPIError(f"Atributo inválido: {stat}.")
+        try:
+            low, high = (None if value in (None, "") else int(value) for value in bounds)
+        except (TypeError, ValueError) as exc:
+            raise PokeAPIError(f"Intervalo inválido para {stat}.") from exc
+        if low is not None or high is not None:
+            ranges[stat] = [low, high]
+    return ranges
+
+
+def _normalize_ordering(ordering: str | Sequence[str] | None) -> List[str]:
+    fields = ordering.split(",") if isinstance(ordering, str) else list(ordering or [])
+    normalized: List[str] = []
+    for field in (field.strip().lower() for field in fields):
+        if not field:
+            continue
+        if field.lstrip("-") not in STAT_COLUMNS:
+            raise PokeAPIError(f"Ordenação inválida: {field}.")
+        if all(existing.lstrip("-") != field.lstrip("-") for existing in normalized):
+            normalized.append(field)
+    return normalized
+
+
+_CURSOR_FIELDS = ("generation", "name", "type", "stats", "ordering")
+
+
+def _filters_fingerprint(filters: Mapping[str, Any]) -> str:
+    """Hash of the filters a cursor is bound to (page size may change between pages)."""
+    encoded = json.dumps({field: filters[field] for field in _CURSOR_FIELDS}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def _encode_cursor(filters: Mapping[str, Any], offset: int, after: int | None) -> str:
+    data = {"f": _filters_fingerprint(filters), "o": offset, "a": after}
+    return base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, filters: Mapping[str, Any]) -> Tuple[int, int | None]:
+    """Return the ``(offset, after)`` a cursor points to; it must match ``filters``."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        offset, after = max(0, int(data["o"])), data["a"]
+        valid = data["f"] == _filters_fingerprint(filters) and (after is None or isinstance(after, int))
+    except (ValueError, TypeError, KeyError) as exc:
+        raise PokeAPIError("Cursor inválido.") from exc
+    if not valid:
+        raise PokeAPIError("Cursor inválido.")
+    return offset, after
+
+
+def normalize_list_filters(
     *,
-    generation: int | None = None,
+    generation: int | str | None = None,
     name: str | None = None,
     type: str | None = None,
-    limit: int = 20,
-    offset: int = 0,
+    stats: Mapping[str, Sequence[Any]] | None = None,
+    ordering: str | Sequence[str] | None = None,
+    limit: int | str = 20,
+    offset: int | str = 0,
+    cursor: str | None = None,
+    after: int | None = None,
 ) -> Dict[str, Any]:
-    """Return a normalized Pokédex payload filtered by generation or name."""
+    """Clamp and canonicalize list filters; equal results share equal filters.
+
+    ``stats`` maps a stat column to inclusive ``(min, max)`` bounds (either
+    may be empty) and ``ordering`` is a comma-separated list of stat columns,
+    ``-`` prefixed for descending. A ``cursor`` from a previous page replaces
+    ``offset``: it is decoded into the page start and the id just before it
+    (``after``). Unknown stats and cursors of other filters raise
+    ``PokeAPIError``.
+    """
     try:
         limit_value = max(1, min(int(limit), 50))
     except (TypeError, ValueError):
@@ -170,76 +1022,400 @@ def list_pokemon(
     except (TypeError, ValueError):
         offset_value = 0
 
-    name_filter = (name or "").strip().lower()
-    type_filter = (type or "").strip().lower()
-
-    if not generation and not name_filter and not type_filter:
-        payload = _fetch_json(f"pokemon?limit={limit_value}&offset={offset_value}")
-        results = [
-            get_pokemon(entry.get("name"))
-            for entry in payload.get("results", [])
-            if entry.get("name")
-        ]
-        return {
-            "count": payload.get("count", len(results)),
-            "results": results,
-        }
-
-    catalog: List[Dict[str, Any]]
+    generation_id = None
     if generation:
         try:
             generation_id = int(generation)
         except (TypeError, ValueError) as exc:  # pragma: no cover - validação simples
             raise PokeAPIError("Geração inválida.") from exc
-        catalog = get_generation_catalog(generation_id)
-    else:
-        catalog = get_global_catalog()
 
+    filters = {
+        "generation": generation_id,
+        "name": (name or "").strip().lower(),
+        "type": (type or "").strip().lower(),
+        "stats": _normalize_stat_ranges(stats),
+        "ordering": _normalize_ordering(ordering),
+        "limit": limit_value,
+        "offset": offset_value,
+        "after": after if isinstance(after, int) else None,
+    }
+    if cursor:
+        filters["offset"], filters["after"] = _decode_cursor(cursor, filters)
+    return filters
+
+
+def _resume_position(ids: Sequence[int], offset: int, after: int | None) -> int:
+    """Start of a cursor page: ``offset`` while the id before it is still ``after``.
+
+    If the candidates changed since the cursor was issued the page resumes
+    right after ``after`` wherever it is now (or at ``offset`` if it is gone).
+    """
+    if after is None or (0 < offset <= len(ids) and ids[offset - 1] == after):
+        return offset
+    try:
+        return ids.index(after) + 1
+    except ValueError:
+        return offset
+
+
+def _plan_page(
+    *,
+    generation: int | None,
+    name: str | None,
+    type: str | None,
+    stats: Mapping[str, Sequence[Any]] | None,
+    ordering: str | Sequence[str] | None,
+    limit: int,
+    offset: int,
+    after: int | None = None,
+) -> Tuple[int, List[int], Dict[str, str | None], List[int], bool]:
+    """Resolve filters into ``(count, page_ids, cursors, upcoming_ids, complete)`` without hydrating.
+
+    ``cursors`` holds the ``next`` and ``previous`` page cursors (``None`` at
+    either end of the list) and ``upcoming_ids`` the ids of the next page.
+    ``complete`` is ``False`` when stat filters or ordering had to leave out
+    candidates that could not be hydrated within ``LIST_TIME_BUDGET``; count
+    and order are then provisional.
+    """
+    filters = normalize_list_filters(
+        generation=generation,
+        name=name,
+        type=type,
+        stats=stats,
+        ordering=ordering,
+        limit=limit,
+        offset=offset,
+        after=after,
+    )
+    generation_id = filters["generation"]
+    name_filter = filters["name"]
+    type_filter = filters["type"]
+    stat_ranges = filters["stats"]
+    ordering_fields = filters["ordering"]
+    limit_value = filters["limit"]
+    offset_value = filters["offset"]
+
+    ids: Sequence[int]
     if name_filter:
-        catalog = [item for item in catalog if name_filter in item["name"].lower()]
-
-    # Filtro por tipo - paginação eficiente
-    if type_filter:
-        filtered_results = []
-        current_offset = 0
-        batch_size = 50  # Processar em lotes pequenos
-
-        # Continuar buscando até ter resultados suficientes ou esgotar o catálogo
-        while len(filtered_results) < offset_value + limit_value and current_offset < len(catalog):
-            # Processar apenas um lote por vez
-            batch = catalog[current_offset:current_offset + batch_size]
-
-            for item in batch:
-                try:
-                    pokemon_data = get_pokemon(item["name"])
-                    if any(type_filter == pokemon_type.lower() for pokemon_type in pokemon_data.get("types", [])):
-                        filtered_results.append(pokemon_data)
-
-                    # Se já temos resultados suficientes, parar
-                    if len(filtered_results) >= offset_value + limit_value:
-                        break
-                except Exception:
-                    logger.warning(
-                        "pokeapi.type_filter.skip",
-                        extra={
-                            "event": "pokeapi.type_filter.skip",
-                            "extra_data": {"name": item.get("name")},
-                        },
-                        exc_info=True,
-                    )
-                    continue
-
-            current_offset += batch_size
-
-        # Aplicar paginação nos resultados filtrados
-        total = len(filtered_results)  # Estimativa baseada nos resultados encontrados
-        results = filtered_results[offset_value:offset_value + limit_value]
+        ids = get_name_index(generation_id).filter_ids(name_filter)
+    elif generation_id:
+        ids = get_generation_catalog(generation_id).ids
     else:
-        total = len(catalog)
-        sliced = catalog[offset_value: offset_value + limit_value]
-        results = [get_pokemon(item["name"]) for item in sliced]
+        # Sem filtros a página também sai do catálogo global: um único payload
+        # em cache (e no snapshot) atende qualquer limit/offset.
+        ids = get_global_catalog().ids
+
+    table = get_table()
+    complete = True
+    if stat_ranges or ordering_fields:
+        # Atributos só existem na tabela: candidatos ausentes são hidratados uma
+        # vez por processo (o snapshot já cobre tudo), no máximo HYDRATE_BATCH por
+        # requisição. Os que ficarem de fora (ou não chegarem dentro do orçamento)
+        # seguem em background e a página sai parcial
+        if not table.covers(ids):
+            absent = [pokemon_id for pokemon_id in ids if pokemon_id not in table]
+            get_pokemon_many(absent[:HYDRATE_BATCH], skip_errors=True, timeout=LIST_TIME_BUDGET)
+            unresolved = [pokemon_id for pokemon_id in absent if pokemon_id not in table]
+            if unresolved:
+                complete = False
+                _schedule_backfill(unresolved)
+        ids = table.select(
+            [pokemon_id for pokemon_id in ids if pokemon_id in table],
+            type_name=type_filter or None,
+            stat_ranges={stat: tuple(bounds) for stat, bounds in stat_ranges.items()},
+            ordering=ordering_fields,
+        )
+    elif type_filter:
+        if table.covers(ids):
+            # Todos os candidatos já estão na tabela: filtra pelas máscaras de tipo
+            ids = table.select(ids, type_name=type_filter)
+        else:
+            # Senão, interseção em memória com o índice invertido tipo -> ids
+            type_ids = get_type_index(type_filter) if type_filter in get_type_names() else frozenset()
+            ids = [pokemon_id for pokemon_id in ids if pokemon_id in type_ids]
+
+    start = _resume_position(ids, offset_value, filters["after"])
+    end = start + limit_value
+    previous_start = max(0, start - limit_value)
+    cursors = {
+        "next": _encode_cursor(filters, end, ids[end - 1]) if end < len(ids) else None,
+        "previous": (
+            _encode_cursor(filters, previous_start, ids[previous_start - 1] if previous_start else None)
+            if 0 < start <= len(ids)
+            else None
+        ),
+    }
+    return len(ids), list(ids[start:end]), cursors, list(ids[end:end + limit_value]), complete
+
+
+_backfill_lock = threading.Lock()
+_backfilling: set[int] = set()
+
+
+def _schedule_backfill(ids: Sequence[int]) -> None:
+    """Hydrate the gaps of a partial page in background (ids already queued are skipped)."""
+    with _backfill_lock:
+        pending = [pokemon_id for pokemon_id in ids if pokemon_id not in _backfilling]
+        _backfilling.update(pending)
+    if pending:
+        BACKFILL_EXECUTOR.submit(_backfill, pending)
+
+
+def _backfill(ids: List[int]) -> None:
+    try:
+        # Em lotes, para as buscas das requisições não ficarem atrás de todo o backfill no EXECUTOR
+        for start in range(0, len(ids), HYDRATE_BATCH):
+            get_pokemon_many(ids[start:start + HYDRATE_BATCH], skip_errors=True)
+    except Exception:  # pragma: no cover - só registra; a próxima página parcial tenta de novo
+        logger.warning(
+            "pokeapi.backfill.error",
+            extra={"event": "pokeapi.backfill.error", "extra_data": {"ids": ids}},
+            exc_info=True,
+        )
+    finally:
+        close_old_connections()
+        with _backfill_lock:
+            _backfilling.difference_update(ids)
+
+
+_prefetch_lock = threading.Lock()
+_prefetching: set[int] = set()
+
+
+def _schedule_prefetch(
+    upcoming: Sequence[int], *, generation: int | None = None, limit: int = 20
+) -> None:
+    """Warm the next page in background when ``POKEMON_PREFETCH=1``.
+
+    With ``generation`` (last page of a generation listing) the following
+    generation's catalog and first page are warmed instead. Ids already
+    queued are skipped and nothing is queued past ``PREFETCH_MAX_PENDING``.
+    """
+    if not PREFETCH_ENABLED or not (upcoming or generation):
+        return
+    with _prefetch_lock:
+        pending = [pokemon_id for pokemon_id in upcoming if pokemon_id not in _prefetching]
+        if (upcoming and not pending) or len(_prefetching) + len(pending) > PREFETCH_MAX_PENDING:
+            return
+        _prefetching.update(pending)
+    PREFETCH_EXECUTOR.submit(_prefetch, pending, generation, limit)
 
+
+def _prefetch(ids: List[int], generation: int | None, limit: int) -> None:
+    """Hydrate ``ids`` within the prefetch budget; skipped while the circuit is not closed."""
+    try:
+        if BREAKER.state != CLOSED:
+            return
+        targets = ids
+        if generation and generation not in get_generation_ids():
+            # Última geração: não há próxima (generation/N+1/ seria um 404 sem cache)
+            generation = None
+        if generation and PREFETCH_BUDGET.take(1):
+            targets = list(get_generation_catalog(generation).ids[:limit])
+        table = get_table()
+        missing = [pokemon_id for pokemon_id in targets if pokemon_id not in table]
+        granted = PREFETCH_BUDGET.take(len(missing))
+        if granted:
+            get_pokemon_many(missing[:granted], skip_errors=True)
+        logger.info(
+            "pokeapi.prefetch",
+            extra={
+                "event": "pokeapi.prefetch",
+                "extra_data": {"generation": generation, "missing": len(missing), "fetched": granted},
+            },
+        )
+    except Exception:  # pragma: no cover - prefetch é só otimização
+        logger.warning(
+            "pokeapi.prefetch.error",
+            extra={"event": "pokeapi.prefetch.error", "extra_data": {"generation": generation}},
+            exc_info=True,
+        )
+    finally:
+        close_old_connections()
+        with _prefetch_lock:
+            _prefetching.difference_update(ids)
+
+
+def _next_generation(generation: int | None, name: str | None, type: str | None, stats: Any) -> int | None:
+    """Generation to warm after the last page of a plain generation listing."""
+    return int(generation) + 1 if generation and not (name or type or stats) else None
+
+
+def _placeholders(ids: Sequence[int]) -> Dict[int, Dict[str, Any]]:
+    """Stand-ins for Pokémon that could not be hydrated, named from the global catalog."""
+    catalog = get_global_catalog()
+    placeholders: Dict[int, Dict[str, Any]] = {}
+    for pokemon_id in ids:
+        position = catalog.position(pokemon_id)
+        placeholders[pokemon_id] = {
+            "id": pokemon_id,
+            "name": catalog.names[position] if position is not None else None,
+            "types": [],
+            "sprite": None,
+            "stats": None,
+            "placeholder": True,
+        }
+    return placeholders
+
+
+def _page_payload(
+    total: int,
+    ids: Sequence[int],
+    records: Iterable[Dict[str, Any]],
+    placeholders: Dict[int, Dict[str, Any]],
+    cursors: Dict[str, str | None],
+    complete: bool = True,
+) -> Dict[str, Any]:
+    found = {record["id"]: record for record in records}
     return {
         "count": total,
-        "results": results,
+        "results": [found.get(pokemon_id) or placeholders[pokemon_id] for pokemon_id in ids],
+        "partial": bool(placeholders) or not complete,
+        **cursors,
     }
+
+
+def list_pokemon(
+    *,
+    generation: int | None = None,
+    name: str | None = None,
+    type: str | None = None,
+    stats: Mapping[str, Sequence[Any]] | None = None,
+    ordering: str | Sequence[str] | None = None,
+    limit: int = 20,
+    offset: int = 0,
+    after: int | None = None,
+) -> Dict[str, Any]:
+    """Return a normalized Pokédex payload filtered by generation, name, type or stats.
+
+    Besides ``count`` and ``results`` the payload carries the ``next`` and
+    ``previous`` page cursors (see :func:`normalize_list_filters`). Pokémon
+    that fail to hydrate within ``LIST_TIME_BUDGET`` are returned as
+    placeholders (``"placeholder": true``, only id and name), the payload is
+    flagged ``partial`` and the gaps are filled in background. Stat filters
+    and ordering that could not see every candidate in time also flag it.
+    """
+    total, ids, cursors, upcoming, complete = _plan_page(
+        generation=generation,
+        name=name,
+        type=type,
+        stats=stats,
+        ordering=ordering,
+        limit=limit,
+        offset=offset,
+        after=after,
+    )
+    records = get_pokemon_many(ids, skip_errors=True, timeout=LIST_TIME_BUDGET)
+    missing = _missing_ids(ids, {record["id"]: record for record in records})
+    if missing:
+        _schedule_backfill(missing)
+    _schedule_prefetch(
+        upcoming, generation=None if upcoming else _next_generation(generation, name, type, stats), limit=limit
+    )
+    return _page_payload(total, ids, records, _placeholders(missing) if missing else {}, cursors, complete)
+
+
+# ---------------------------------------------------------------------------
+# Cliente assíncrono (ASGI): cache assíncrono e fan-out com asyncio.gather
+# ---------------------------------------------------------------------------
+
+
+async def _afetch_many_json(
+    endpoints: Sequence[str], *, timeout: float | None = None
+) -> Dict[str, Dict[str, Any] | PokeAPIError]:
+    """Async twin of ``_fetch_many_json``: ``aget_many`` plus gathered misses."""
+    keys = {endpoint: _cache_key(endpoint) for endpoint in endpoints}
+    cached = await cache.aget_many(list(keys.values()))
+    results: Dict[str, Dict[str, Any] | PokeAPIError] = {
+        endpoint: _read_cached(endpoint, cached[key]) for endpoint, key in keys.items() if key in cached
+    }
+    misses = [endpoint for endpoint in endpoints if endpoint not in results]
+    logger.info(
+        "pokeapi.cache.bulk",
+        extra={"event": "pokeapi.cache.bulk", "extra_data": {"hits": len(results), "misses": len(misses)}},
+    )
+    # As requisições bloqueantes rodam no mesmo pool limitado (SESSION + Retry);
+    # o event loop fica livre enquanto aguarda a PokéAPI.
+    loop = asyncio.get_running_loop()
+    futures = {
+        endpoint: loop.run_in_executor(EXECUTOR, contextvars.copy_context().run, _fetch_remote, endpoint)
+        for endpoint in misses
+    }
+    if futures:
+        await asyncio.wait(futures.values(), timeout=timeout)
+    for endpoint, future in futures.items():
+        if not future.done():
+            # Continua rodando e preenche o cache; o callback consome o resultado tardio
+            future.add_done_callback(lambda late: late.cancelled() or late.exception())
+            results[endpoint] = PokeAPIError(f"Tempo esgotado aguardando a PokéAPI: {endpoint}")
+            continue
+        error = future.exception()
+        if error is not None and not isinstance(error, PokeAPIError):
+            raise error
+        results[endpoint] = error or future.result()
+    return results
+
+
+async def aget_pokemon_many(
+    ids: Sequence[int], *, skip_errors: bool = False, timeout: float | None = None
+) -> List[Dict[str, Any]]:
+    """Async version of ``get_pokemon_many`` for ASGI views."""
+    table = get_table()
+    records = table.records(ids)
+    missing = _missing_ids(ids, records)
+    if missing:
+        cached = await cache.aget_many([_pokemon_key(pokemon_id) for pokemon_id in missing])
+        resolved = list(cached.values())
+        records.update((record["id"], record) for record in resolved)
+        missing = _missing_ids(ids, records)
+        if missing:
+            stored = await sync_to_async(pokedex_store.get_records)(missing)
+            records.update(stored)
+            fetched: List[Dict[str, Any]] = []
+            missing = _missing_ids(ids, records)
+            if missing:
+                payloads = await _afetch_many_json(
+                    [f"pokemon/{pokemon_id}/" for pokemon_id in missing], timeout=timeout
+                )
+                fetched = _merge_fetched(missing, payloads, records, skip_errors=skip_errors)
+                if fetched:
+                    await sync_to_async(pokedex_store.save_records)(fetched)
+            await cache.aset_many(_cache_entries([*stored.values(), *fetched]), ENDPOINT_TTLS["pokemon"][1])
+            resolved += [*stored.values(), *fetched]
+        table.extend(resolved)
+    return [records[pokemon_id] for pokemon_id in ids if pokemon_id in records]
+
+
+async def alist_pokemon(
+    *,
+    generation: int | None = None,
+    name: str | None = None,
+    type: str | None = None,
+    stats: Mapping[str, Sequence[Any]] | None = None,
+    ordering: str | Sequence[str] | None = None,
+    limit: int = 20,
+    offset: int = 0,
+    after: int | None = None,
+) -> Dict[str, Any]:
+    """Async version of ``list_pokemon`` for ASGI views."""
+    # Catálogos são uma única leitura em cache (ou um fetch) por requisição
+    total, ids, cursors, upcoming, complete = await sync_to_async(_plan_page, thread_sensitive=False)(
+        generation=generation,
+        name=name,
+        type=type,
+        stats=stats,
+        ordering=ordering,
+        limit=limit,
+        offset=offset,
+        after=after,
+    )
+    records = await aget_pokemon_many(ids, skip_errors=True, timeout=LIST_TIME_BUDGET)
+    missing = _missing_ids(ids, {record["id"]: record for record in records})
+    _schedule_prefetch(
+        upcoming, generation=None if upcoming else _next_generation(generation, name, type, stats), limit=limit
+    )
+    placeholders: Dict[int, Dict[str, Any]] = {}
+    if missing:
+        _schedule_backfill(missing)
+        placeholders = await sync_to_async(_placeholders, thread_sensitive=False)(missing)
+    return _page_payload(total, ids, records, placeholders, cursors, complete)
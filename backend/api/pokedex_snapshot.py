@@ -0,0 +1,46 @@
+"""Snapshot offline do Pokédex (gerado por ``manage.py pokedex_sync``)."""
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+from django.conf import settings
+
+# Incrementar quando o formato do arquivo mudar de forma incompatível
+SNAPSHOT_SCHEMA = 1
+
+
+def snapshot_path() -> Path:
+    return Path(settings.POKEDEX_SNAPSHOT_PATH)
+
+
+def read_snapshot(path: Path | None = None) -> Dict[str, Any] | None:
+    """Return the snapshot stored at ``path``, or ``None`` if absent or incompatible.
+
+    The payload has ``schema``, ``version`` (bumped on every content change),
+    ``created_at``, ``endpoints`` (pruned PokéAPI catalog/generation/type
+    payloads keyed by endpoint) and ``pokemon`` (normalized records).
+    """
+    path = path or snapshot_path()
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except FileNotFoundError:
+        return None
+    if data.get("schema") != SNAPSHOT_SCHEMA:
+        return None
+    return data
+
+
+def write_snapshot(data: Dict[str, Any], path: Path | None = None) -> Path:
+    """Atomically write ``data`` as gzip-compressed JSON."""
+    path = path or snapshot_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as handle:
+        json.dump({**data, "schema": SNAPSHOT_SCHEMA}, handle, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,67 @@
+"""Pokédex local: leitura e escrita dos registros normalizados no banco."""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable
+
+from .models import Pokemon
+
+_UPDATE_FIELDS = ["name", "primary_type", "secondary_type", "sprite", "hp", "attack", "defense"]
+
+
+def _to_record(pokemon: Pokemon) -> Dict[str, Any]:
+    return {
+        "id": pokemon.id,
+        "name": pokemon.name,
+        "types": [type_name for type_name in (pokemon.primary_type, pokemon.secondary_type) if type_name],
+        "sprite": pokemon.sprite,
+        "stats": {
+            "hp": pokemon.hp,
+            "attack": pokemon.attack,
+            "defense": pokemon.defense,
+        },
+    }
+
+
+def _from_record(record: Dict[str, Any]) -> Pokemon:
+    types = list(record.get("types") or [])
+    stats = record.get("stats") or {}
+    return Pokemon(
+        id=record["id"],
+        name=record["name"],
+        primary_type=types[0] if types else "",
+        secondary_type=types[1] if len(types) > 1 else "",
+        sprite=record.get("sprite"),
+        hp=stats.get("hp", 0),
+        attack=stats.get("attack", 0),
+        defense=stats.get("defense", 0),
+    )
+
+
+def get_record(identifier: str | int) -> Dict[str, Any] | None:
+    """Return the stored record for an id or name, or ``None`` if not stored yet."""
+    value = str(identifier).strip().lower()
+    lookup = {"id": int(value)} if value.isdigit() else {"name": value}
+    pokemon = Pokemon.objects.filter(**lookup).first()
+    return _to_record(pokemon) if pokemon else None
+
+
+def get_records(ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """Return stored records keyed by id using a single primary-key query."""
+    id_list = list(ids)
+    if not id_list:
+        return {}
+    return {pokemon.id: _to_record(pokemon) for pokemon in Pokemon.objects.filter(id__in=id_list)}
+
+
+def save_records(records: Iterable[Dict[str, Any]]) -> None:
+    """Insert or update normalized records in the local Pokédex."""
+    objs = [_from_record(record) for record in records if record.get("id") and record.get("name")]
+    if not objs:
+        return
+    Pokemon.objects.bulk_create(
+        objs,
+        update_conflicts=True,
+        unique_fields=["id"],
+        update_fields=_UPDATE_FIELDS,
+    )
+
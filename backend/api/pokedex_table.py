@@ -0,0 +1,189 @@
+"""Tabela colunar em memória com os Pokémon normalizados."""
+from __future__ import annotations
+
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+# Sprite padrão (official artwork); só URLs fora do padrão são guardadas por extenso
+SPRITE_TEMPLATE = (
+    "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/{id}.png"
+)
+STAT_COLUMNS = ("hp", "attack", "defense")
+_MAX_ID = 0xFFFF
+_MAX_TYPES = 64
+
+
+class PokedexTable:
+    """Append-only columnar table of normalized Pokémon records.
+
+    Ids and stats live in ``array('H')`` columns, types in a 64-bit mask per
+    row and names are interned, so a row costs a few dozen bytes instead of
+    a nested dict. Filters run over the columns and dicts are only built for
+    the rows a response actually returns. Rows are published (made visible
+    through ``_positions``) after every column is written, so readers never
+    need the lock. Per-stat sort orders are built lazily and dropped
+    whenever rows change.
+    """
+
+    def __init__(self, records: Iterable[Mapping[str, Any]] = ()) -> None:
+        self.ids = array("H")
+        self.names: List[str] = []
+        self.type_masks = array("Q")
+        # Índice do bit do tipo primário + 1 (0 = sem tipo): preserva a ordem dos slots
+        self.primary_types = array("B")
+        self.stats: Dict[str, array] = {stat: array("H") for stat in STAT_COLUMNS}
+        self._sprites: Dict[int, str | None] = {}
+        self._type_bits: Dict[str, int] = {}
+        self._type_names: List[str] = []
+        self._positions: Dict[int, int] = {}
+        # stat -> (posições ordenadas pelo valor, valores nessa ordem, rank denso por posição)
+        self._sort_indexes: Dict[str, Tuple[array, array, array]] = {}
+        self._lock = threading.Lock()
+        self.extend(records)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, pokemon_id: object) -> bool:
+        return pokemon_id in self._positions
+
+    def _type_mask(self, types: Sequence[str]) -> int | None:
+        mask = 0
+        for type_name in types:
+            bit = self._type_bits.get(type_name)
+            if bit is None:
+                if len(self._type_names) >= _MAX_TYPES:
+                    return None
+                bit = self._type_bits[type_name] = 1 << len(self._type_names)
+                self._type_names.append(type_name)
+            mask |= bit
+        return mask
+
+    def extend(self, records: Iterable[Mapping[str, Any]]) -> None:
+        """Add (or overwrite) rows; records that do not fit the columns are skipped."""
+        with self._lock:
+            self._sort_indexes.clear()
+            for record in records:
+                pokemon_id, name = record.get("id"), record.get("name")
+                types = record.get("types") or []
+                stats = record.get("stats") or {}
+                values = [int(stats.get(stat, 0)) for stat in STAT_COLUMNS]
+                mask = self._type_mask(types)
+                if (
+                    not pokemon_id
+                    or not name
+                    or pokemon_id > _MAX_ID
+                    or mask is None
+                    or not all(0 <= value <= _MAX_ID for value in values)
+                ):
+                    continue
+                primary = self._type_names.index(types[0]) + 1 if types else 0
+                sprite = record.get("sprite")
+                if sprite != SPRITE_TEMPLATE.format(id=pokemon_id):
+                    self._sprites[pokemon_id] = sprite
+                else:
+                    self._sprites.pop(pokemon_id, None)
+
+                position = self._positions.get(pokemon_id)
+                if position is None:
+                    self.ids.append(pokemon_id)
+                    self.names.append(sys.intern(name))
+                    self.type_masks.append(mask)
+                    self.primary_types.append(primary)
+                    for stat, value in zip(STAT_COLUMNS, values):
+                        self.stats[stat].append(value)
+                    self._positions[pokemon_id] = len(self.ids) - 1
+                else:
+                    self.names[position] = sys.intern(name)
+                    self.type_masks[position] = mask
+                    self.primary_types[position] = primary
+                    for stat, value in zip(STAT_COLUMNS, values):
+                        self.stats[stat][position] = value
+
+    def _materialize(self, position: int) -> Dict[str, Any]:
+        pokemon_id = self.ids[position]
+        mask = self.type_masks[position]
+        primary = self.primary_types[position] - 1
+        types = [self._type_names[primary]] if primary >= 0 else []
+        types += [
+            type_name
+            for type_name in self._type_names
+            if mask & self._type_bits[type_name] and type_name not in types
+        ]
+        return {
+            "id": pokemon_id,
+            "name": self.names[position],
+            "types": types,
+            "sprite": self._sprites.get(pokemon_id, SPRITE_TEMPLATE.format(id=pokemon_id)),
+            "stats": {stat: self.stats[stat][position] for stat in STAT_COLUMNS},
+        }
+
+    def record(self, pokemon_id: int) -> Dict[str, Any] | None:
+        """A fresh record dict for ``pokemon_id``, or ``None`` if it is not in the table."""
+        position = self._positions.get(pokemon_id)
+        return None if position is None else self._materialize(position)
+
+    def records(self, ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Fresh record dicts for the ``ids`` present in the table."""
+        positions = self._positions
+        return {
+            pokemon_id: self._materialize(positions[pokemon_id]) for pokemon_id in ids if pokemon_id in positions
+        }
+
+    def covers(self, ids: Iterable[int]) -> bool:
+        """Whether every id in ``ids`` has a row (so column filters give exact results)."""
+        return self._positions.keys() >= set(ids)
+
+    def _sort_index(self, stat: str) -> Tuple[array, array, array]:
+        with self._lock:
+            entry = self._sort_indexes.get(stat)
+            if entry is None:
+                column = self.stats[stat]
+                order = array("I", sorted(range(len(column)), key=column.__getitem__))
+                values = array("H", (column[position] for position in order))
+                ranks = array("H", bytes(2 * len(column)))
+                rank = 0
+                for index, position in enumerate(order):
+                    if index and values[index] != values[index - 1]:
+                        rank += 1
+                    ranks[position] = rank
+                entry = self._sort_indexes[stat] = (order, values, ranks)
+            return entry
+
+    def select(
+        self,
+        ids: Sequence[int],
+        *,
+        type_name: str | None = None,
+        stat_ranges: Mapping[str, Tuple[int | None, int | None]] | None = None,
+        ordering: Sequence[str] = (),
+    ) -> List[int]:
+        """Filter ``ids`` (all present in the table) by type and stat ranges.
+
+        Ranges are inclusive and answered by bisecting the per-stat sort
+        orders. ``ordering`` lists stat columns, ``-`` prefixed for
+        descending; ties (and an empty ordering) keep the order of ``ids``.
+        """
+        positions = [self._positions[pokemon_id] for pokemon_id in ids]
+        if type_name:
+            bit = self._type_bits.get(type_name)
+            if bit is None:
+                return []
+            masks = self.type_masks
+            positions = [position for position in positions if masks[position] & bit]
+        for stat, (low, high) in (stat_ranges or {}).items():
+            order, values, _ranks = self._sort_index(stat)
+            start = 0 if low is None else bisect_left(values, low)
+            end = len(values) if high is None else bisect_right(values, high)
+            if start > 0 or end < len(values):
+                allowed = set(order[start:end])
+                positions = [position for position in positions if position in allowed]
+        if ordering:
+            keys = [
+                (self._sort_index(field.lstrip("-"))[2], -1 if field.startswith("-") else 1) for field in ordering
+            ]
+            positions.sort(key=lambda position: tuple(sign * ranks[position] for ranks, sign in keys))
+        return [self.ids[position] for position in positions]
@@ -0,0 +1,34 @@
+"""Renderers da API."""
+from __future__ import annotations
+
+from rest_framework.renderers import JSONRenderer
+
+try:  # orjson é opcional: sem ele vale o encoder da stdlib do DRF
+    import orjson
+except ImportError:  # pragma: no cover - depende do ambiente
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` backed by orjson when it is installed.
+
+    The output matches DRF's compact UTF-8 JSON. Types orjson does not know
+    (lazy strings, Decimal, querysets) go through DRF's encoder, and indented
+    output (``Accept: application/json; indent=2``) keeps the stdlib path.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Mesmo escape do DRF: U+2028/U+2029 quebram JSON embutido em <script>
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
@@ -0,0 +1,102 @@
+"""Índice de busca por nome sobre os catálogos da PokéAPI."""
+from __future__ import annotations
+
+import bisect
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+# Similaridade mínima para um resultado aproximado (fuzzy)
+FUZZY_CUTOFF = 0.6
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[index:index + 3] for index in range(len(text) - 2)}
+
+
+class NameIndex:
+    """Immutable name index over a catalog (``[{"id", "name"}, ...]``).
+
+    Names are lowered once at build time. Prefix lookups bisect a sorted name
+    list; substring lookups intersect trigram posting lists and then confirm
+    the candidates, so a query only touches names that can match. Positions
+    follow the catalog order, so filtered ids keep the catalog ordering.
+    """
+
+    def __init__(self, catalog: Iterable[Dict[str, Any]]) -> None:
+        entries = [(item["id"], item["name"].lower()) for item in catalog]
+        self._ids: Tuple[int, ...] = tuple(pokemon_id for pokemon_id, _name in entries)
+        self._names: Tuple[str, ...] = tuple(name for _pokemon_id, name in entries)
+        self._sorted: List[Tuple[str, int]] = sorted(
+            (name, position) for position, name in enumerate(self._names)
+        )
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for position, name in enumerate(self._names):
+            for trigram in _trigrams(name):
+                postings[trigram].append(position)
+        self._trigrams: Dict[str, Tuple[int, ...]] = {key: tuple(value) for key, value in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _prefix_positions(self, prefix: str) -> List[int]:
+        start = bisect.bisect_left(self._sorted, (prefix,))
+        positions = []
+        for name, position in self._sorted[start:]:
+            if not name.startswith(prefix):
+                break
+            positions.append(position)
+        return positions
+
+    def _substring_positions(self, query: str) -> List[int]:
+        if len(query) < 3:
+            candidates: Sequence[int] = range(len(self._names))
+        else:
+            postings = sorted(
+                (self._trigrams.get(trigram, ()) for trigram in _trigrams(query)), key=len
+            )
+            candidate_set = set(postings[0])
+            for posting in postings[1:]:
+                candidate_set.intersection_update(posting)
+            candidates = sorted(candidate_set)
+        return [position for position in candidates if query in self._names[position]]
+
+    def filter_ids(self, query: str) -> List[int]:
+        """Ids whose name contains ``query``, in catalog order."""
+        query = query.strip().lower()
+        if not query:
+            return list(self._ids)
+        return [self._ids[position] for position in self._substring_positions(query)]
+
+    def _fuzzy_positions(self, query: str, exclude: set[int], limit: int) -> List[int]:
+        shared: Counter[int] = Counter()
+        for trigram in _trigrams(query):
+            shared.update(self._trigrams.get(trigram, ()))
+        scored = []
+        for position, _count in shared.most_common(limit * 10):
+            if position in exclude:
+                continue
+            ratio = SequenceMatcher(None, query, self._names[position]).ratio()
+            if ratio >= FUZZY_CUTOFF:
+                scored.append((-ratio, self._ids[position], position))
+        return [position for _ratio, _pokemon_id, position in sorted(scored)[:limit]]
+
+    def search(self, query: str, *, limit: int = 10, fuzzy: bool = False) -> List[Dict[str, Any]]:
+        """Rank matches for autocomplete: exact, prefix, substring, then fuzzy."""
+        query = query.strip().lower()
+        if not query or limit <= 0:
+            return []
+        names, ids = self._names, self._ids
+        # Nomes mais curtos primeiro: o match exato sempre encabeça a lista
+        prefix = sorted(
+            self._prefix_positions(query), key=lambda position: (len(names[position]), ids[position])
+        )
+        seen = set(prefix)
+        substring = sorted(
+            (position for position in self._substring_positions(query) if position not in seen),
+            key=lambda position: (names[position].index(query), ids[position]),
+        )
+        ranked = prefix + substring
+        if fuzzy and len(ranked) < limit:
+            ranked += self._fuzzy_positions(query, set(ranked), limit - len(ranked))
+        return [{"id": ids[position], "name": names[position]} for position in ranked[:limit]]
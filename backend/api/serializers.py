@@ -6,7 +6,29 @@ from django.db import IntegrityError
 from rest_framework import serializers
 
 from .models import Favorite, TeamSlot
-from .pokeapi_service import PokeAPIError, get_pokemon
+from .pokeapi_service import PokeAPIError, get_pokemon, get_pokemon_many
+
+
+def _resolve_pokemon(context: dict[str, Any], pokemon_id: int) -> dict[str, Any] | None:
+    """Use Pokémon pre-hydrated by the view (``context["pokemon"]``) when present."""
+    hydrated = context.get("pokemon")
+    if hydrated is not None:
+        return hydrated.get(pokemon_id)
+    try:
+        return get_pokemon(pokemon_id)
+    except PokeAPIError:
+        return None
+
+
+class PokemonHydratingListSerializer(serializers.ListSerializer):
+    """Hydrate every row's Pokémon with one bulk call before serializing (no N+1)."""
+
+    def to_representation(self, data):
+        items = list(data.all() if hasattr(data, "all") else data)
+        if self.context.get("pokemon") is None:
+            records = get_pokemon_many([item.pokemon_id for item in items], skip_errors=True)
+            self._context["pokemon"] = {record["id"]: record for record in records}
+        return super().to_representation(items)
 
 
 class FavoriteSerializer(serializers.ModelSerializer):
@@ -14,14 +36,12 @@ class FavoriteSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Favorite
+        list_serializer_class = PokemonHydratingListSerializer
         fields = ("id", "pokemon_id", "pokemon")
         read_only_fields = ("id", "pokemon")
 
     def get_pokemon(self, obj: Favorite) -> dict[str, Any] | None:
-        try:
-            return get_pokemon(obj.pokemon_id)
-        except PokeAPIError:
-            return None
+        return _resolve_pokemon(self.context, obj.pokemon_id)
 
     def validate_pokemon_id(self, value: int) -> int:
         user = self.context["request"].user
@@ -48,14 +68,12 @@ class TeamSlotSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = TeamSlot
+        list_serializer_class = PokemonHydratingListSerializer
         fields = ("id", "slot", "pokemon_id", "pokemon")
         read_only_fields = ("id", "slot", "pokemon_id", "pokemon")
 
     def get_pokemon(self, obj: TeamSlot) -> dict[str, Any] | None:
-        try:
-            return get_pokemon(obj.pokemon_id)
-        except PokeAPIError:
-            return None
+        return _resolve_pokemon(self.context, obj.pokemon_id)
 
 
 class TeamSetSerializer(serializers.Serializer):
@@ -71,3 +89,65 @@ class TeamSetSerializer(serializers.Serializer):
         if len(pokemon_ids) > 6:
             raise serializers.ValidationError("Equipe cheia (máx. 6).")
         return pokemon_ids
+
+
+# Os serializers abaixo só descrevem o schema OpenAPI: as views devolvem os dicts do serviço
+
+
+class PokemonSerializer(serializers.Serializer):
+    """Normalized Pokémon record."""
+
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    types = serializers.ListField(child=serializers.CharField())
+    sprite = serializers.URLField(allow_null=True)
+    stats = serializers.DictField(child=serializers.IntegerField())
+
+
+class PokemonAbilitySerializer(serializers.Serializer):
+    name = serializers.CharField()
+    is_hidden = serializers.BooleanField()
+
+
+class PokemonMeasurementsSerializer(serializers.Serializer):
+    height_m = serializers.FloatField()
+    weight_kg = serializers.FloatField()
+
+
+class PokemonSpeciesSerializer(serializers.Serializer):
+    genus = serializers.CharField(allow_null=True)
+    description = serializers.CharField(allow_null=True)
+    generation = serializers.CharField(allow_null=True)
+    habitat = serializers.CharField(allow_null=True)
+    is_legendary = serializers.BooleanField()
+    is_mythical = serializers.BooleanField()
+
+
+class PokemonEvolutionStageSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    stage = serializers.IntegerField()
+    evolves_from = serializers.CharField(allow_null=True)
+
+
+class PokemonDetailSerializer(PokemonSerializer):
+    """Pokémon record plus the extra fields requested in ``?fields=``."""
+
+    abilities = PokemonAbilitySerializer(many=True, required=False)
+    measurements = PokemonMeasurementsSerializer(required=False)
+    species = PokemonSpeciesSerializer(required=False)
+    evolution = PokemonEvolutionStageSerializer(many=True, required=False)
+
+
+class PokemonBatchSerializer(serializers.Serializer):
+    results = PokemonSerializer(many=True)
+    missing = serializers.ListField(child=serializers.IntegerField())
+
+
+class PokemonSearchResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+
+
+class PokemonSearchSerializer(serializers.Serializer):
+    results = PokemonSearchResultSerializer(many=True)
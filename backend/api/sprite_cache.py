@@ -0,0 +1,74 @@
+"""Cache em disco das artes dos Pokémon (originais e miniaturas), endereçado por conteúdo."""
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+
+try:  # Pillow é opcional: sem ele as miniaturas caem para a arte original
+    from PIL import Image
+except ImportError:  # pragma: no cover - depende do ambiente
+    Image = None
+
+FULL = "full"
+THUMBNAIL_SIZES = (96, 256)  # lado máximo em pixels
+SIZES = (FULL, *(str(size) for size in THUMBNAIL_SIZES))
+
+
+def sprites_root() -> Path:
+    return Path(settings.POKEDEX_SPRITES_ROOT)
+
+
+def _blob_path(digest: str) -> Path:
+    return sprites_root() / "blobs" / digest[:2] / f"{digest}.png"
+
+
+def _ref_path(pokemon_id: int, size: str) -> Path:
+    return sprites_root() / "refs" / f"{pokemon_id}-{size}"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Nome único por escrita: threads do mesmo processo podem gravar o mesmo sprite
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False) as tmp:
+        tmp.write(data)
+    os.replace(tmp.name, path)
+
+
+def cached_path(pokemon_id: int, size: str) -> Path | None:
+    """Blob already stored for ``pokemon_id`` at ``size``, if any."""
+    try:
+        digest = _ref_path(pokemon_id, size).read_text().strip()
+    except FileNotFoundError:
+        return None
+    path = _blob_path(digest)
+    return path if path.exists() else None
+
+
+def store(pokemon_id: int, size: str, data: bytes) -> Path:
+    """Store ``data`` under its SHA-256 (once) and point ``pokemon_id``/``size`` at it.
+
+    Equal images share one blob, and a blob never changes once written, so
+    its digest doubles as the ETag.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    path = _blob_path(digest)
+    if not path.exists():
+        _write_atomic(path, data)
+    _write_atomic(_ref_path(pokemon_id, size), digest.encode())
+    return path
+
+
+def resize(data: bytes, size: int) -> bytes | None:
+    """PNG downscaled to fit ``size`` x ``size``; ``None`` when Pillow is not installed."""
+    if Image is None:
+        return None
+    with Image.open(io.BytesIO(data)) as image:
+        image.thumbnail((size, size))
+        output = io.BytesIO()
+        image.save(output, format="PNG", optimize=True)
+    return output.getvalue()
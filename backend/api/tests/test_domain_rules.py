@@ -3,15 +3,17 @@ from __future__ import annotations
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from api.models import Favorite, TeamSlot
+from api.serializers import FavoriteSerializer
 
 User = get_user_model()
 
-# Resposta padrão de get_pokemon usada em todos os testes desta suite.
+# Resposta padrão da PokéAPI usada em todos os testes desta suite.
 # Evita chamadas reais à PokéAPI durante os testes unitários.
 _MOCK_POKEMON = {
     "id": 25,
@@ -27,7 +29,327 @@ def _make_mock_pokemon(pokemon_id: int) -> dict:
     return {**_MOCK_POKEMON, "id": pokemon_id, "name": f"pokemon-{pokemon_id}"}
 
 
+def _make_mock_pokemon_many(pokemon_ids: list[int], skip_errors: bool = False) -> list[dict]:
+    """Retorna os pokemon mockados na mesma ordem dos ids."""
+    return [_make_mock_pokemon(pokemon_id) for pokemon_id in pokemon_ids]
+
+
+@patch("api.views.aget_pokemon_many")
+class PokemonBatchViewTests(APITestCase):
+    def setUp(self) -> None:
+        from api.catalog import Catalog
+
+        cache.clear()
+        self.url = reverse("api:pokemon-batch")
+        catalog = patch(
+            "api.views.get_global_catalog",
+            return_value=Catalog((pokemon_id, f"pokemon-{pokemon_id}") for pokemon_id in range(1, 11)),
+        )
+        catalog.start()
+        self.addCleanup(catalog.stop)
+
+    def test_returns_records_in_request_order_with_one_bulk_call(self, mock_many) -> None:
+        mock_many.side_effect = lambda ids, skip_errors=False: [
+            _make_mock_pokemon(pokemon_id) for pokemon_id in ids if pokemon_id != 9
+        ]
+
+        response = self.client.get(self.url, {"ids": "7,4, 9,7,1"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["id"] for item in response.data["results"]], [7, 4, 1])
+        self.assertEqual(response.data["missing"], [9])
+        self.assertNotIn("ETag", response)
+        mock_many.assert_awaited_once_with([7, 4, 9, 1], skip_errors=True)
+
+    def test_complete_batches_are_cacheable(self, mock_many) -> None:
+        mock_many.side_effect = _make_mock_pokemon_many
+
+        first = self.client.get(self.url, {"ids": "1,2"})
+        second = self.client.get(self.url, {"ids": "1,2"}, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertIn("public", first["Cache-Control"])
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+        mock_many.assert_awaited_once()
+
+    def test_unknown_ids_are_missing_without_upstream_calls(self, mock_many) -> None:
+        mock_many.side_effect = _make_mock_pokemon_many
+
+        response = self.client.get(self.url, {"ids": "900000,2,900001"})
+
+        self.assertEqual([item["id"] for item in response.data["results"]], [2])
+        self.assertEqual(response.data["missing"], [900000, 900001])
+        # Ids inexistentes não mudam até a próxima versão do catálogo: a resposta pode ir para o cache
+        self.assertIn("public", response["Cache-Control"])
+        mock_many.assert_awaited_once_with([2], skip_errors=True)
+
+    @patch("api.views.BATCH_MAX_IDS", 3)
+    def test_rejects_invalid_or_oversized_id_sets(self, mock_many) -> None:
+        for ids in ("", "1,abc", "0", "1,2,3,4"):
+            response = self.client.get(self.url, {"ids": ids})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, ids)
+        mock_many.assert_not_awaited()
+
+
+class PokemonDetailViewTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    @patch("api.views.get_pokemon_detail")
+    @patch("api.views.get_global_catalog")
+    def test_detail_passes_requested_fields(self, mock_catalog, mock_detail) -> None:
+        from api.catalog import Catalog
+
+        mock_catalog.return_value = Catalog([(25, "pikachu")])
+        mock_detail.return_value = {**_MOCK_POKEMON, "abilities": [{"name": "static", "is_hidden": False}]}
+
+        response = self.client.get(reverse("api:pokemon-detail", args=[25]), {"fields": "abilities,stats"})
+        missing = self.client.get(reverse("api:pokemon-detail", args=[99999]))
+        invalid = self.client.get(reverse("api:pokemon-detail", args=[25]), {"fields": "moves"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["abilities"][0]["name"], "static")
+        self.assertIn("public", response["Cache-Control"])
+        mock_detail.assert_called_once_with(25, ["stats", "abilities"])
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_pokemon_endpoints_are_documented_in_the_schema(self) -> None:
+        from django.urls import include, path
+        from drf_spectacular.generators import SchemaGenerator
+
+        from api.urls import urlpatterns
+
+        documented = {"pokemon-detail", "pokemon-batch", "pokemon-search"}
+        routes = [route for route in urlpatterns if route.name in documented]
+        generator = SchemaGenerator(patterns=[path("api/", include(routes))])
+        paths = generator.get_schema(request=None, public=True)["paths"]
+
+        for path, operation_id, schema in (
+            ("/api/pokemon/{pokemon_id}/", "pokemon_detail", "PokemonDetail"),
+            ("/api/pokemon/batch/", "pokemon_batch", "PokemonBatch"),
+            ("/api/pokemon/search/", "pokemon_search", "PokemonSearch"),
+        ):
+            operation = paths[path]["get"]
+            self.assertEqual(operation["operationId"], operation_id)
+            self.assertEqual(
+                operation["responses"]["200"]["content"]["application/json"]["schema"]["$ref"],
+                f"#/components/schemas/{schema}",
+            )
+
+
+class SpriteViewTests(APITestCase):
+    def setUp(self) -> None:
+        import tempfile
+        from pathlib import Path
+
+        from api.catalog import Catalog
+
+        cache.clear()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.blob = Path(tmp.name) / f"{'ab' * 32}.png"
+        self.blob.write_bytes(b"\x89PNG fake")
+        catalog = patch("api.views.get_global_catalog", return_value=Catalog([(25, "pikachu")]))
+        catalog.start()
+        self.addCleanup(catalog.stop)
+
+    @patch("api.views.get_sprite_file")
+    def test_sprite_is_served_with_revalidation_headers(self, mock_sprite) -> None:
+        from api.views import SPRITE_MAX_AGE
+
+        mock_sprite.return_value = self.blob
+        url = reverse("api:pokemon-sprite", args=[25, "96"])
+
+        response = self.client.get(url, HTTP_ACCEPT="image/png")
+        revalidated = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "image/png")
+        self.assertEqual(b"".join(response.streaming_content), b"\x89PNG fake")
+        self.assertEqual(response["ETag"], f'"{"ab" * 32}"')
+        self.assertNotIn("immutable", response["Cache-Control"])
+        self.assertIn(f"max-age={SPRITE_MAX_AGE}", response["Cache-Control"])
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+        mock_sprite.assert_called_with(25, "96")
+
+    @patch("api.views.get_sprite_file")
+    def test_unknown_sizes_and_pokemon_are_rejected(self, mock_sprite) -> None:
+        invalid = self.client.get(reverse("api:pokemon-sprite", args=[25, "42"]))
+        missing = self.client.get(reverse("api:pokemon-sprite", args=[99999, "full"]))
+
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+        mock_sprite.assert_not_called()
+
+
+@patch("api.views.alist_pokemon")
+class PokemonListViewTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create_user(username="ash", password="P1k@chuP1k@")
+        self.url = reverse("api:pokemon-list")
+
+    def test_anonymous_list_has_no_user_flags(self, mock_list) -> None:
+        mock_list.return_value = {"count": 1, "results": [_make_mock_pokemon(25)]}
+
+        response = self.client.get(self.url, {"generation": 1, "limit": 5})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("is_favorite", response.json()["results"][0])
+        mock_list.assert_awaited_once_with(
+            generation=1, name="", type="", stats={}, ordering=[], limit=5, offset=0, after=None
+        )
+
+    def test_equivalent_queries_share_one_cached_body(self, mock_list) -> None:
+        mock_list.return_value = {"count": 30, "results": [_make_mock_pokemon(pokemon_id) for pokemon_id in range(1, 21)]}
+
+        first = self.client.get(self.url)
+        second = self.client.get(self.url, {"limit": "abc", "offset": "-3", "name": "  "})
+        self.client.force_authenticate(self.user)
+        authenticated = self.client.get(self.url)
+
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(len(authenticated.data["results"]), 20)
+        self.assertFalse(authenticated.data["results"][0]["is_favorite"])
+        mock_list.assert_awaited_once()
+
+    def test_indent_is_honored_for_the_cached_page(self, mock_list) -> None:
+        mock_list.return_value = {"count": 1, "results": [_make_mock_pokemon(25)]}
+
+        compact = self.client.get(self.url)
+        indented = self.client.get(self.url, HTTP_ACCEPT="application/json; indent=2")
+
+        self.assertNotIn(b"\n", compact.content)
+        self.assertIn(b'\n  "count": 1', indented.content)
+        self.assertEqual(indented.json(), compact.json())
+        mock_list.assert_awaited_once()
+
+    def test_columns_shape_reuses_the_cached_page(self, mock_list) -> None:
+        mock_list.return_value = {"count": 2, "results": [_make_mock_pokemon(25), _make_mock_pokemon(26)]}
+
+        rows = self.client.get(self.url)
+        columns = self.client.get(self.url, {"shape": "columns"})
+
+        body = columns.json()
+        self.assertNotIn("results", body)
+        self.assertEqual(body["count"], 2)
+        self.assertEqual(body["columns"]["id"], [25, 26])
+        self.assertEqual(body["columns"]["hp"], [35, 35])
+        self.assertNotIn("placeholder", body["columns"])
+        self.assertNotEqual(columns["ETag"], rows["ETag"])
+        mock_list.assert_awaited_once()
+
+    def test_sprite_proxy_rewrites_list_sprites(self, mock_list) -> None:
+        from django.test import override_settings
+
+        placeholder = {"id": 26, "name": "raichu", "sprite": None, "placeholder": True}
+        mock_list.return_value = {"count": 2, "results": [_make_mock_pokemon(25), placeholder]}
+
+        with override_settings(POKEMON_SPRITE_PROXY=True):
+            results = self.client.get(self.url).json()["results"]
+
+        self.assertEqual(results[0]["sprite"], reverse("api:pokemon-sprite", args=[25, "96"]))
+        self.assertIsNone(results[1]["sprite"])
+
+    def test_cursor_links_resume_the_same_filters(self, mock_list) -> None:
+        from api.pokeapi_service import _encode_cursor, normalize_list_filters
+
+        filters = normalize_list_filters(type="fire", ordering="-attack", limit=2)
+        cursor = _encode_cursor(filters, 2, 6)
+        mock_list.return_value = {"count": 5, "results": [], "next": cursor, "previous": None}
+
+        response = self.client.get(self.url, {"type": "Fire", "ordering": "-attack", "limit": 2, "extra": 1})
+        self.assertEqual(
+            response.json()["next"], f"{self.url}?type=fire&ordering=-attack&limit=2&cursor={cursor}"
+        )
+        self.assertIsNone(response.json()["previous"])
+
+        self.client.get(response.json()["next"])
+        mock_list.assert_awaited_with(
+            generation=None, name="", type="fire", stats={}, ordering=["-attack"], limit=2, offset=2, after=6
+        )
+
+        mismatched = self.client.get(self.url, {"type": "water", "cursor": cursor})
+        self.assertEqual(mismatched.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_pages_with_missing_pokemon_are_not_cached(self, mock_list) -> None:
+        mock_list.return_value = {"count": 3, "results": [_make_mock_pokemon(1)]}
+
+        self.client.get(self.url, {"type": "fire"})
+        self.client.get(self.url, {"type": "fire"})
+
+        self.assertEqual(mock_list.await_count, 2)
+
+    def test_partial_pages_are_served_uncached(self, mock_list) -> None:
+        placeholder = {"id": 2, "name": "ivysaur", "types": [], "sprite": None, "stats": None, "placeholder": True}
+        mock_list.return_value = {"count": 2, "results": [_make_mock_pokemon(1), placeholder], "partial": True}
+
+        response = self.client.get(self.url, {"limit": 2})
+        self.client.get(self.url, {"limit": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()["partial"])
+        self.assertTrue(response.json()["results"][1]["placeholder"])
+        self.assertIn("no-store", response["Cache-Control"])
+        self.assertNotIn("ETag", response)
+        self.assertEqual(mock_list.await_count, 2)
+
+    def test_authenticated_list_marks_favorites_and_team(self, mock_list) -> None:
+        mock_list.return_value = {"count": 2, "results": [_make_mock_pokemon(1), _make_mock_pokemon(4)]}
+        Favorite.objects.create(user=self.user, pokemon_id=1)
+        TeamSlot.objects.create(user=self.user, slot=1, pokemon_id=4)
+        self.client.force_authenticate(self.user)
+
+        response = self.client.get(self.url)
+
+        flags = [(item["is_favorite"], item["is_in_team"]) for item in response.data["results"]]
+        self.assertEqual(flags, [(True, False), (False, True)])
+
+    def test_revalidation_returns_304_without_listing(self, mock_list) -> None:
+        mock_list.return_value = {"count": 1, "results": [_make_mock_pokemon(25)]}
+
+        first = self.client.get(self.url, {"limit": 5})
+        self.assertIn("public", first["Cache-Control"])
+        self.assertIn("Authorization", first["Vary"])
+        self.assertIn("Last-Modified", first)
+
+        second = self.client.get(self.url, {"limit": 5}, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(second["ETag"], first["ETag"])
+        mock_list.assert_awaited_once()
+
+    def test_etag_changes_with_filters_and_user_state(self, mock_list) -> None:
+        mock_list.return_value = {"count": 1, "results": [_make_mock_pokemon(1)]}
+        self.client.force_authenticate(self.user)
+
+        first = self.client.get(self.url)
+        self.assertIn("private", first["Cache-Control"])
+        self.assertNotIn("Last-Modified", first)
+        other_page = self.client.get(self.url, {"offset": 20})
+        Favorite.objects.create(user=self.user, pokemon_id=1)
+        after_favorite = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertNotEqual(first["ETag"], other_page["ETag"])
+        self.assertEqual(after_favorite.status_code, status.HTTP_200_OK)
+        self.assertTrue(after_favorite.data["results"][0]["is_favorite"])
+
+    def test_catalog_change_invalidates_etag(self, mock_list) -> None:
+        from api.pokeapi_service import _cache_payload
+
+        mock_list.return_value = {"count": 0, "results": []}
+        _cache_payload("type/fire/", {"name": "fire", "pokemon": []})
+        first = self.client.get(self.url)
+        _cache_payload("type/fire/", {"name": "fire", "pokemon": [{"pokemon": {"name": "charmander"}}]})
+
+        second = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(second["ETag"], first["ETag"])
+
+
 @patch("api.serializers.get_pokemon", side_effect=_make_mock_pokemon)
+@patch("api.serializers.get_pokemon_many", side_effect=_make_mock_pokemon_many)
 class FavoriteDomainTests(APITestCase):
     def setUp(self) -> None:
         self.user = User.objects.create_user(
@@ -38,19 +360,66 @@ class FavoriteDomainTests(APITestCase):
         self.client.force_authenticate(self.user)
         self.url = reverse("api:favorite-list")
 
-    def test_prevents_duplicate_favorites(self, _mock_pokemon) -> None:
+    def test_prevents_duplicate_favorites(self, _mock_pokemon_many, _mock_pokemon) -> None:
         payload = {"pokemon_id": 25}
         first_response = self.client.post(self.url, payload, format="json")
         self.assertEqual(first_response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Favorite.objects.filter(user=self.user).count(), 1)
+        self.assertEqual(first_response.data["pokemon"]["id"], 25)
 
         second_response = self.client.post(self.url, payload, format="json")
         self.assertEqual(second_response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("pokemon_id", second_response.data)
         self.assertEqual(Favorite.objects.filter(user=self.user).count(), 1)
 
+    def test_lists_favorites_with_one_bulk_hydration(self, mock_pokemon_many, _mock_pokemon) -> None:
+        for pokemon_id in (7, 1, 4):
+            Favorite.objects.create(user=self.user, pokemon_id=pokemon_id)
 
-@patch("api.serializers.get_pokemon", side_effect=_make_mock_pokemon)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item["pokemon"]["id"] for item in response.data], [1, 4, 7])
+        mock_pokemon_many.assert_called_once_with([1, 4, 7], skip_errors=True)
+
+    def test_paginates_favorites_when_requested(self, mock_pokemon_many, _mock_pokemon) -> None:
+        for pokemon_id in (1, 4, 7, 25, 133):
+            Favorite.objects.create(user=self.user, pokemon_id=pokemon_id)
+
+        response = self.client.get(self.url, {"page": 2, "page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 5)
+        self.assertIsNotNone(response.data["next"])
+        self.assertEqual([item["pokemon_id"] for item in response.data["results"]], [7, 25])
+        mock_pokemon_many.assert_called_once_with([7, 25], skip_errors=True)
+
+    def test_favorites_revalidate_until_they_change(self, mock_pokemon_many, _mock_pokemon) -> None:
+        Favorite.objects.create(user=self.user, pokemon_id=1)
+        first = self.client.get(self.url)
+
+        unchanged = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        Favorite.objects.create(user=self.user, pokemon_id=4)
+        changed = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(unchanged.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(mock_pokemon_many.call_count, 2)
+
+    def test_delete_only_own_favorite(self, _mock_pokemon_many, _mock_pokemon) -> None:
+        other = User.objects.create_user(username="gary", password="0utr4S3nh@!")
+        own = Favorite.objects.create(user=self.user, pokemon_id=1)
+        foreign = Favorite.objects.create(user=other, pokemon_id=1)
+
+        response = self.client.delete(reverse("api:favorite-detail", args=[foreign.pk]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.delete(reverse("api:favorite-detail", args=[own.pk]))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Favorite.objects.filter(pk=own.pk).exists())
+
+
+@patch("api.serializers.get_pokemon_many", side_effect=_make_mock_pokemon_many)
 class TeamDomainTests(APITestCase):
     def setUp(self) -> None:
         self.user = User.objects.create_user(
@@ -103,3 +472,29 @@ class TeamDomainTests(APITestCase):
         second_response = self.client.post(self.set_url, updated, format="json")
         self.assertEqual(second_response.status_code, status.HTTP_200_OK)
         self.assertEqual(TeamSlot.objects.filter(user=self.user).count(), 3)
+
+    def test_team_revalidation_skips_hydration(self, mock_pokemon_many) -> None:
+        self.client.post(self.set_url, {"pokemon_ids": [1, 4]}, format="json")
+        first = self.client.get(self.list_url)
+        mock_pokemon_many.reset_mock()
+
+        second = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertIn("private", second["Cache-Control"])
+        mock_pokemon_many.assert_not_called()
+
+
+class FavoriteSerializerHydrationTests(APITestCase):
+    @patch("api.serializers.get_pokemon")
+    @patch("api.serializers.get_pokemon_many", side_effect=_make_mock_pokemon_many)
+    def test_list_serializer_hydrates_in_one_bulk_call(self, mock_pokemon_many, mock_get_pokemon) -> None:
+        user = User.objects.create_user(username="oak", password="Pr0f3ss0r!")
+        for pokemon_id in (1, 4, 7):
+            Favorite.objects.create(user=user, pokemon_id=pokemon_id)
+
+        data = FavoriteSerializer(Favorite.objects.filter(user=user).order_by("pokemon_id"), many=True).data
+
+        self.assertEqual([item["pokemon"]["id"] for item in data], [1, 4, 7])
+        mock_pokemon_many.assert_called_once_with([1, 4, 7], skip_errors=True)
+        mock_get_pokemon.assert_not_called()
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from api.models import Pokemon
+from api.pokeapi_service import PokeAPIError, list_pokemon, load_snapshot
+from api.pokedex_snapshot import read_snapshot
+
+_BASE = "https://pokeapi.co/api/v2"
+
+
+def _raw_pokemon(pokemon_id: int, name: str, type_name: str) -> dict:
+    return {
+        "id": pokemon_id,
+        "name": name,
+        "types": [{"slot": 1, "type": {"name": type_name}}],
+        "sprites": {"front_default": f"https://example.com/{pokemon_id}.png"},
+        "stats": [{"base_stat": 40, "stat": {"name": "hp"}}],
+        "moves": [{"move": {"name": "tackle"}}],
+    }
+
+
+class FakeUpstream:
+    """Stand-in for PokéAPI that records which endpoints were requested."""
+
+    def __init__(self, pokemon: dict[int, tuple[str, str]]) -> None:
+        self.pokemon = pokemon
+        self.calls: list[str] = []
+
+    def __call__(self, endpoint: str) -> dict:
+        self.calls.append(endpoint)
+        by_type: dict[str, list[int]] = {}
+        for pokemon_id, (_name, type_name) in self.pokemon.items():
+            by_type.setdefault(type_name, []).append(pokemon_id)
+        payloads = {
+            "pokemon?limit=2000&offset=0": {
+                "count": len(self.pokemon),
+                "results": [
+                    {"name": name, "url": f"{_BASE}/pokemon/{pokemon_id}/"}
+                    for pokemon_id, (name, _type) in self.pokemon.items()
+                ],
+            },
+            "generation?limit=100&offset=0": {"results": [{"name": "generation-i", "url": f"{_BASE}/generation/1/"}]},
+            "type?limit=100&offset=0": {"results": [{"name": "fire"}, {"name": "grass"}]},
+            "generation/1/": {
+                "id": 1,
+                "pokemon_species": [
+                    {"name": name, "url": f"{_BASE}/pokemon-species/{pokemon_id}/"}
+                    for pokemon_id, (name, _type) in self.pokemon.items()
+                ],
+            },
+        }
+        for type_name in ("fire", "grass"):
+            payloads[f"type/{type_name}/"] = {
+                "name": type_name,
+                "pokemon": [{"pokemon": {"url": f"{_BASE}/pokemon/{i}/"}} for i in by_type.get(type_name, [])],
+            }
+        for pokemon_id, (name, type_name) in self.pokemon.items():
+            payloads[f"pokemon/{pokemon_id}/"] = _raw_pokemon(pokemon_id, name, type_name)
+        if endpoint not in payloads:
+            raise PokeAPIError(endpoint)
+        return payloads[endpoint]
+
+
+class PokedexSyncCommandTests(TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = Path(tmp_dir.name) / "pokedex.json.gz"
+        # Cleanups rodam em ordem inversa: recarrega o snapshot real após desfazer o override
+        self.addCleanup(load_snapshot, reload=True)
+        settings_override = override_settings(POKEDEX_SNAPSHOT_PATH=self.path)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        cache.clear()
+
+    def _sync(self, upstream: FakeUpstream) -> None:
+        with patch("api.pokeapi_service._fetch_remote", side_effect=upstream):
+            call_command("pokedex_sync", stdout=StringIO())
+
+    def test_sync_writes_snapshot_and_is_incremental(self) -> None:
+        upstream = FakeUpstream({1: ("bulbasaur", "grass"), 4: ("charmander", "fire")})
+        self._sync(upstream)
+
+        snapshot = read_snapshot(self.path)
+        self.assertEqual(snapshot["version"], 1)
+        self.assertEqual([record["id"] for record in snapshot["pokemon"]], [1, 4])
+        self.assertNotIn("moves", str(snapshot["endpoints"]))
+        self.assertEqual(Pokemon.objects.count(), 2)
+
+        upstream = FakeUpstream({1: ("bulbasaur", "grass"), 4: ("charmander", "fire"), 5: ("charmeleon", "fire")})
+        self._sync(upstream)
+
+        self.assertEqual([call for call in upstream.calls if call.startswith("pokemon/")], ["pokemon/5/"])
+        self.assertEqual(read_snapshot(self.path)["version"], 2)
+
+        self._sync(upstream)
+        self.assertEqual(read_snapshot(self.path)["version"], 2)
+
+    def test_service_serves_filters_from_snapshot_without_upstream(self) -> None:
+        self._sync(FakeUpstream({1: ("bulbasaur", "grass"), 4: ("charmander", "fire")}))
+        Pokemon.objects.all().delete()
+        cache.clear()
+        load_snapshot(reload=True)
+
+        with patch("api.pokeapi_service._fetch_remote", side_effect=PokeAPIError("offline")) as mock_remote:
+            payload = list_pokemon(generation=1, type="fire")
+
+        self.assertEqual(payload["count"], 1)
+        self.assertEqual(payload["results"][0]["name"], "charmander")
+        mock_remote.assert_not_called()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from django.test import SimpleTestCase
+
+from api.pokedex_table import SPRITE_TEMPLATE, PokedexTable
+
+
+def _record(pokemon_id: int, name: str, *types: str, hp: int = 50, sprite: str | None = None) -> dict:
+    return {
+        "id": pokemon_id,
+        "name": name,
+        "types": list(types),
+        "sprite": sprite or SPRITE_TEMPLATE.format(id=pokemon_id),
+        "stats": {"hp": hp, "attack": 60, "defense": 70},
+    }
+
+
+class PokedexTableTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.table = PokedexTable(
+            [
+                _record(1, "bulbasaur", "grass", "poison", hp=68),
+                _record(4, "charmander", "fire", hp=58),
+                _record(6, "charizard", "fire", "flying", hp=78, sprite="https://example.com/6.png"),
+                _record(16, "pidgey", "normal", "flying", hp=60),
+            ]
+        )
+
+    def test_records_round_trip(self) -> None:
+        self.assertEqual(self.table.record(1), _record(1, "bulbasaur", "grass", "poison", hp=68))
+        self.assertEqual(self.table.record(6)["sprite"], "https://example.com/6.png")
+        self.assertEqual(self.table.record(16)["types"], ["normal", "flying"])
+        self.assertIsNone(self.table.record(25))
+        self.assertEqual(list(self.table.records([16, 25, 4])), [16, 4])
+
+    def test_select_filters_by_type_and_stat_ranges_in_order(self) -> None:
+        ids = [16, 6, 4, 1]
+
+        self.assertEqual(self.table.select(ids, type_name="flying"), [16, 6])
+        self.assertEqual(self.table.select(ids, type_name="water"), [])
+        self.assertEqual(self.table.select(ids, stat_ranges={"hp": (60, 70)}), [16, 1])
+        self.assertEqual(self.table.select(ids, type_name="fire", stat_ranges={"hp": (None, 60)}), [4])
+
+    def test_select_orders_by_stats_with_stable_ties(self) -> None:
+        ids = [1, 4, 6, 16]
+
+        self.assertEqual(self.table.select(ids, ordering=["-hp"]), [6, 1, 16, 4])
+        self.assertEqual(self.table.select(ids, ordering=["attack", "hp"]), [4, 16, 1, 6])
+        self.assertEqual(self.table.select(ids, ordering=["defense"]), ids)
+
+        self.table.extend([_record(25, "pikachu", "electric", hp=53)])
+        self.assertEqual(self.table.select([*ids, 25], ordering=["hp"]), [25, 4, 16, 1, 6])
+
+    def test_extend_overwrites_rows_and_skips_invalid_records(self) -> None:
+        self.table.extend([_record(4, "charmander", "fire", hp=99), {"id": None, "name": "missingno"}])
+
+        self.assertEqual(len(self.table), 4)
+        self.assertEqual(self.table.record(4)["stats"]["hp"], 99)
+        self.assertTrue(self.table.covers([1, 4]))
+        self.assertFalse(self.table.covers([1, 25]))
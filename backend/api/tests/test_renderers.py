@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+
+from api.renderers import FastJSONRenderer
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    def test_output_matches_drf_json_renderer(self) -> None:
+        data = {
+            "count": 2,
+            "results": [
+                {"id": 29, "name": "nidoran♀", "types": ["poison"], "stats": None},
+                {"id": 122, "name": "mr-mime", "created_at": datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)},
+            ],
+            "weight": Decimal("6.9"),
+            "note": "linha\u2028nova",
+        }
+
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+    def test_indent_requests_use_the_stdlib_encoder(self) -> None:
+        data = {"id": 1, "name": "bulbasaur"}
+
+        self.assertEqual(
+            FastJSONRenderer().render(data, "application/json; indent=2"),
+            JSONRenderer().render(data, "application/json; indent=2"),
+        )
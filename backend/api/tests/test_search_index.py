@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from api import pokeapi_service
+from api.pokeapi_service import LIST_TIME_BUDGET, _cache_payload, get_name_index, list_pokemon
+from api.search_index import NameIndex
+
+_CATALOG = [
+    {"id": 4, "name": "charmander"},
+    {"id": 5, "name": "charmeleon"},
+    {"id": 6, "name": "charizard"},
+    {"id": 25, "name": "pikachu"},
+    {"id": 26, "name": "raichu"},
+    {"id": 172, "name": "pichu"},
+    {"id": 10080, "name": "pikachu-rock-star"},
+]
+
+
+class NameIndexTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.index = NameIndex(_CATALOG)
+
+    def test_filter_keeps_catalog_order(self) -> None:
+        self.assertEqual(self.index.filter_ids("CHU"), [25, 26, 172, 10080])
+        self.assertEqual(self.index.filter_ids("ar"), [4, 5, 6, 10080])
+        self.assertEqual(self.index.filter_ids("zzz"), [])
+        self.assertEqual(self.index.filter_ids(""), [4, 5, 6, 25, 26, 172, 10080])
+
+    def test_search_ranks_exact_then_prefix_then_substring(self) -> None:
+        names = [item["name"] for item in self.index.search("pi", limit=10)]
+
+        self.assertEqual(names, ["pichu", "pikachu", "pikachu-rock-star"])
+        self.assertEqual(self.index.search("pikachu", limit=1), [{"id": 25, "name": "pikachu"}])
+        self.assertEqual([item["id"] for item in self.index.search("chu")], [172, 26, 25, 10080])
+
+    def test_fuzzy_matching_is_opt_in(self) -> None:
+        self.assertEqual(self.index.search("charmandr"), [])
+        self.assertEqual(self.index.search("charmandr", fuzzy=True)[0]["name"], "charmander")
+
+
+class NameIndexServiceTests(SimpleTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        # Os memos vivem no processo e sobrevivem ao cache.clear()
+        pokeapi_service._catalogs.clear()
+        pokeapi_service._name_indexes.clear()
+
+    @patch(
+        "api.pokeapi_service.get_pokemon_many",
+        side_effect=lambda ids, **kwargs: [{"id": pokemon_id} for pokemon_id in ids],
+    )
+    @patch("api.pokeapi_service.get_global_catalog", return_value=_CATALOG)
+    def test_index_is_built_once_per_catalog_version(self, mock_catalog, mock_hydrate) -> None:
+        payload = list_pokemon(name="chu")
+        list_pokemon(name="char")
+
+        self.assertEqual(payload["count"], 4)
+        mock_hydrate.assert_any_call([25, 26, 172, 10080], skip_errors=True, timeout=LIST_TIME_BUDGET)
+        self.assertIs(get_name_index(), get_name_index())
+        mock_catalog.assert_called_once_with()
+
+        _cache_payload("type/fire/", {"name": "fire", "pokemon": []})
+        _cache_payload("type/fire/", {"name": "fire", "pokemon": [{"pokemon": {"name": "charmander"}}]})
+        get_name_index()  # nova versão do catálogo
+        self.assertEqual(mock_catalog.call_count, 2)
+
+
+class PokemonSearchViewTests(APITestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.url = reverse("api:pokemon-search")
+
+    @patch("api.pokeapi_service.get_global_catalog", return_value=_CATALOG)
+    def test_returns_only_id_and_name(self, _mock_catalog) -> None:
+        response = self.client.get(self.url, {"q": "pika", "limit": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"results": [{"id": 25, "name": "pikachu"}]})
+        self.assertIn("public", response["Cache-Control"])
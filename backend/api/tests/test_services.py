@@ -1,44 +1,83 @@
 from __future__ import annotations
 
-from unittest.mock import patch
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import call, patch
 
-from django.test import SimpleTestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
 from rest_framework import serializers
 
-from api.pokeapi_service import list_pokemon
+from api.catalog import Catalog
+from api.models import Pokemon
+from api.pokeapi_service import (
+    ENDPOINT_TTLS,
+    LIST_TIME_BUDGET,
+    PokeAPIError,
+    _backfill,
+    _cache_payload,
+    _encode_cursor,
+    _fetch_json,
+    _fetch_remote,
+    _normalize_pokemon,
+    _prune_payload,
+    _refresh,
+    aget_pokemon_many,
+    catalog_version,
+    get_global_catalog,
+    get_pokemon,
+    get_pokemon_detail,
+    get_pokemon_many,
+    get_sprite_file,
+    list_pokemon,
+    load_snapshot,
+    normalize_detail_fields,
+    normalize_list_filters,
+)
 from api.serializers import TeamSetSerializer
+from api.upstream_guard import TokenBucket
 
 
 class ListPokemonTests(SimpleTestCase):
-    @patch("api.pokeapi_service.get_pokemon")
-    @patch("api.pokeapi_service._fetch_json")
-    def test_list_pokemon_defaults(self, mock_fetch_json, mock_get_pokemon) -> None:
-        mock_fetch_json.return_value = {
-            "count": 1,
-            "results": [{"name": "bulbasaur"}],
-        }
-        mock_get_pokemon.return_value = {
-            "id": 1,
-            "name": "bulbasaur",
-            "types": ["grass", "poison"],
-            "sprite": "sprite-url",
-        }
+    def setUp(self) -> None:
+        load_snapshot(reload=True)  # tabela em memória vazia
+
+    @patch("api.pokeapi_service._schedule_backfill")
+    @patch("api.pokeapi_service.get_pokemon_many")
+    @patch("api.pokeapi_service.get_global_catalog")
+    def test_list_pokemon_defaults_with_placeholders(self, mock_global_catalog, mock_hydrate, mock_backfill) -> None:
+        mock_global_catalog.return_value = Catalog(
+            (pokemon_id, f"pokemon-{pokemon_id}") for pokemon_id in range(1, 121)
+        )
+        mock_hydrate.return_value = [
+            {
+                "id": 1,
+                "name": "bulbasaur",
+                "types": ["grass", "poison"],
+                "sprite": "sprite-url",
+            }
+        ]
 
         payload = list_pokemon(limit=200, offset=-10)
 
-        self.assertEqual(payload["count"], 1)
-        self.assertEqual(len(payload["results"]), 1)
-        mock_fetch_json.assert_called_once_with("pokemon?limit=50&offset=0")
+        self.assertEqual(payload["count"], 120)
+        self.assertEqual(len(payload["results"]), 50)
+        self.assertTrue(payload["partial"])
+        self.assertEqual(payload["results"][0]["name"], "bulbasaur")
+        self.assertEqual(
+            payload["results"][1],
+            {"id": 2, "name": "pokemon-2", "types": [], "sprite": None, "stats": None, "placeholder": True},
+        )
+        mock_hydrate.assert_called_once_with(list(range(1, 51)), skip_errors=True, timeout=LIST_TIME_BUDGET)
+        mock_backfill.assert_called_once_with(list(range(2, 51)))
 
-    @patch("api.pokeapi_service.get_pokemon")
+    @patch("api.pokeapi_service.get_pokemon_many")
     @patch("api.pokeapi_service.get_generation_catalog")
-    def test_list_pokemon_generation_filters(self, mock_generation_catalog, mock_get_pokemon) -> None:
-        mock_generation_catalog.return_value = [
-            {"id": 1, "name": "bulbasaur"},
-            {"id": 2, "name": "ivysaur"},
-            {"id": 3, "name": "venusaur"},
-        ]
-        mock_get_pokemon.side_effect = [
+    def test_list_pokemon_generation_filters(self, mock_generation_catalog, mock_hydrate) -> None:
+        mock_generation_catalog.return_value = Catalog([(1, "bulbasaur"), (2, "ivysaur"), (3, "venusaur")])
+        mock_hydrate.return_value = [
             {"id": 2, "name": "ivysaur", "types": ["grass"], "sprite": "a"},
             {"id": 3, "name": "venusaur", "types": ["grass"], "sprite": "b"},
         ]
@@ -49,6 +88,668 @@ class ListPokemonTests(SimpleTestCase):
         self.assertEqual(len(payload["results"]), 2)
         self.assertEqual(payload["results"][0]["id"], 2)
         mock_generation_catalog.assert_called_once_with(1)
+        self.assertFalse(payload["partial"])
+        mock_hydrate.assert_called_once_with([2, 3], skip_errors=True, timeout=LIST_TIME_BUDGET)
+
+    @patch("api.pokeapi_service.get_pokemon_many")
+    @patch("api.pokeapi_service.get_type_index")
+    @patch("api.pokeapi_service.get_type_names")
+    @patch("api.pokeapi_service.get_generation_catalog")
+    def test_list_pokemon_type_filter_uses_index_with_exact_count(
+        self, mock_generation_catalog, mock_type_names, mock_type_index, mock_hydrate
+    ) -> None:
+        mock_generation_catalog.return_value = Catalog(
+            [(1, "bulbasaur"), (4, "charmander"), (5, "charmeleon"), (6, "charizard")]
+        )
+        mock_type_names.return_value = frozenset({"grass", "fire"})
+        mock_type_index.return_value = frozenset({4, 5, 6, 136, 10034})
+        mock_hydrate.return_value = [{"id": 5, "name": "charmeleon", "types": ["fire"], "sprite": "c"}]
+
+        payload = list_pokemon(generation=1, type="Fire", limit=1, offset=1)
+
+        self.assertEqual(payload["count"], 3)
+        mock_type_index.assert_called_once_with("fire")
+        mock_hydrate.assert_called_once_with([5], skip_errors=True, timeout=LIST_TIME_BUDGET)
+
+    @patch("api.pokeapi_service.get_type_index")
+    @patch("api.pokeapi_service.get_type_names")
+    @patch("api.pokeapi_service.get_global_catalog")
+    def test_list_pokemon_unknown_type_is_empty(self, mock_catalog, mock_type_names, mock_type_index) -> None:
+        mock_catalog.return_value = Catalog([(1, "bulbasaur")])
+        mock_type_names.return_value = frozenset({"grass"})
+
+        payload = list_pokemon(type="../admin")
+
+        self.assertEqual((payload["count"], payload["results"], payload["partial"]), (0, [], False))
+        mock_type_index.assert_not_called()
+
+
+@patch("api.pokeapi_service.PREFETCH_ENABLED", True)
+@patch("api.pokeapi_service.PREFETCH_EXECUTOR")
+@patch("api.pokeapi_service.get_pokemon_many", side_effect=lambda ids, **kwargs: [{"id": i} for i in ids])
+class PrefetchTests(SimpleTestCase):
+    def setUp(self) -> None:
+        load_snapshot(reload=True)
+
+    @patch("api.pokeapi_service.PREFETCH_BUDGET", new_callable=lambda: TokenBucket(rate=2))
+    @patch("api.pokeapi_service.get_global_catalog")
+    def test_next_page_is_warmed_within_budget(self, mock_catalog, _budget, mock_hydrate, mock_executor) -> None:
+        mock_executor.submit.side_effect = lambda task, *args: task(*args)
+        mock_catalog.return_value = Catalog((pokemon_id, f"pokemon-{pokemon_id}") for pokemon_id in range(1, 11))
+
+        list_pokemon(limit=3)
+
+        self.assertEqual(mock_hydrate.call_count, 2)
+        mock_hydrate.assert_called_with([4, 5], skip_errors=True)
+
+    @patch("api.pokeapi_service.PREFETCH_BUDGET", new_callable=lambda: TokenBucket(rate=10))
+    @patch("api.pokeapi_service.get_generation_ids", return_value=frozenset({1, 2}))
+    @patch("api.pokeapi_service.get_generation_catalog")
+    def test_last_page_of_a_generation_warms_the_next_one(
+        self, mock_generation_catalog, _generations, _budget, mock_hydrate, mock_executor
+    ) -> None:
+        mock_executor.submit.side_effect = lambda task, *args: task(*args)
+        mock_generation_catalog.side_effect = lambda generation: {
+            1: Catalog([(1, "bulbasaur"), (2, "ivysaur")]),
+            2: Catalog([(152, "chikorita"), (153, "bayleef"), (154, "meganium")]),
+        }[generation]
+
+        list_pokemon(generation=1, limit=2)
+
+        mock_generation_catalog.assert_called_with(2)
+        mock_hydrate.assert_called_with([152, 153], skip_errors=True)
+
+        mock_generation_catalog.reset_mock()
+        list_pokemon(generation=2, limit=3)
+
+        # Não existe geração 3: nada de generation/3/ na PokéAPI
+        self.assertNotIn(call(3), mock_generation_catalog.call_args_list)
+
+
+class CursorPaginationTests(SimpleTestCase):
+    def setUp(self) -> None:
+        load_snapshot(reload=True)
+
+    @patch("api.pokeapi_service.get_pokemon_many", side_effect=lambda ids, **kwargs: [{"id": i} for i in ids])
+    @patch("api.pokeapi_service.get_global_catalog")
+    def test_cursors_walk_the_list_forward_and_back(self, mock_catalog, _mock_hydrate) -> None:
+        mock_catalog.return_value = Catalog((pokemon_id, f"pokemon-{pokemon_id}") for pokemon_id in range(1, 8))
+
+        first = list_pokemon(limit=3)
+        second = list_pokemon(**normalize_list_filters(limit=3, cursor=first["next"]))
+        last = list_pokemon(**normalize_list_filters(limit=3, cursor=second["next"]))
+        back = list_pokemon(**normalize_list_filters(limit=3, cursor=last["previous"]))
+
+        self.assertEqual([item["id"] for item in second["results"]], [4, 5, 6])
+        self.assertEqual([item["id"] for item in last["results"]], [7])
+        self.assertIsNone(last["next"])
+        self.assertIsNone(first["previous"])
+        self.assertEqual(back["results"], second["results"])
+
+        # Um Pokémon removido antes do cursor não faz a próxima página pular ninguém
+        mock_catalog.return_value = Catalog((pokemon_id, f"pokemon-{pokemon_id}") for pokemon_id in (1, 3, 4, 5, 6, 7))
+        shifted = list_pokemon(**normalize_list_filters(limit=3, cursor=first["next"]))
+        self.assertEqual([item["id"] for item in shifted["results"]], [4, 5, 6])
+
+    def test_cursor_is_bound_to_its_filters(self) -> None:
+        cursor = _encode_cursor(normalize_list_filters(type="fire"), 20, 136)
+
+        self.assertEqual(normalize_list_filters(type="fire", limit=5, cursor=cursor)["after"], 136)
+        with self.assertRaises(PokeAPIError):
+            normalize_list_filters(type="water", cursor=cursor)
+        with self.assertRaises(PokeAPIError):
+            normalize_list_filters(cursor="not-a-cursor")
+
+
+class StatFilterTests(SimpleTestCase):
+    def setUp(self) -> None:
+        table = load_snapshot(reload=True)["pokemon"]
+        table.extend(
+            {
+                "id": pokemon_id,
+                "name": f"pokemon-{pokemon_id}",
+                "types": ["fire" if pokemon_id % 2 else "water"],
+                "sprite": None,
+                "stats": {"hp": pokemon_id * 10, "attack": 100 - pokemon_id * 10, "defense": 50},
+            }
+            for pokemon_id in range(1, 9)
+        )
+
+    @patch("api.pokeapi_service.get_global_catalog")
+    def test_stat_ranges_and_ordering_paginate_with_exact_count(self, mock_catalog) -> None:
+        mock_catalog.return_value = Catalog((pokemon_id, f"pokemon-{pokemon_id}") for pokemon_id in range(1, 9))
+
+        payload = list_pokemon(stats={"hp": ("30", ""), "attack": (None, 60)}, ordering="-hp", limit=2, offset=1)
+
+        # hp >= 30 e attack <= 60: ids 4..8, do maior hp para o menor
+        self.assertEqual(payload["count"], 5)
+        self.assertEqual([item["id"] for item in payload["results"]], [7, 6])
+
+        payload = list_pokemon(type="fire", ordering="attack,-hp")
+        self.assertEqual([item["id"] for item in payload["results"]], [7, 5, 3, 1])
+
+    @patch("api.pokeapi_service._schedule_backfill")
+    @patch("api.pokeapi_service.get_pokemon_many")
+    @patch("api.pokeapi_service.get_global_catalog")
+    def test_missing_candidates_are_hydrated_before_filtering(self, mock_catalog, mock_hydrate, _backfill) -> None:
+        mock_catalog.return_value = Catalog([(8, "pokemon-8"), (9, "pokemon-9")])
+        mock_hydrate.return_value = []
+
+        payload = list_pokemon(stats={"hp": (70, None)})
+
+        # O id 9 não pôde ser hidratado: contagem provisória, página parcial
+        self.assertEqual(payload["count"], 1)
+        self.assertTrue(payload["partial"])
+        mock_hydrate.assert_any_call([9], skip_errors=True, timeout=LIST_TIME_BUDGET)
+        _backfill.assert_any_call([9])
+
+    @patch("api.pokeapi_service.HYDRATE_BATCH", 2)
+    @patch("api.pokeapi_service._schedule_backfill")
+    @patch("api.pokeapi_service.get_pokemon_many", return_value=[])
+    @patch("api.pokeapi_service.get_global_catalog")
+    def test_cold_candidates_are_hydrated_one_batch_per_request(self, mock_catalog, mock_hydrate, mock_backfill) -> None:
+        mock_catalog.return_value = Catalog((pokemon_id, f"pokemon-{pokemon_id}") for pokemon_id in range(1, 14))
+
+        payload = list_pokemon(stats={"hp": (1, None)})
+
+        # Só um lote na requisição; o restante vai para o backfill e a página sai parcial
+        self.assertTrue(payload["partial"])
+        mock_hydrate.assert_any_call([9, 10], skip_errors=True, timeout=LIST_TIME_BUDGET)
+        mock_backfill.assert_any_call([9, 10, 11, 12, 13])
+
+    @patch("api.pokeapi_service.HYDRATE_BATCH", 2)
+    @patch("api.pokeapi_service.get_pokemon_many", return_value=[])
+    def test_backfill_hydrates_in_batches(self, mock_hydrate) -> None:
+        _backfill([9, 10, 11, 12, 13])
+
+        self.assertEqual(
+            mock_hydrate.call_args_list,
+            [call(ids, skip_errors=True) for ids in ([9, 10], [11, 12], [13])],
+        )
+
+    @patch("api.pokeapi_service.get_global_catalog")
+    def test_covered_candidates_give_a_complete_page(self, mock_catalog) -> None:
+        mock_catalog.return_value = Catalog((pokemon_id, f"pokemon-{pokemon_id}") for pokemon_id in range(1, 9))
+
+        payload = list_pokemon(stats={"hp": (70, None)})
+
+        self.assertEqual(payload["count"], 2)
+        self.assertFalse(payload["partial"])
+
+    def test_invalid_stat_filters_are_rejected(self) -> None:
+        with self.assertRaises(PokeAPIError):
+            normalize_list_filters(stats={"speed": (1, None)})
+        with self.assertRaises(PokeAPIError):
+            normalize_list_filters(ordering="-name")
+        filters = normalize_list_filters(stats={"hp": ("", None)}, ordering="Attack, -attack,hp")
+        self.assertEqual((filters["stats"], filters["ordering"]), ({}, ["attack", "hp"]))
+
+
+class CatalogMemoTests(SimpleTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        load_snapshot(reload=True)
+
+    @patch("api.pokeapi_service._fetch_json")
+    def test_catalog_is_parsed_once_per_version(self, mock_fetch) -> None:
+        mock_fetch.return_value = {
+            "results": [
+                {"name": "ivysaur", "url": "https://pokeapi.co/api/v2/pokemon/2/"},
+                {"name": "bulbasaur", "url": "https://pokeapi.co/api/v2/pokemon/1/"},
+            ]
+        }
+
+        _cache_payload("type/fire/", {"name": "fire", "pokemon": []})
+        catalog = get_global_catalog()
+
+        self.assertEqual(catalog.ids, (1, 2))
+        self.assertEqual(catalog.names, ("bulbasaur", "ivysaur"))
+        self.assertEqual(catalog.position(2), 1)
+        self.assertIs(get_global_catalog(), catalog)
+        mock_fetch.assert_called_once_with("pokemon?limit=2000&offset=0")
+
+        _cache_payload("type/fire/", {"name": "fire", "pokemon": []})
+        self.assertIs(get_global_catalog(), catalog)
+        # Conteúdo diferente do já servido: nova versão
+        _cache_payload("type/fire/", {"name": "fire", "pokemon": [{"pokemon": {"name": "charmander"}}]})
+        self.assertIsNot(get_global_catalog(), catalog)
+        self.assertEqual(mock_fetch.call_count, 2)
+
+    def test_new_pokemon_do_not_bump_the_catalog_version(self) -> None:
+        initial = catalog_version()
+        _cache_payload("pokemon/1/", {"id": 1, "name": "bulbasaur"})
+
+        self.assertEqual(catalog_version(), initial)
+
+
+def _raw_pokemon(pokemon_id: int, name: str, *types: str) -> dict:
+    return {
+        "id": pokemon_id,
+        "name": name,
+        "types": [{"slot": index, "type": {"name": type_name}} for index, type_name in enumerate(types, 1)],
+        "sprites": {"front_default": f"https://example.com/{pokemon_id}.png"},
+        "stats": [
+            {"base_stat": 45, "stat": {"name": "hp"}},
+            {"base_stat": 49, "stat": {"name": "attack"}},
+            {"base_stat": 49, "stat": {"name": "defense"}},
+        ],
+    }
+
+
+_SPECIES_URL = "https://pokeapi.co/api/v2/pokemon-species"
+
+
+class PokemonDetailTests(SimpleTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        raw = {
+            **_raw_pokemon(2, "ivysaur", "grass", "poison"),
+            "height": 10,
+            "weight": 130,
+            "species": {"name": "ivysaur", "url": f"{_SPECIES_URL}/2/"},
+            "abilities": [
+                {"ability": {"name": "chlorophyll"}, "is_hidden": True, "slot": 3},
+                {"ability": {"name": "overgrow"}, "is_hidden": False, "slot": 1},
+            ],
+        }
+        raw["stats"].append({"base_stat": 60, "stat": {"name": "speed"}})
+        self.payloads = {
+            "pokemon/2/": raw,
+            "pokemon-species/2/": {
+                "genera": [{"genus": "Seed Pokémon", "language": {"name": "en"}}],
+                "flavor_text_entries": [
+                    {"flavor_text": "When the bulb on\nits back grows", "language": {"name": "en"}}
+                ],
+                "generation": {"name": "generation-i"},
+                "evolution_chain": {"url": "https://pokeapi.co/api/v2/evolution-chain/1/"},
+            },
+            "evolution-chain/1/": {
+                "chain": {
+                    "species": {"name": "bulbasaur", "url": f"{_SPECIES_URL}/1/"},
+                    "evolves_to": [
+                        {
+                            "species": {"name": "ivysaur", "url": f"{_SPECIES_URL}/2/"},
+                            "evolves_to": [{"species": {"name": "venusaur", "url": f"{_SPECIES_URL}/3/"}}],
+                        }
+                    ],
+                }
+            },
+        }
+        load_snapshot(reload=True)["pokemon"].extend([_normalize_pokemon(raw)])
+
+    @patch("api.pokeapi_service._fetch_json")
+    def test_without_fields_no_upstream_resource_is_read(self, mock_fetch_json) -> None:
+        detail = get_pokemon_detail(2)
+
+        self.assertEqual(set(detail), {"id", "name", "types", "sprite", "stats"})
+        mock_fetch_json.assert_not_called()
+
+    @patch("api.pokeapi_service._fetch_json")
+    def test_pokemon_fields_read_only_the_pokemon_resource(self, mock_fetch_json) -> None:
+        mock_fetch_json.side_effect = self.payloads.__getitem__
+
+        detail = get_pokemon_detail(2, ["measurements", "abilities", "stats"])
+
+        self.assertEqual([ability["name"] for ability in detail["abilities"]], ["overgrow", "chlorophyll"])
+        self.assertEqual(detail["measurements"], {"height_m": 1.0, "weight_kg": 13.0})
+        self.assertEqual(detail["stats"]["speed"], 90)
+        self.assertEqual(detail["stats"]["special_attack"], 0)
+        mock_fetch_json.assert_called_once_with("pokemon/2/")
+
+    @patch("api.pokeapi_service._fetch_json")
+    def test_evolution_follows_species_to_the_chain(self, mock_fetch_json) -> None:
+        mock_fetch_json.side_effect = self.payloads.__getitem__
+
+        detail = get_pokemon_detail(2, "evolution,species")
+
+        self.assertEqual(detail["species"]["genus"], "Seed Pokémon")
+        self.assertEqual(detail["species"]["description"], "When the bulb on its back grows")
+        self.assertEqual(
+            [(stage["name"], stage["stage"], stage["evolves_from"]) for stage in detail["evolution"]],
+            [("bulbasaur", 1, None), ("ivysaur", 2, "bulbasaur"), ("venusaur", 3, "ivysaur")],
+        )
+        self.assertEqual(mock_fetch_json.call_count, 3)
+
+    def test_unknown_fields_are_rejected(self) -> None:
+        with self.assertRaises(PokeAPIError):
+            normalize_detail_fields("stats,moves")
+        self.assertEqual(normalize_detail_fields(" Evolution,stats"), ["stats", "evolution"])
+
+
+class SpriteCacheTests(SimpleTestCase):
+    """Artes buscadas de um servidor HTTP local no lugar do GitHub."""
+
+    def setUp(self) -> None:
+        self.hits: list[str] = []
+        artwork = b"\x89PNG\r\n\x1a\n artwork"
+        hits = self.hits
+
+        class Upstream(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                hits.append(self.path)
+                found = self.path == "/25.png"
+                self.send_response(200 if found else 404)
+                self.send_header("Content-Type", "image/png")
+                self.end_headers()
+                if found:
+                    self.wfile.write(artwork)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Upstream)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.base_url = f"http://127.0.0.1:{server.server_port}"
+        self.artwork = artwork
+
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        settings = override_settings(POKEDEX_SPRITES_ROOT=root.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    @patch("api.pokeapi_service.sprite_cache.resize", return_value=None)
+    @patch("api.pokeapi_service.get_pokemon")
+    def test_artwork_is_downloaded_once_per_pokemon(self, mock_pokemon, _mock_resize) -> None:
+        mock_pokemon.return_value = {"id": 25, "sprite": f"{self.base_url}/25.png"}
+
+        original = get_sprite_file(25)
+        thumbnail = get_sprite_file(25, "96")
+        again = get_sprite_file(25, "96")
+
+        self.assertEqual(original.read_bytes(), self.artwork)
+        # Sem Pillow a miniatura reaproveita o mesmo blob do original
+        self.assertEqual(thumbnail, original)
+        self.assertEqual(again, thumbnail)
+        self.assertEqual(self.hits, ["/25.png"])
+        mock_pokemon.assert_called_once_with(25)
+
+    @patch("api.pokeapi_service.sprite_cache.resize", side_effect=lambda data, size: data + b" thumbnail")
+    @patch("api.pokeapi_service.get_pokemon")
+    def test_concurrent_first_requests_share_one_blob(self, mock_pokemon, _mock_resize) -> None:
+        mock_pokemon.return_value = {"id": 25, "sprite": f"{self.base_url}/25.png"}
+        barrier = threading.Barrier(8)
+        results: list = []
+        errors: list[Exception] = []
+
+        def fetch() -> None:
+            barrier.wait()
+            try:
+                results.append(get_sprite_file(25, "96"))
+            except Exception as exc:  # reportado pelo assert abaixo
+                errors.append(exc)
+
+        threads = [threading.Thread(target=fetch) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(list(results[0].parent.glob(".*.tmp")), [])
+
+    @patch("api.pokeapi_service.get_pokemon")
+    def test_missing_artwork_raises(self, mock_pokemon) -> None:
+        mock_pokemon.return_value = {"id": 26, "sprite": f"{self.base_url}/26.png"}
+        with self.assertRaises(PokeAPIError):
+            get_sprite_file(26)
+
+        mock_pokemon.return_value = {"id": 27, "sprite": None}
+        with self.assertRaises(PokeAPIError):
+            get_sprite_file(27)
+
+
+class PayloadPruningTests(SimpleTestCase):
+    def test_pokemon_payload_keeps_only_normalized_fields(self) -> None:
+        raw = {
+            **_raw_pokemon(6, "charizard", "fire", "flying"),
+            "moves": [{"move": {"name": "flamethrower"}}] * 100,
+            "game_indices": [{"game_index": 180}],
+        }
+        raw["sprites"]["back_default"] = "https://example.com/back.png"
+
+        pruned = _prune_payload("pokemon/6/", raw)
+
+        self.assertNotIn("moves", pruned)
+        self.assertNotIn("game_indices", pruned)
+        self.assertNotIn("back_default", pruned["sprites"])
+        self.assertEqual(_normalize_pokemon(pruned), _normalize_pokemon(raw))
+
+    def test_species_payload_keeps_only_the_detail_language(self) -> None:
+        species = {
+            "id": 2,
+            "genera": [
+                {"genus": "Seed Pokémon", "language": {"name": "en"}},
+                {"genus": "たねポケモン", "language": {"name": "ja"}},
+            ],
+            "flavor_text_entries": [{"flavor_text": "a", "language": {"name": "en"}}] * 30,
+            "varieties": [{}],
+        }
+
+        pruned = _prune_payload("pokemon-species/2/", species)
+
+        self.assertEqual(len(pruned["genera"]), 1)
+        self.assertEqual(len(pruned["flavor_text_entries"]), 1)
+        self.assertNotIn("varieties", pruned)
+
+    def test_catalog_payloads_are_kept_and_type_payload_is_pruned(self) -> None:
+        catalog = {"count": 1, "results": [{"name": "bulbasaur", "url": "u"}]}
+        type_payload = {"name": "fire", "pokemon": [], "moves": [{}], "damage_relations": {}}
+
+        self.assertEqual(_prune_payload("pokemon?limit=2000&offset=0", catalog), catalog)
+        self.assertEqual(_prune_payload("type/fire/", type_payload), {"name": "fire", "pokemon": []})
+
+
+class StaleWhileRevalidateTests(SimpleTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    @patch("api.pokeapi_service._schedule_refresh")
+    def test_fresh_entry_is_served_without_refresh(self, mock_schedule) -> None:
+        _cache_payload("type/fire/", {"name": "fire", "pokemon": []})
+
+        self.assertEqual(_fetch_json("type/fire/"), {"name": "fire", "pokemon": []})
+        mock_schedule.assert_not_called()
+
+    @patch("api.pokeapi_service._request_json")
+    @patch("api.pokeapi_service._schedule_refresh")
+    def test_stale_entry_is_served_and_revalidated_in_background(self, mock_schedule, mock_request) -> None:
+        cache.set("pokeapi:type/fire/", {"payload": {"name": "fire", "pokemon": []}, "fresh_until": 0})
+
+        self.assertEqual(_fetch_json("type/fire/"), {"name": "fire", "pokemon": []})
+        mock_schedule.assert_called_once_with("type/fire/")
+        mock_request.assert_not_called()
+
+    def test_catalog_version_only_changes_with_content(self) -> None:
+        _cache_payload("type/fire/", {"name": "fire", "pokemon": []})
+        initial = catalog_version()
+        _cache_payload("type/fire/", {"name": "fire", "pokemon": []})
+        self.assertEqual(catalog_version(), initial)
+
+        _cache_payload("type/fire/", {"name": "fire", "pokemon": [{"pokemon": {"name": "charmander"}}]})
+
+        self.assertNotEqual(catalog_version()["version"], initial["version"])
+
+    def test_catalog_version_is_derived_from_content(self) -> None:
+        old = {"name": "fire", "pokemon": []}
+        new = {"name": "fire", "pokemon": [{"pokemon": {"name": "charmander"}}]}
+
+        def fresh_worker(payload: dict) -> str:
+            cache.clear()
+            load_snapshot(reload=True)  # outro processo: sem estado local
+            _cache_payload("type/fire/", payload)
+            return catalog_version()["version"]
+
+        served_old, served_new = fresh_worker(old), fresh_worker(new)
+
+        self.assertNotEqual(served_old, served_new)
+        self.assertEqual(fresh_worker(new), served_new)
+        # Um worker que lê a mesma entrada do cache compartilhado chega à mesma versão
+        load_snapshot(reload=True)
+        self.assertEqual(_fetch_json("type/fire/"), new)
+        self.assertEqual(catalog_version()["version"], served_new)
+
+    @patch("api.pokeapi_service._request_json", side_effect=PokeAPIError("503"))
+    def test_failed_refresh_keeps_serving_stale_data(self, _mock_request) -> None:
+        cache.set("pokeapi:generation/1/", {"payload": {"id": 1}, "fresh_until": 0})
+
+        _refresh("generation/1/")
+
+        with patch("api.pokeapi_service._schedule_refresh"):
+            self.assertEqual(_fetch_json("generation/1/"), {"id": 1})
+
+    def test_soft_ttl_depends_on_endpoint_class(self) -> None:
+        _cache_payload("pokemon/1/", {"id": 1})
+        _cache_payload("pokemon?limit=2000&offset=0", {"results": []})
+
+        pokemon_entry = cache.get("pokeapi:pokemon/1/")
+        catalog_entry = cache.get("pokeapi:pokemon?limit=2000&offset=0")
+        self.assertAlmostEqual(
+            pokemon_entry["fresh_until"] - catalog_entry["fresh_until"],
+            ENDPOINT_TTLS["pokemon"][0] - ENDPOINT_TTLS["catalog"][0],
+            delta=5,
+        )
+
+
+class SingleFlightTests(SimpleTestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    @patch("api.pokeapi_service._request_json")
+    def test_concurrent_misses_share_one_request(self, mock_request) -> None:
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_request(endpoint: str) -> dict:
+            started.set()
+            release.wait(5)
+            return {"endpoint": endpoint}
+
+        mock_request.side_effect = slow_request
+        results: list[dict] = []
+        leader = threading.Thread(target=lambda: results.append(_fetch_remote("pokemon/25/")))
+        leader.start()
+        started.wait(5)
+        followers = [
+            threading.Thread(target=lambda: results.append(_fetch_remote("pokemon/25/"))) for _ in range(3)
+        ]
+        for follower in followers:
+            follower.start()
+        time.sleep(0.2)  # deixa os seguidores alcançarem o Future do líder
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+        self.assertEqual(results, [{"endpoint": "pokemon/25/"}] * 4)
+        mock_request.assert_called_once_with("pokemon/25/")
+
+    @patch("api.pokeapi_service.DISTRIBUTED_LOCK", True)
+    @patch("api.pokeapi_service._request_json")
+    def test_distributed_lock_waits_for_other_process(self, mock_request) -> None:
+        cache.add("pokeapi:lock:type/fire/", 1, 20)
+
+        def other_process_finishes() -> None:
+            cache.set("pokeapi:type/fire/", {"name": "fire"})
+            cache.delete("pokeapi:lock:type/fire/")
+
+        timer = threading.Timer(0.1, other_process_finishes)
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        self.assertEqual(_fetch_remote("type/fire/"), {"name": "fire"})
+        mock_request.assert_not_called()
+
+
+class PokedexStoreTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        load_snapshot(reload=True)
+
+    @patch("api.pokeapi_service._fetch_json")
+    def test_get_pokemon_fills_store_once(self, mock_fetch_json) -> None:
+        mock_fetch_json.return_value = _raw_pokemon(1, "bulbasaur", "grass", "poison")
+
+        first = get_pokemon(1)
+        second = get_pokemon("bulbasaur")
+
+        self.assertEqual(first, second)
+        self.assertEqual(first["types"], ["grass", "poison"])
+        self.assertEqual(first["stats"], {"hp": 68, "attack": 74, "defense": 74})
+        mock_fetch_json.assert_called_once_with("pokemon/1/")
+
+    @patch("api.pokeapi_service._fetch_remote")
+    def test_get_pokemon_many_fetches_only_missing_ids_in_order(self, mock_fetch_remote) -> None:
+        Pokemon.objects.create(id=4, name="charmander", primary_type="fire")
+        cache.set("pokeapi:pokemon/1/", _raw_pokemon(1, "bulbasaur", "grass"))
+        mock_fetch_remote.side_effect = lambda endpoint: {
+            "pokemon/7/": _raw_pokemon(7, "squirtle", "water"),
+        }[endpoint]
+
+        with self.assertNumQueries(2):
+            results = get_pokemon_many([7, 4, 1])
+
+        self.assertEqual([item["id"] for item in results], [7, 4, 1])
+        mock_fetch_remote.assert_called_once_with("pokemon/7/")
+        self.assertEqual(Pokemon.objects.count(), 3)
+
+    @patch("api.pokeapi_service._normalize_pokemon", wraps=_normalize_pokemon)
+    def test_get_pokemon_many_serves_normalized_cache_without_store(self, mock_normalize) -> None:
+        Pokemon.objects.create(id=4, name="charmander", primary_type="fire")
+        get_pokemon_many([4])
+
+        with self.assertNumQueries(0):
+            results = get_pokemon_many([4])
+
+        self.assertEqual(results[0]["name"], "charmander")
+        self.assertEqual(get_pokemon("charmander")["id"], 4)
+        mock_normalize.assert_not_called()
+
+    @patch("api.pokeapi_service._fetch_remote")
+    def test_get_pokemon_many_raises_or_skips_failures(self, mock_fetch_remote) -> None:
+        def fetch_remote(endpoint: str) -> dict:
+            if endpoint != "pokemon/1/":
+                raise PokeAPIError(endpoint)
+            return _raw_pokemon(1, "bulbasaur", "grass")
+
+        mock_fetch_remote.side_effect = fetch_remote
+
+        with self.assertRaises(PokeAPIError):
+            get_pokemon_many([1, 2])
+        self.assertEqual([item["id"] for item in get_pokemon_many([1, 2], skip_errors=True)], [1])
+
+    @patch("api.pokeapi_service._fetch_remote")
+    def test_get_pokemon_many_timeout_leaves_slow_fetches_out(self, mock_fetch_remote) -> None:
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def fetch_remote(endpoint: str) -> dict:
+            if endpoint == "pokemon/2/":
+                release.wait(5)
+            return _raw_pokemon(int(endpoint.split("/")[1]), "pokemon", "normal")
+
+        mock_fetch_remote.side_effect = fetch_remote
+
+        started = time.monotonic()
+        results = get_pokemon_many([1, 2], skip_errors=True, timeout=0.2)
+
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual([item["id"] for item in results], [1])
+
+    @patch("api.pokeapi_service._fetch_remote")
+    async def test_aget_pokemon_many_gathers_misses(self, mock_fetch_remote) -> None:
+        mock_fetch_remote.side_effect = lambda endpoint: {
+            "pokemon/1/": _raw_pokemon(1, "bulbasaur", "grass"),
+            "pokemon/4/": _raw_pokemon(4, "charmander", "fire"),
+        }[endpoint]
+
+        results = await aget_pokemon_many([4, 1])
+
+        self.assertEqual([item["name"] for item in results], ["charmander", "bulbasaur"])
+        self.assertEqual(mock_fetch_remote.call_count, 2)
+        self.assertEqual(await Pokemon.objects.acount(), 2)
 
 
 class TeamSerializerTests(SimpleTestCase):
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import requests
+from django.test import SimpleTestCase
+
+from api.pokeapi_service import PokeAPIError, _request_json
+from api.upstream_guard import CLOSED, HALF_OPEN, OPEN, AdaptiveLimiter, CircuitBreaker, TokenBucket
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.now = 0.0
+        self.breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=lambda: self.now)
+
+    def test_opens_after_consecutive_failures_and_probes_after_timeout(self) -> None:
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertFalse(self.breaker.allow())
+
+        self.now = 30
+        self.assertTrue(self.breaker.allow())
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertFalse(self.breaker.allow())  # uma única sonda por vez
+
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+        self.now = 60
+        self.breaker.allow()
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+
+
+class AdaptiveLimiterTests(SimpleTestCase):
+    def test_halves_on_overload_and_grows_back_additively(self) -> None:
+        limiter = AdaptiveLimiter(initial=8, maximum=8, latency_target=1.0)
+
+        limiter.acquire()
+        limiter.release(latency=0.1, overloaded=True)
+        limiter.acquire()
+        limiter.release(latency=5.0)
+        self.assertEqual(limiter.limit, 2)
+
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release(latency=0.1)
+        self.assertEqual(limiter.limit, 3)
+
+    def test_acquire_times_out_when_every_slot_is_taken(self) -> None:
+        limiter = AdaptiveLimiter(initial=1, maximum=1)
+        self.assertTrue(limiter.acquire(0))
+        self.assertFalse(limiter.acquire(0.01))
+
+        threading.Timer(0.05, limiter.release).start()
+        self.assertTrue(limiter.acquire(1))
+
+
+class TokenBucketTests(SimpleTestCase):
+    def test_grants_within_budget_and_refills_over_time(self) -> None:
+        now = [0.0]
+        bucket = TokenBucket(rate=10, per=60, clock=lambda: now[0])
+
+        self.assertEqual(bucket.take(8), 8)
+        self.assertEqual(bucket.take(8), 2)
+        self.assertEqual(bucket.take(1), 0)
+
+        now[0] = 30
+        self.assertEqual(bucket.take(20), 5)
+
+
+class GuardedRequestTests(SimpleTestCase):
+    @patch("api.pokeapi_service.LIMITER", new_callable=lambda: AdaptiveLimiter(initial=4, maximum=4))
+    @patch("api.pokeapi_service.BREAKER", new_callable=lambda: CircuitBreaker(failure_threshold=2))
+    @patch("api.pokeapi_service.SESSION")
+    def test_open_circuit_fails_fast_without_calling_pokeapi(self, mock_session, _breaker, limiter) -> None:
+        mock_session.get.side_effect = requests.ConnectionError("down")
+
+        for _ in range(2):
+            with self.assertRaises(PokeAPIError):
+                _request_json("pokemon/1/")
+        with self.assertRaisesMessage(PokeAPIError, "circuito aberto"):
+            _request_json("pokemon/1/")
+
+        self.assertEqual(mock_session.get.call_count, 2)
+        self.assertEqual(limiter.limit, 1)
+
+    @patch("api.pokeapi_service.LIMITER", new_callable=lambda: AdaptiveLimiter(initial=4, maximum=4))
+    @patch("api.pokeapi_service.BREAKER", new_callable=lambda: CircuitBreaker(failure_threshold=2))
+    def test_rate_limited_answer_is_not_retried_by_the_session(self, breaker, limiter) -> None:
+        hits: list[str] = []
+
+        class Upstream(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                hits.append(self.path)
+                self.send_response(429)
+                self.send_header("Retry-After", "30")
+                self.end_headers()
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Upstream)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        with patch("api.pokeapi_service.POKEAPI_BASE_URL", f"http://127.0.0.1:{server.server_port}"):
+            with self.assertRaises(PokeAPIError):
+                _request_json("pokemon/1/")
+
+        # Quem recua é o limitador/disjuntor, não um novo GET 0,5s depois
+        self.assertEqual(hits, ["/pokemon/1/"])
+        self.assertEqual(limiter.limit, 2)
+        self.assertEqual(breaker.state, CLOSED)
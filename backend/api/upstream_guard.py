@@ -0,0 +1,127 @@
+"""Proteções do cliente da PokéAPI: circuit breaker e limite adaptativo de concorrência."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Classic three-state breaker shared by every thread of the process.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    ``allow`` rejects calls for ``reset_timeout`` seconds; then a single probe
+    is let through (half-open) and its outcome closes or reopens the circuit.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now (claims the probe when half-open)."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self._state = HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = self._clock()
+
+
+class AdaptiveLimiter:
+    """AIMD limit on concurrent upstream calls.
+
+    Every healthy, fast response raises the limit by ``1/limit`` (about one
+    slot per round of calls); a 429/5xx, a network error or a response
+    slower than ``latency_target`` halves it, down to ``minimum``.
+    """
+
+    def __init__(self, *, initial: int, maximum: int, minimum: int = 1, latency_target: float = 2.0) -> None:
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.latency_target = latency_target
+        self._limit = float(min(max(initial, self.minimum), self.maximum))
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        with self._condition:
+            return int(self._limit)
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Wait for a free slot; ``False`` if none freed up within ``timeout``."""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._in_flight < int(self._limit), timeout):
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self, *, latency: float | None = None, overloaded: bool = False) -> None:
+        """Free a slot; without ``latency`` (nothing was sent) the limit is left as is."""
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded or (latency is not None and latency > self.latency_target):
+                self._limit = max(float(self.minimum), self._limit / 2)
+            elif latency is not None:
+                self._limit = min(float(self.maximum), self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+
+class TokenBucket:
+    """Budget of ``rate`` upstream calls per ``per`` seconds, refilled continuously.
+
+    Used by optional background work (prefetch) so it never competes with
+    requests for more than a fixed share of PokéAPI.
+    """
+
+    def __init__(self, *, rate: float, per: float = 60.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.capacity = max(0.0, rate)
+        self._refill = self.capacity / per if per > 0 else 0.0
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def take(self, amount: int) -> int:
+        """Grant up to ``amount`` whole tokens and return how many were granted."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._refill)
+            self._updated = now
+            granted = max(0, min(amount, int(self._tokens)))
+            self._tokens -= granted
+            return granted
@@ -5,7 +5,11 @@ from django.urls import path
 from .views import (
     FavoriteDestroyView,
     FavoriteListCreateView,
+    PokemonBatchView,
+    PokemonDetailView,
     PokemonListView,
+    PokemonSearchView,
+    SpriteView,
     TeamListView,
     TeamSetView,
 )
@@ -14,6 +18,10 @@ app_name = "api"
 
 urlpatterns = [
     path("pokemon/", PokemonListView.as_view(), name="pokemon-list"),
+    path("pokemon/search/", PokemonSearchView.as_view(), name="pokemon-search"),
+    path("pokemon/batch/", PokemonBatchView.as_view(), name="pokemon-batch"),
+    path("pokemon/<int:pokemon_id>/", PokemonDetailView.as_view(), name="pokemon-detail"),
+    path("sprites/<int:pokemon_id>/<str:size>/", SpriteView.as_view(), name="pokemon-sprite"),
     path("favorites/", FavoriteListCreateView.as_view(), name="favorite-list"),
     path("favorites/<int:pk>/", FavoriteDestroyView.as_view(), name="favorite-detail"),
     path("team/", TeamListView.as_view(), name="team-list"),
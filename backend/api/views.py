@@ -1,120 +1,501 @@
 from __future__ import annotations
 
+import json
 import logging
+import os
+from typing import Any, Dict, Iterable, List
+from urllib.parse import urlencode
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.db import IntegrityError, transaction
+from django.http import FileResponse, HttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import status
-from rest_framework.exceptions import APIException, ValidationError
-from rest_framework.generics import DestroyAPIView, ListAPIView, ListCreateAPIView
+from rest_framework.exceptions import APIException, NotFound, ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import BaseRenderer
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
+from .async_views import AsyncAPIView
+from .conditional import add_cache_headers, compute_etag, not_modified
+from .list_cache import aget_page, aset_page, is_complete, list_cache_key
 from .models import Favorite, TeamSlot
-from .pokeapi_service import PokeAPIError, list_pokemon
-from .serializers import FavoriteSerializer, TeamSetSerializer, TeamSlotSerializer
+from . import sprite_cache
+from .pagination import OptionalPageNumberPagination
+from .pokedex_table import STAT_COLUMNS
+from .pokeapi_service import (
+    DETAIL_FIELDS,
+    PokeAPIError,
+    acatalog_version,
+    aget_pokemon_many,
+    alist_pokemon,
+    get_global_catalog,
+    get_name_index,
+    get_pokemon_detail,
+    get_sprite_file,
+    normalize_detail_fields,
+    normalize_list_filters,
+)
+from .renderers import FastJSONRenderer
+from .serializers import (
+    FavoriteSerializer,
+    PokemonBatchSerializer,
+    PokemonDetailSerializer,
+    PokemonSearchSerializer,
+    TeamSetSerializer,
+    TeamSlotSerializer,
+)
 
 logger = logging.getLogger(__name__)
 
+BATCH_MAX_IDS = int(os.environ.get("POKEMON_BATCH_MAX_IDS", "200"))
+# Miniatura usada nos cards quando POKEMON_SPRITE_PROXY está ligado
+LIST_SPRITE_SIZE = "96"
+# A URL não carrega o digest (só o blob em disco), então o cache é curto e revalida pelo ETag
+SPRITE_MAX_AGE = 24 * 60 * 60
 
-class PokemonListView(APIView):
+
+async def _hydrate(pokemon_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """Fetch every Pokémon referenced by a collection in one async bulk call."""
+    records = await aget_pokemon_many(list(pokemon_ids), skip_errors=True)
+    return {record["id"]: record for record in records}
+
+
+async def _serialize(serializer) -> Any:
+    """Serialize off the event loop.
+
+    Favorite/team list serializers hydrate every row's Pokémon in one bulk
+    call (``PokemonHydratingListSerializer``), which may wait on PokéAPI.
+    """
+    return await sync_to_async(lambda: serializer.data, thread_sensitive=False)()
+
+
+def _page_link(path: str, filters: Dict[str, Any], cursor: str | None) -> str | None:
+    """Relative link to another page of the list, built from the normalized filters.
+
+    It does not depend on the host or on extra query params, so the cached
+    body can be shared by every request with the same filters.
+    """
+    if cursor is None:
+        return None
+    query: Dict[str, Any] = {
+        "generation": filters["generation"],
+        "name": filters["name"],
+        "type": filters["type"],
+        "ordering": ",".join(filters["ordering"]),
+    }
+    for stat, (low, high) in filters["stats"].items():
+        query[f"min_{stat}"], query[f"max_{stat}"] = low, high
+    query.update(limit=filters["limit"], cursor=cursor)
+    return f"{path}?{urlencode({key: value for key, value in query.items() if value not in (None, '')})}"
+
+
+def _proxied_sprite(pokemon: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of ``pokemon`` whose sprite points at the local thumbnail proxy."""
+    if not pokemon.get("sprite"):
+        return pokemon
+    return {**pokemon, "sprite": reverse("api:pokemon-sprite", args=[pokemon["id"], LIST_SPRITE_SIZE])}
+
+
+def _columnar(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """List page with ``results`` turned into one array per field (``columns``).
+
+    Keys repeated on every row are sent once, and ``stats`` is flattened into
+    one column per stat.
+    """
+    results = payload.get("results", [])
+    columns: Dict[str, List[Any]] = {
+        field: [pokemon.get(field) for pokemon in results] for field in ("id", "name", "types", "sprite")
+    }
+    for stat in STAT_COLUMNS:
+        columns[stat] = [(pokemon.get("stats") or {}).get(stat) for pokemon in results]
+    for flag in ("placeholder", "is_favorite", "is_in_team"):
+        if any(flag in pokemon for pokemon in results):
+            columns[flag] = [pokemon.get(flag, False) for pokemon in results]
+    page = {key: value for key, value in payload.items() if key != "results"}
+    return {**page, "columns": columns}
+
+
+class PokemonListView(AsyncAPIView):
     permission_classes = [AllowAny]
 
-    def get(self, request, *args, **kwargs):
+    async def get(self, request, *args, **kwargs):
         params = request.query_params
-        filters = {
-            "generation": params.get("generation"),
-            "name": params.get("name"),
-            "type": params.get("type"),
-            "limit": params.get("limit", 20),
-            "offset": params.get("offset", 0),
-        }
-        logger.info("pokemon.list.request", extra={"event": "pokemon.list.request", "extra_data": filters})
         try:
-            payload = list_pokemon(
-                generation=filters["generation"],
-                name=filters["name"],
-                type=filters["type"],
-                limit=filters["limit"],
-                offset=filters["offset"],
+            filters = normalize_list_filters(
+                generation=params.get("generation"),
+                name=params.get("name"),
+                type=params.get("type"),
+                stats={
+                    stat: (params.get(f"min_{stat}"), params.get(f"max_{stat}"))
+                    for stat in STAT_COLUMNS
+                },
+                ordering=params.get("ordering"),
+                limit=params.get("limit", 20),
+                offset=params.get("offset", 0),
+                cursor=params.get("cursor"),
             )
+        except PokeAPIError as exc:
+            raise ValidationError({"detail": str(exc)}) from exc
+        # ?shape=columns: mesmo conteúdo em colunas, bem menor para listas longas
+        columnar = params.get("shape") == "columns"
+        logger.info("pokemon.list.request", extra={"event": "pokemon.list.request", "extra_data": filters})
 
-            # Se usuário logado, adicionar informações de favoritos e equipe
-            if request.user.is_authenticated:
-                user_favorites = set(
-                    Favorite.objects.filter(user=request.user).values_list("pokemon_id", flat=True)
+        user_favorites: set[int] = set()
+        user_team: set[int] = set()
+        authenticated = request.user.is_authenticated
+        if authenticated:
+            user_favorites = {
+                pokemon_id
+                async for pokemon_id in Favorite.objects.filter(user=request.user).values_list(
+                    "pokemon_id", flat=True
                 )
-                user_team = set(
-                    TeamSlot.objects.filter(user=request.user).values_list("pokemon_id", flat=True)
+            }
+            user_team = {
+                pokemon_id
+                async for pokemon_id in TeamSlot.objects.filter(user=request.user).values_list(
+                    "pokemon_id", flat=True
+                )
+            }
+
+        # Validado antes de montar a página: um 304 não hidrata nenhum Pokémon
+        version = await acatalog_version()
+        etag = compute_etag(
+            "pokemon-list-columns" if columnar else "pokemon-list",
+            version["version"],
+            filters,
+            sorted(user_favorites),
+            sorted(user_team),
+        )
+        cached = not_modified(request, etag, private=authenticated, last_modified=version["modified"])
+        if cached is not None:
+            return cached
+
+        # O corpo serializado é compartilhado entre anônimos e usuários logados
+        cache_key = list_cache_key(version["version"], filters)
+        page = await aget_page(cache_key)
+        partial = False
+        if page is None:
+            try:
+                payload = await alist_pokemon(**filters)
+            except PokeAPIError as exc:
+                logger.error(
+                    "pokemon.list.error",
+                    extra={"event": "pokemon.list.error", "extra_data": filters},
+                    exc_info=True,
                 )
+                raise APIException(str(exc)) from exc
+            if settings.POKEMON_SPRITE_PROXY:
+                payload["results"] = [_proxied_sprite(pokemon) for pokemon in payload["results"]]
+            payload["next"] = _page_link(request.path, filters, payload.get("next"))
+            payload["previous"] = _page_link(request.path, filters, payload.get("previous"))
+            count, body = payload.get("count", 0), FastJSONRenderer().render(payload)
+            partial = bool(payload.get("partial"))
+            if is_complete(payload, filters):
+                await aset_page(cache_key, count, body)
+        else:
+            count, body = page
+
+        logger.info(
+            "pokemon.list.success",
+            extra={
+                "event": "pokemon.list.success",
+                "extra_data": {"count": count, "cached": page is not None, "partial": partial},
+            },
+        )
 
-                # Adicionar informações aos pokémon
+        renderer = request.accepted_renderer
+        # Os bytes em cache são o JSON compacto: só anônimos sem ``; indent=`` os recebem como estão
+        if (
+            authenticated
+            or columnar
+            or renderer.format != "json"
+            or renderer.get_indent(request.accepted_media_type, {}) is not None
+        ):
+            payload = json.loads(body)
+            # Se usuário logado, adicionar informações de favoritos e equipe
+            if authenticated:
                 for pokemon in payload.get("results", []):
                     pokemon_id = pokemon.get("id")
-                    if pokemon_id:
-                        pokemon["is_favorite"] = pokemon_id in user_favorites
-                        pokemon["is_in_team"] = pokemon_id in user_team
-                    else:
-                        pokemon["is_favorite"] = False
-                        pokemon["is_in_team"] = False
+                    pokemon["is_favorite"] = pokemon_id in user_favorites
+                    pokemon["is_in_team"] = pokemon_id in user_team
+            response = Response(_columnar(payload) if columnar else payload)
+        else:
+            response = HttpResponse(body, content_type="application/json")
+        if partial:
+            # Placeholders são preenchidos em background: nada de ETag nem cache
+            patch_cache_control(response, no_store=True)
+            return response
+        return add_cache_headers(response, etag, private=authenticated, last_modified=version["modified"])
+
+
+class PokemonSearchView(AsyncAPIView):
+    """Autocomplete por nome: só ``id`` e ``name``, sem hidratar Pokémon."""
+
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        operation_id="pokemon_search",
+        parameters=[
+            OpenApiParameter("q", OpenApiTypes.STR, description="Trecho do nome."),
+            OpenApiParameter("limit", OpenApiTypes.INT, description="Máximo de resultados (1-50, padrão 10)."),
+            OpenApiParameter("fuzzy", OpenApiTypes.BOOL, description="Aceita nomes com pequenos erros de digitação."),
+        ],
+        responses=PokemonSearchSerializer,
+    )
+    async def get(self, request, *args, **kwargs):
+        params = request.query_params
+        query = (params.get("q") or "").strip().lower()
+        try:
+            limit = max(1, min(int(params.get("limit", 10)), 50))
+        except (TypeError, ValueError):
+            limit = 10
+        fuzzy = params.get("fuzzy", "").lower() in {"1", "true"}
 
+        version = await acatalog_version()
+        etag = compute_etag("pokemon-search", version["version"], query, limit, fuzzy)
+        cached = not_modified(request, etag, private=False, last_modified=version["modified"])
+        if cached is not None:
+            return cached
+
+        try:
+            index = await sync_to_async(get_name_index, thread_sensitive=False)()
         except PokeAPIError as exc:
-            logger.error(
-                "pokemon.list.error",
-                extra={"event": "pokemon.list.error", "extra_data": filters},
-                exc_info=True,
-            )
             raise APIException(str(exc)) from exc
+        results = index.search(query, limit=limit, fuzzy=fuzzy)
+        return add_cache_headers(
+            Response({"results": results}), etag, private=False, last_modified=version["modified"]
+        )
+
+
+class PokemonBatchView(AsyncAPIView):
+    """Detalhes de um conjunto arbitrário de Pokémon (``?ids=1,4,7``) em uma única resposta."""
+
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        operation_id="pokemon_batch",
+        parameters=[
+            OpenApiParameter(
+                "ids",
+                OpenApiTypes.STR,
+                required=True,
+                description=f"Ids separados por vírgula (máx. {BATCH_MAX_IDS}); ausentes do catálogo vão em missing.",
+            ),
+        ],
+        responses=PokemonBatchSerializer,
+    )
+    async def get(self, request, *args, **kwargs):
+        raw_ids = [value for param in request.query_params.getlist("ids") for value in param.split(",")]
+        try:
+            pokemon_ids = list(dict.fromkeys(int(value) for value in raw_ids if value.strip()))
+        except ValueError as exc:
+            raise ValidationError({"ids": ["Informe ids inteiros separados por vírgula."]}) from exc
+        if not pokemon_ids or any(pokemon_id < 1 for pokemon_id in pokemon_ids):
+            raise ValidationError({"ids": ["Informe ao menos um id positivo."]})
+        if len(pokemon_ids) > BATCH_MAX_IDS:
+            raise ValidationError({"ids": [f"No máximo {BATCH_MAX_IDS} ids por requisição."]})
+
+        version = await acatalog_version()
+        etag = compute_etag("pokemon-batch", version["version"], pokemon_ids)
+        cached = not_modified(request, etag, private=False, last_modified=version["modified"])
+        if cached is not None:
+            return cached
+
+        try:
+            catalog = await sync_to_async(get_global_catalog, thread_sensitive=False)()
+        except PokeAPIError as exc:
+            raise APIException(str(exc)) from exc
+        # Ids fora do catálogo vão direto para ``missing``, sem chamada à PokéAPI
+        known_ids = [pokemon_id for pokemon_id in pokemon_ids if pokemon_id in catalog]
+        # Um get_many no cache e os ausentes buscados em paralelo na PokéAPI
+        pokemon = await _hydrate(known_ids)
+        missing = [pokemon_id for pokemon_id in pokemon_ids if pokemon_id not in pokemon]
+        failed = [pokemon_id for pokemon_id in known_ids if pokemon_id not in pokemon]
         logger.info(
-            "pokemon.list.success",
+            "pokemon.batch.success",
             extra={
-                "event": "pokemon.list.success",
-                "extra_data": {"count": payload.get("count", 0)},
+                "event": "pokemon.batch.success",
+                "extra_data": {"requested": len(pokemon_ids), "missing": len(missing), "failed": len(failed)},
             },
         )
-        return Response(payload)
+        results = [pokemon[pokemon_id] for pokemon_id in pokemon_ids if pokemon_id in pokemon]
+        response = Response({"results": results, "missing": missing})
+        if failed:
+            # Falhas podem ser temporárias: não deixa o CDN guardar a resposta incompleta
+            return response
+        return add_cache_headers(response, etag, private=False, last_modified=version["modified"])
 
 
-class FavoriteListCreateView(ListCreateAPIView):
+class PokemonDetailView(AsyncAPIView):
+    """Detalhe de um Pokémon; ``?fields=stats,abilities,evolution`` busca só os recursos extras pedidos."""
+
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        operation_id="pokemon_detail",
+        parameters=[
+            OpenApiParameter(
+                "fields",
+                OpenApiTypes.STR,
+                description=f"Campos extras separados por vírgula: {', '.join(DETAIL_FIELDS)}.",
+            ),
+        ],
+        responses=PokemonDetailSerializer,
+    )
+    async def get(self, request, pokemon_id: int, *args, **kwargs):
+        try:
+            fields = normalize_detail_fields(request.query_params.get("fields"))
+        except PokeAPIError as exc:
+            raise ValidationError({"fields": [str(exc)]}) from exc
+
+        version = await acatalog_version()
+        etag = compute_etag("pokemon-detail", version["version"], pokemon_id, fields)
+        cached = not_modified(request, etag, private=False, last_modified=version["modified"])
+        if cached is not None:
+            return cached
+
+        try:
+            if pokemon_id not in await sync_to_async(get_global_catalog, thread_sensitive=False)():
+                raise NotFound()
+            detail = await sync_to_async(get_pokemon_detail, thread_sensitive=False)(pokemon_id, fields)
+        except PokeAPIError as exc:
+            logger.error(
+                "pokemon.detail.error",
+                extra={"event": "pokemon.detail.error", "extra_data": {"id": pokemon_id, "fields": fields}},
+                exc_info=True,
+            )
+            raise APIException(str(exc)) from exc
+        return add_cache_headers(Response(detail), etag, private=False, last_modified=version["modified"])
+
+
+class PNGRenderer(BaseRenderer):
+    """Lets ``Accept: image/*`` pass content negotiation; the body is already PNG bytes."""
+
+    media_type = "image/png"
+    format = "png"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return data if isinstance(data, bytes) else b""
+
+
+class SpriteView(AsyncAPIView):
+    """Arte de um Pokémon baixada uma vez e servida do disco (``full``, ``256`` ou ``96`` px)."""
+
+    permission_classes = [AllowAny]
+    renderer_classes = [FastJSONRenderer, PNGRenderer]
+
+    @extend_schema(operation_id="pokemon_sprite", responses={(200, "image/png"): OpenApiTypes.BINARY})
+    async def get(self, request, pokemon_id: int, size: str, *args, **kwargs):
+        if size not in sprite_cache.SIZES:
+            raise ValidationError({"size": [f"Use um de: {', '.join(sprite_cache.SIZES)}."]})
+
+        try:
+            if pokemon_id not in await sync_to_async(get_global_catalog, thread_sensitive=False)():
+                raise NotFound()
+            path = await sync_to_async(get_sprite_file, thread_sensitive=False)(pokemon_id, size)
+        except PokeAPIError as exc:
+            logger.error(
+                "pokemon.sprite.error",
+                extra={"event": "pokemon.sprite.error", "extra_data": {"id": pokemon_id, "size": size}},
+                exc_info=True,
+            )
+            raise APIException(str(exc)) from exc
+
+        etag = f'"{path.stem}"'
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = FileResponse(path.open("rb"), content_type="image/png")
+        response["ETag"] = etag
+        patch_cache_control(response, public=True, max_age=SPRITE_MAX_AGE)
+        return response
+
+
+class FavoriteListCreateView(AsyncAPIView):
     serializer_class = FavoriteSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = None
+    pagination_class = OptionalPageNumberPagination
 
     def get_queryset(self):
         return Favorite.objects.filter(user=self.request.user).order_by("pokemon_id", "id")
 
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        context.update({"request": self.request})
-        return context
+    async def get(self, request, *args, **kwargs):
+        rows = [row async for row in self.get_queryset().values_list("id", "pokemon_id")]
+        version = await acatalog_version()
+        etag = compute_etag(
+            "favorites", version["version"], rows,
+            request.query_params.get("page"), request.query_params.get("page_size"),
+        )
+        cached = not_modified(request, etag, private=True)
+        if cached is not None:
+            return cached
+
+        paginator = self.pagination_class()
+        page = await sync_to_async(paginator.paginate_queryset)(self.get_queryset(), request, view=self)
+        favorites: List[Favorite] = (
+            page if page is not None else [favorite async for favorite in self.get_queryset()]
+        )
+        # Só os Pokémon da página são hidratados, em uma única chamada em lote
+        data = await _serialize(FavoriteSerializer(favorites, many=True, context={"request": request}))
+        if page is not None:
+            response = paginator.get_paginated_response(data)
+        else:
+            response = Response(data)
+        return add_cache_headers(response, etag, private=True)
+
+    async def post(self, request, *args, **kwargs):
+        serializer = FavoriteSerializer(data=request.data, context={"request": request})
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        favorite = await sync_to_async(serializer.save)()
+        data = await _serialize(FavoriteSerializer(favorite, context={"request": request}))
+        return Response(data, status=status.HTTP_201_CREATED)
 
 
-class FavoriteDestroyView(DestroyAPIView):
+class FavoriteDestroyView(AsyncAPIView):
     serializer_class = FavoriteSerializer
     permission_classes = [IsAuthenticated]
 
-    def get_queryset(self):
-        return Favorite.objects.filter(user=self.request.user).order_by("pokemon_id", "id")
+    async def delete(self, request, pk: int, *args, **kwargs):
+        deleted, _ = await Favorite.objects.filter(user=request.user, pk=pk).adelete()
+        if not deleted:
+            raise NotFound()
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class TeamListView(ListAPIView):
+class TeamListView(AsyncAPIView):
     serializer_class = TeamSlotSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = None
 
-    def get_queryset(self):
-        return TeamSlot.objects.filter(user=self.request.user).order_by("slot", "id")
+    async def get(self, request, *args, **kwargs):
+        slots: List[TeamSlot] = [
+            slot async for slot in TeamSlot.objects.filter(user=request.user).order_by("slot", "id")
+        ]
+        version = await acatalog_version()
+        etag = compute_etag(
+            "team", version["version"], [(slot.id, slot.slot, slot.pokemon_id) for slot in slots]
+        )
+        cached = not_modified(request, etag, private=True)
+        if cached is not None:
+            return cached
+
+        data = await _serialize(TeamSlotSerializer(slots, many=True, context={"request": request}))
+        return add_cache_headers(Response(data), etag, private=True)
 
 
-class TeamSetView(APIView):
+class TeamSetView(AsyncAPIView):
     permission_classes = [IsAuthenticated]
 
-    def post(self, request, *args, **kwargs):
+    async def post(self, request, *args, **kwargs):
         serializer = TeamSetSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         pokemon_ids = serializer.validated_data["pokemon_ids"]
-        user = request.user
 
         logger.info(
             "team.update.request",
@@ -124,6 +505,20 @@ class TeamSetView(APIView):
             },
         )
 
+        slots = await sync_to_async(self._replace_team)(request.user, pokemon_ids)
+        data = await _serialize(TeamSlotSerializer(slots, many=True, context={"request": request}))
+
+        logger.info(
+            "team.update.success",
+            extra={
+                "event": "team.update.success",
+                "extra_data": {"count": len(slots)},
+            },
+        )
+        return Response(data, status=status.HTTP_200_OK)
+
+    @staticmethod
+    def _replace_team(user, pokemon_ids: List[int]) -> List[TeamSlot]:
         with transaction.atomic():
             TeamSlot.objects.filter(user=user).delete()
 
@@ -146,15 +541,4 @@ class TeamSetView(APIView):
                         {"pokemon_ids": ["Equipe inválida. Verifique duplicatas ou slots fora do intervalo 1..6."]}
                     ) from exc
 
-        queryset = TeamSlot.objects.filter(user=user).order_by("slot", "id")
-        response_serializer = TeamSlotSerializer(queryset, many=True)
-        team_size = queryset.count()
-
-        logger.info(
-            "team.update.success",
-            extra={
-                "event": "team.update.success",
-                "extra_data": {"count": team_size},
-            },
-        )
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
+        return list(TeamSlot.objects.filter(user=user).order_by("slot", "id"))
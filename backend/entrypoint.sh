@@ -10,6 +10,15 @@ echo "Working directory: $(pwd)"
 echo "Running database migrations..."
 python manage.py migrate --noinput
 
+# Tabela do cache L2 (apenas quando CACHE_BACKEND=db; nos demais é no-op)
+python manage.py createcachetable
+
+# Snapshot offline do Pokédex (incremental); uma falha não impede a subida da API
+if [ "${POKEDEX_SYNC_ON_START:-0}" = "1" ]; then
+    echo "Syncing Pokédex snapshot..."
+    python manage.py pokedex_sync || echo "pokedex_sync failed — serving from the existing snapshot"
+fi
+
 echo "Collecting static files..."
 python manage.py collectstatic --noinput --clear
 
@@ -0,0 +1,142 @@
+"""Tiered cache backend: per-process L1 in front of a shared L2."""
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Tuple
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+from .request_context import get_metrics
+
+_MISSING = object()
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0})
+
+
+def _record(tier: str, hits: int = 0, misses: int = 0) -> None:
+    with _stats_lock:
+        _stats[tier]["hits"] += hits
+        _stats[tier]["misses"] += misses
+    metrics = get_metrics()
+    if metrics is not None:
+        metrics.add_cache(tier, hits=hits, misses=misses)
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """Return a snapshot of the hit/miss counters of every tier in this process."""
+    with _stats_lock:
+        return {tier: dict(counters) for tier, counters in _stats.items()}
+
+
+class TieredCache(BaseCache):
+    """Read-through L1 → L2 cache built from two configured cache aliases.
+
+    ``OPTIONS`` takes ``L1`` (usually a small LocMemCache, which evicts in LRU
+    order once ``MAX_ENTRIES`` is reached), an optional ``L2`` (file, Redis or
+    database backend shared by every worker) and ``L1_TIMEOUT``, which caps how
+    long an entry may live in L1 so workers converge on the L2 copy. Without an
+    L2 the L1 is the cache of record and keeps the caller's timeout. Hits on L2
+    are copied back into L1.
+    """
+
+    def __init__(self, location: str, params: Dict[str, Any]) -> None:
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._aliases: List[Tuple[str, str]] = [
+            (tier, options[tier]) for tier in ("L1", "L2") if options.get(tier)
+        ]
+        self._l1_timeout = int(options.get("L1_TIMEOUT", 300))
+
+    @property
+    def _tiers(self) -> List[Tuple[str, BaseCache]]:
+        return [(tier.lower(), caches[alias]) for tier, alias in self._aliases]
+
+    def _timeout_for(self, tier: str, timeout: Any) -> Any:
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        if tier != "l1" or len(self._aliases) == 1:
+            return timeout
+        return self._l1_timeout if timeout is None else min(timeout, self._l1_timeout)
+
+    def get(self, key: str, default: Any = None, version: int | None = None) -> Any:
+        tiers = self._tiers
+        for index, (tier, backend) in enumerate(tiers):
+            value = backend.get(key, _MISSING, version=version)
+            if value is _MISSING:
+                _record(tier, misses=1)
+                continue
+            _record(tier, hits=1)
+            for upper_tier, upper in tiers[:index]:
+                upper.set(key, value, self._timeout_for(upper_tier, DEFAULT_TIMEOUT), version=version)
+            return value
+        return default
+
+    def get_many(self, keys: Iterable[str], version: int | None = None) -> Dict[str, Any]:
+        pending = list(keys)
+        found: Dict[str, Any] = {}
+        tiers = self._tiers
+        for index, (tier, backend) in enumerate(tiers):
+            if not pending:
+                break
+            values = backend.get_many(pending, version=version)
+            _record(tier, hits=len(values), misses=len(pending) - len(values))
+            if values:
+                for upper_tier, upper in tiers[:index]:
+                    upper.set_many(values, self._timeout_for(upper_tier, DEFAULT_TIMEOUT), version=version)
+                found.update(values)
+                pending = [key for key in pending if key not in values]
+        return found
+
+    def set(self, key: str, value: Any, timeout: Any = DEFAULT_TIMEOUT, version: int | None = None) -> None:
+        for tier, backend in self._tiers:
+            backend.set(key, value, self._timeout_for(tier, timeout), version=version)
+
+    def set_many(
+        self, data: Dict[str, Any], timeout: Any = DEFAULT_TIMEOUT, version: int | None = None
+    ) -> List[str]:
+        failed: List[str] = []
+        for tier, backend in self._tiers:
+            failed.extend(backend.set_many(data, self._timeout_for(tier, timeout), version=version))
+        return list(dict.fromkeys(failed))
+
+    def add(self, key: str, value: Any, timeout: Any = DEFAULT_TIMEOUT, version: int | None = None) -> bool:
+        # O tier mais baixo (compartilhado) decide atomicamente entre processos
+        tiers = self._tiers
+        last_tier, last = tiers[-1]
+        added = last.add(key, value, self._timeout_for(last_tier, timeout), version=version)
+        if added:
+            for tier, backend in tiers[:-1]:
+                backend.set(key, value, self._timeout_for(tier, timeout), version=version)
+        return added
+
+    def touch(self, key: str, timeout: Any = DEFAULT_TIMEOUT, version: int | None = None) -> bool:
+        touched = False
+        for tier, backend in self._tiers:
+            touched = backend.touch(key, self._timeout_for(tier, timeout), version=version)
+        return touched
+
+    def delete(self, key: str, version: int | None = None) -> bool:
+        deleted = False
+        for _tier, backend in self._tiers:
+            deleted = backend.delete(key, version=version) or deleted
+        return deleted
+
+    def delete_many(self, keys: Iterable[str], version: int | None = None) -> None:
+        key_list = list(keys)
+        for _tier, backend in self._tiers:
+            backend.delete_many(key_list, version=version)
+
+    def has_key(self, key: str, version: int | None = None) -> bool:
+        return any(backend.has_key(key, version=version) for _tier, backend in self._tiers)
+
+    def clear(self) -> None:
+        for _tier, backend in self._tiers:
+            backend.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters for the tiers of this backend."""
+        snapshot = cache_stats()
+        return {tier: snapshot.get(tier, {"hits": 0, "misses": 0}) for tier, _backend in self._tiers}
@@ -26,7 +26,7 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
 
-        for key in ("method", "path", "event", "status_code", "extra_data"):
+        for key in ("method", "path", "event", "status_code", "metrics", "extra_data"):
             value = getattr(record, key, None)
             if value is not None:
                 payload[key] = value
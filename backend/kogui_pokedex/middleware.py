@@ -2,26 +2,72 @@
 from __future__ import annotations
 
 import logging
+import os
+import re
+import time
 import uuid
 from typing import Callable
 
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
 from django.http import HttpRequest, HttpResponse
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
 
-from .request_context import clear_request_id, set_request_id
+from .request_context import clear_metrics, clear_request_id, get_metrics, set_request_id, start_metrics
+
+try:  # brotli é opcional: sem ele a resposta cai para gzip
+    import brotli
+except ImportError:  # pragma: no cover - depende do ambiente
+    brotli = None
 
 logger = logging.getLogger(__name__)
 
+# Qualidade 4-5 comprime JSON melhor que gzip -6 gastando CPU parecida
+BROTLI_QUALITY = int(os.environ.get("BROTLI_QUALITY", "5"))
+_ACCEPTS_BROTLI = re.compile(r"\bbr\b")
+# Só payloads públicos do Pokédex: nada de tokens (JWT, reset de senha) em resposta comprimida (BREACH)
+COMPRESSED_PATH_PREFIXES = ("/api/pokemon/",)
+
+
+def _timed_query(execute, sql, params, many, context):
+    """Database execute wrapper that charges each query to the current request."""
+    metrics = get_metrics()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.add_query(time.perf_counter() - started)
+
+
+def _install_query_timer(connection, **kwargs) -> None:
+    if _timed_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_timed_query)
+
 
 class RequestIDMiddleware:
-    """Attach a request id to every request and response."""
+    """Attach a request id to every request and response.
+
+    It also accounts for where the request spent its time (database, cache
+    tiers, PokéAPI). The totals go to the ``request.completed`` log and to a
+    ``Server-Timing`` header when ``SERVER_TIMING`` is enabled.
+    """
 
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
         self.get_response = get_response
+        # Conexões abertas depois (pool da PokéAPI, sync_to_async) recebem o timer ao nascer
+        connection_created.connect(_install_query_timer, dispatch_uid="kogui_pokedex.query_timer")
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
         request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
         request.request_id = request_id
         set_request_id(request_id)
+        metrics = start_metrics()
+        for connection in connections.all(initialized_only=True):
+            _install_query_timer(connection)
 
         logger.info("request.received", extra={"method": request.method, "path": request.path})
 
@@ -36,8 +82,46 @@ class RequestIDMiddleware:
                     "method": request.method,
                     "path": request.path,
                     "status_code": getattr(response, "status_code", None),
+                    "metrics": metrics.as_dict(),
                 },
             )
             if response is not None:
                 response.headers["X-Request-ID"] = request_id
+                if settings.SERVER_TIMING:
+                    response.headers["Server-Timing"] = metrics.server_timing()
+            clear_metrics()
             clear_request_id()
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """Compress Pokédex payloads with brotli when the client accepts it, gzip otherwise.
+
+    Only paths under ``COMPRESSED_PATH_PREFIXES`` are compressed. They carry
+    no secrets, so the brotli path needs no BREACH padding; auth and user
+    endpoints are passed through untouched, as are images (sprites). Like
+    Django's ``GZipMiddleware``, strong ETags are weakened since the encoded
+    body is no longer byte-identical.
+    """
+
+    def process_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        if not request.path.startswith(COMPRESSED_PATH_PREFIXES):
+            return response
+        if response.get("Content-Type", "").startswith("image/"):
+            return response
+        accepts_brotli = _ACCEPTS_BROTLI.search(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if brotli is None or response.streaming or not accepts_brotli:
+            return super().process_response(request, response)
+        if len(response.content) < 200 or response.has_header("Content-Encoding"):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        compressed = brotli.compress(response.content, quality=BROTLI_QUALITY)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = "br"
+        return response
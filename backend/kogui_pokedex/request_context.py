@@ -1,7 +1,10 @@
 """Utilities for sharing request scoped data with log formatters."""
 from __future__ import annotations
 
+import threading
+import time
 from contextvars import ContextVar
+from typing import Any, Dict
 
 _request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
 
@@ -19,3 +22,84 @@ def get_request_id() -> str | None:
 def clear_request_id() -> None:
     """Remove the request id from the current context."""
     _request_id_var.set(None)
+
+
+class RequestMetrics:
+    """Where the time of one request went: database, cache tiers and upstream calls.
+
+    A single instance is shared by every thread working for the request
+    (``sync_to_async`` and the PokéAPI pool copy the context), so updates
+    are locked.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.upstream_calls = 0
+        self.upstream_time = 0.0
+        self.cache: Dict[str, Dict[str, int]] = {}
+
+    def add_query(self, seconds: float) -> None:
+        with self._lock:
+            self.db_queries += 1
+            self.db_time += seconds
+
+    def add_upstream(self, seconds: float) -> None:
+        with self._lock:
+            self.upstream_calls += 1
+            self.upstream_time += seconds
+
+    def add_cache(self, tier: str, hits: int = 0, misses: int = 0) -> None:
+        with self._lock:
+            counters = self.cache.setdefault(tier, {"hits": 0, "misses": 0})
+            counters["hits"] += hits
+            counters["misses"] += misses
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Counters for the completion log (times in milliseconds)."""
+        with self._lock:
+            return {
+                "duration_ms": round(self.elapsed() * 1000, 1),
+                "db": {"queries": self.db_queries, "ms": round(self.db_time * 1000, 1)},
+                "upstream": {"calls": self.upstream_calls, "ms": round(self.upstream_time * 1000, 1)},
+                "cache": {tier: dict(counters) for tier, counters in self.cache.items()},
+            }
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value (durations in milliseconds)."""
+        with self._lock:
+            metrics = [
+                f"total;dur={self.elapsed() * 1000:.1f}",
+                f'db;dur={self.db_time * 1000:.1f};desc="{self.db_queries} queries"',
+                f'upstream;dur={self.upstream_time * 1000:.1f};desc="{self.upstream_calls} calls"',
+            ]
+            metrics.extend(
+                f'cache-{tier};desc="hit {counters["hits"]} miss {counters["misses"]}"'
+                for tier, counters in sorted(self.cache.items())
+            )
+        return ", ".join(metrics)
+
+
+_metrics_var: ContextVar[RequestMetrics | None] = ContextVar("request_metrics", default=None)
+
+
+def start_metrics() -> RequestMetrics:
+    """Begin accounting for the request running in the current context."""
+    metrics = RequestMetrics()
+    _metrics_var.set(metrics)
+    return metrics
+
+
+def get_metrics() -> RequestMetrics | None:
+    """Return the accounting of the current request, if any (``None`` in background work)."""
+    return _metrics_var.get()
+
+
+def clear_metrics() -> None:
+    """Stop accounting in the current context."""
+    _metrics_var.set(None)
@@ -49,6 +49,8 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    # Depois do WhiteNoise (estáticos já saem pré-comprimidos), antes de quem lê o corpo
+    "kogui_pokedex.middleware.CompressionMiddleware",
     "kogui_pokedex.middleware.RequestIDMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -102,6 +104,56 @@ else:
         }
     }
 
+# Cache em camadas: L1 LRU por processo na frente de um L2 compartilhado entre
+# workers/containers. CACHE_BACKEND escolhe o L2: "none" (só L1), "file",
+# "redis" (requer o pacote redis) ou "db" (requer manage.py createcachetable).
+_cache_backend = os.environ.get("CACHE_BACKEND", "none")
+_cache_l2_backends = {
+    "file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get("CACHE_LOCATION", "/tmp/kogui-pokedex-cache"),
+    },
+    "redis": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ.get("CACHE_LOCATION", "redis://127.0.0.1:6379/1"),
+    },
+    "db": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": os.environ.get("CACHE_LOCATION", "kogui_cache"),
+    },
+}
+if _cache_backend != "none" and _cache_backend not in _cache_l2_backends:
+    raise ImproperlyConfigured(
+        f"CACHE_BACKEND inválido: {_cache_backend!r} (use none, file, redis ou db)."
+    )
+
+CACHES = {
+    "default": {
+        "BACKEND": "kogui_pokedex.cache.TieredCache",
+        "OPTIONS": {
+            "L1": "l1",
+            "L2": "l2" if _cache_backend in _cache_l2_backends else None,
+            "L1_TIMEOUT": int(os.environ.get("CACHE_L1_TIMEOUT", "300")),
+        },
+    },
+    "l1": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "kogui-pokedex-l1",
+        "OPTIONS": {"MAX_ENTRIES": int(os.environ.get("CACHE_L1_MAX_ENTRIES", "2000"))},
+    },
+}
+if _cache_backend in _cache_l2_backends:
+    CACHES["l2"] = {**_cache_l2_backends[_cache_backend], "TIMEOUT": None}
+
+# Snapshot offline do Pokédex (manage.py pokedex_sync); ausente = só PokéAPI
+POKEDEX_SNAPSHOT_PATH = Path(
+    os.environ.get("POKEDEX_SNAPSHOT_PATH", BASE_DIR / "data" / "pokedex_snapshot.json.gz")
+)
+# Artes baixadas uma vez pelo proxy /api/sprites/ (blobs endereçados por SHA-256)
+POKEDEX_SPRITES_ROOT = Path(os.environ.get("POKEDEX_SPRITES_ROOT", BASE_DIR / "data" / "sprites"))
+# Listas apontam o sprite para o proxy (miniatura) em vez do GitHub
+POKEMON_SPRITE_PROXY = os.environ.get("POKEMON_SPRITE_PROXY", "0") == "1"
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -127,6 +179,10 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "api.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
@@ -159,6 +215,10 @@ SPECTACULAR_SETTINGS = {
     "SCHEMA_PATH_PREFIX": "/api/",
 }
 
+# Server-Timing (total, banco, PokéAPI, tiers de cache) em toda resposta. Expõe detalhes
+# internos a qualquer cliente: desligado por padrão, ligar só onde fizer sentido
+SERVER_TIMING = os.environ.get("SERVER_TIMING", "0") == "1"
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+from kogui_pokedex.cache import TieredCache, cache_stats
+
+_TIERED_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-default"},
+    "l1": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-l1"},
+    "l2": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-l2"},
+}
+
+
+@override_settings(CACHES=_TIERED_CACHES)
+class TieredCacheTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.cache = TieredCache("", {"OPTIONS": {"L1": "l1", "L2": "l2", "L1_TIMEOUT": 60}})
+        self.cache.clear()
+
+    def test_l2_hit_is_copied_into_l1(self) -> None:
+        caches["l2"].set("pokeapi:pokemon/1/", {"id": 1})
+        before = cache_stats()
+
+        self.assertEqual(self.cache.get("pokeapi:pokemon/1/"), {"id": 1})
+        self.assertEqual(caches["l1"].get("pokeapi:pokemon/1/"), {"id": 1})
+        self.assertEqual(self.cache.get("pokeapi:pokemon/1/"), {"id": 1})
+
+        after = cache_stats()
+        self.assertEqual(after["l1"]["misses"] - before.get("l1", {}).get("misses", 0), 1)
+        self.assertEqual(after["l1"]["hits"] - before.get("l1", {}).get("hits", 0), 1)
+        self.assertEqual(after["l2"]["hits"] - before.get("l2", {}).get("hits", 0), 1)
+
+    def test_get_many_reads_l2_only_for_l1_misses(self) -> None:
+        caches["l1"].set("a", 1)
+        caches["l2"].set("b", 2)
+
+        self.assertEqual(self.cache.get_many(["a", "b", "c"]), {"a": 1, "b": 2})
+        self.assertEqual(caches["l1"].get("b"), 2)
+
+    def test_set_writes_every_tier_and_add_is_decided_by_l2(self) -> None:
+        self.cache.set("k", "v", 3600)
+        self.assertEqual(caches["l1"].get("k"), "v")
+        self.assertEqual(caches["l2"].get("k"), "v")
+
+        caches["l1"].delete("k")
+        self.assertFalse(self.cache.add("k", "other"))
+        self.assertTrue(self.cache.add("fresh", "value"))
+        self.assertEqual(caches["l1"].get("fresh"), "value")
+
+    def test_l1_timeout_caps_only_entries_backed_by_l2(self) -> None:
+        l1_only = TieredCache("", {"OPTIONS": {"L1": "l1", "L1_TIMEOUT": 60}})
+
+        self.assertEqual(self.cache._timeout_for("l1", None), 60)
+        self.assertEqual(self.cache._timeout_for("l1", 3600), 60)
+        self.assertIsNone(self.cache._timeout_for("l2", None))
+        # Sem L2 (CACHE_BACKEND=none) o L1 guarda o TTL pedido: versão do catálogo, stale etc.
+        self.assertIsNone(l1_only._timeout_for("l1", None))
+        self.assertEqual(l1_only._timeout_for("l1", 3600), 3600)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import gzip
+import json
+from unittest import skipIf
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from kogui_pokedex import middleware
+from kogui_pokedex.middleware import CompressionMiddleware
+
+_BODY = json.dumps(
+    [{"id": pokemon_id, "name": f"pokemon-{pokemon_id}", "types": ["grass", "poison"]} for pokemon_id in range(50)]
+).encode()
+
+
+def _respond(content_type: str = "application/json"):
+    def get_response(_request):
+        response = HttpResponse(_BODY, content_type=content_type)
+        response["ETag"] = '"abc"'
+        return response
+
+    return get_response
+
+
+class CompressionMiddlewareTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+
+    def test_gzip_when_brotli_is_not_accepted(self) -> None:
+        request = self.factory.get("/api/pokemon/", HTTP_ACCEPT_ENCODING="gzip, deflate")
+        response = CompressionMiddleware(_respond())(request)
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), _BODY)
+        self.assertEqual(response["ETag"], 'W/"abc"')
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    @skipIf(middleware.brotli is None, "brotli não instalado")
+    def test_brotli_is_preferred_when_accepted(self) -> None:
+        request = self.factory.get("/api/pokemon/", HTTP_ACCEPT_ENCODING="gzip, deflate, br")
+        response = CompressionMiddleware(_respond())(request)
+
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(middleware.brotli.decompress(response.content), _BODY)
+        self.assertEqual(response["Content-Length"], str(len(response.content)))
+
+    def test_images_and_uncompressed_clients_pass_through(self) -> None:
+        image = CompressionMiddleware(_respond("image/png"))(
+            self.factory.get("/api/sprites/1/96/", HTTP_ACCEPT_ENCODING="gzip, br")
+        )
+        plain = CompressionMiddleware(_respond())(self.factory.get("/api/pokemon/"))
+
+        self.assertFalse(image.has_header("Content-Encoding"))
+        self.assertFalse(plain.has_header("Content-Encoding"))
+        self.assertEqual(plain.content, _BODY)
+
+    def test_responses_with_credentials_are_never_compressed(self) -> None:
+        for path in ("/api/token/", "/auth/me/", "/api/favorites/"):
+            response = CompressionMiddleware(_respond())(self.factory.post(path, HTTP_ACCEPT_ENCODING="gzip, br"))
+            self.assertFalse(response.has_header("Content-Encoding"), path)
+            self.assertEqual(response.content, _BODY)
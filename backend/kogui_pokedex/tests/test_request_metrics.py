@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import threading
+from contextvars import copy_context
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from kogui_pokedex.cache import TieredCache
+from kogui_pokedex.middleware import _install_query_timer
+from kogui_pokedex.request_context import RequestMetrics, clear_metrics, get_metrics, start_metrics
+
+
+class RequestMetricsTests(TestCase):
+    def tearDown(self) -> None:
+        clear_metrics()
+
+    def test_counters_follow_the_copied_context(self) -> None:
+        metrics = start_metrics()
+        seen = []
+        workers = [
+            threading.Thread(target=copy_context().run, args=(lambda: get_metrics().add_upstream(0.25),)),
+            # Sem copiar o contexto (ex.: backfill em background) nada é atribuído à requisição
+            threading.Thread(target=lambda: seen.append(get_metrics())),
+        ]
+        for worker in workers:
+            worker.start()
+            worker.join()
+
+        self.assertEqual(seen, [None])
+        self.assertEqual(metrics.upstream_calls, 1)
+        self.assertIn('upstream;dur=250.0;desc="1 calls"', metrics.server_timing())
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "metrics-default"},
+            "l1": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "metrics-l1"},
+            "l2": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "metrics-l2"},
+        }
+    )
+    def test_cache_tiers_are_counted_per_request(self) -> None:
+        tiered = TieredCache("", {"OPTIONS": {"L1": "l1", "L2": "l2"}})
+        tiered.clear()
+        caches["l2"].set("pokeapi:pokemon/1/", {"id": 1})
+        metrics = start_metrics()
+
+        tiered.get("pokeapi:pokemon/1/")
+        tiered.get("pokeapi:pokemon/2/")
+
+        self.assertEqual(metrics.cache, {"l1": {"hits": 0, "misses": 2}, "l2": {"hits": 1, "misses": 1}})
+        self.assertEqual(RequestMetrics().as_dict()["cache"], {})
+
+    def test_queries_are_timed(self) -> None:
+        _install_query_timer(connection)
+        metrics = start_metrics()
+
+        get_user_model().objects.count()
+
+        self.assertEqual(metrics.db_queries, 1)
+        self.assertGreater(metrics.db_time, 0)
+
+    def test_responses_carry_server_timing_when_enabled(self) -> None:
+        url = reverse("api:favorite-list")
+        with self.assertLogs("kogui_pokedex.middleware", level="INFO") as logs:
+            with override_settings(SERVER_TIMING=True):
+                response = self.client.get(url)
+            hidden = self.client.get(url)
+
+        self.assertIn("total;dur=", response["Server-Timing"])
+        self.assertIn("db;dur=", response["Server-Timing"])
+        self.assertFalse(hidden.has_header("Server-Timing"))
+        completed = [record for record in logs.records if record.getMessage() == "request.completed"]
+        self.assertIn("duration_ms", completed[0].metrics)
+        self.assertEqual(completed[0].metrics["upstream"]["calls"], 0)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from django.core.cache import cache
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 
@@ -7,4 +8,8 @@ from django.views.decorators.http import require_http_methods
 @require_http_methods(["GET"])
 def health_check(_request):
     """Simple health probe used by Docker and observability checks."""
-    return JsonResponse({"status": "ok"})
+    payload = {"status": "ok"}
+    stats = getattr(cache, "stats", None)
+    if callable(stats):
+        payload["cache"] = stats()
+    return JsonResponse(payload)
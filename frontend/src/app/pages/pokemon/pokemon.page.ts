@@ -36,9 +36,10 @@ export class PokemonPageComponent implements OnInit {
   readonly pokemons = signal<CardPokemon[]>([]);
   readonly isLoading = signal(false);
   readonly total = signal(0);
-  private currentOffset = 0;
+  // Cursor da próxima página: cada "carregar mais" custa uma página, por mais fundo que esteja
+  private readonly nextLink = signal<string | null>(null);
 
-  readonly hasMore = computed(() => this.pokemons().length < this.total());
+  readonly hasMore = computed(() => this.nextLink() !== null);
 
   // Filtro de tipo (server-side)
   readonly selectedType = signal<string>('all');
@@ -84,7 +85,7 @@ export class PokemonPageComponent implements OnInit {
     if (this.selectedType() === type) return;
     this.selectedType.set(type);
     this.pokemons.set([]);
-    this.currentOffset = 0;
+    this.nextLink.set(null);
     this.total.set(0);
     this.loadPage(false);
   }
@@ -97,10 +98,13 @@ export class PokemonPageComponent implements OnInit {
 
   private loadPage(append: boolean): void {
     const type = this.selectedType() === 'all' ? null : this.selectedType();
-    const offset = append ? this.currentOffset : 0;
+    const link = append ? this.nextLink() : null;
+    const request = link
+      ? this.api.listPokemonPage(link)
+      : this.api.listPokemon({ type, limit: this.PAGE_SIZE });
 
     this.isLoading.set(true);
-    this.api.listPokemon({ type, limit: this.PAGE_SIZE, offset }).subscribe({
+    request.subscribe({
       next: (res) => {
         const cards = res.results.map((p) => this.mapToCard(p));
         if (append) {
@@ -109,7 +113,7 @@ export class PokemonPageComponent implements OnInit {
           this.pokemons.set(cards);
         }
         this.total.set(res.count);
-        this.currentOffset = offset + cards.length;
+        this.nextLink.set(res.next);
         this.isLoading.set(false);
       },
       error: () => {
@@ -205,7 +209,7 @@ export class PokemonPageComponent implements OnInit {
       id: p.id,
       dex: `#${String(p.id).padStart(3, '0')}`,
       name: this.cap(p.name),
-      img: p.sprite ?? '',
+      img: this.api.spriteUrl(p.sprite),
       types: (p.types ?? []).map((t) => this.cap(t)),
       hp: p.stats?.hp ?? 0,
       attack: p.stats?.attack ?? 0,
@@ -16,11 +16,23 @@ export interface PokemonListItem {
   name: string;
   types: string[];
   sprite: string | null;
-  stats: { hp: number; attack: number; defense: number };
+  /** null em placeholders (Pokémon que a PokéAPI não entregou a tempo) */
+  stats: { hp: number; attack: number; defense: number } | null;
+  placeholder?: boolean;
   is_favorite?: boolean;
   is_in_team?: boolean;
 }
 
+export interface PokemonListPage {
+  results: PokemonListItem[];
+  count: number;
+  /** true quando algum item é placeholder; recarregar depois traz os dados completos */
+  partial?: boolean;
+  /** Link relativo (com cursor) para a próxima página; null no fim da lista */
+  next: string | null;
+  previous: string | null;
+}
+
 export interface FavoriteItem {
   id: number;
   pokemon_id: number;
@@ -53,16 +65,25 @@ export class ApiService {
     type?: string | null;
     limit?: number;
     offset?: number;
-  }): Observable<{ results: PokemonListItem[]; count: number }> {
+  }): Observable<PokemonListPage> {
     const q = new URLSearchParams();
     if (params.generation) q.set('generation', String(params.generation));
     if (params.name) q.set('name', String(params.name));
     if (params.type) q.set('type', String(params.type));
     q.set('limit', String(params.limit ?? 20));
     q.set('offset', String(params.offset ?? 0));
-    return this.http.get<{ results: PokemonListItem[]; count: number }>(
-      `${env.apiBase}/api/pokemon/?${q.toString()}`
-    );
+    return this.http.get<PokemonListPage>(`${env.apiBase}/api/pokemon/?${q.toString()}`);
+  }
+
+  /** Segue o link `next`/`previous` de uma página (paginação por cursor) */
+  listPokemonPage(link: string): Observable<PokemonListPage> {
+    return this.http.get<PokemonListPage>(`${env.apiBase}${link}`);
+  }
+
+  /** Sprites servidos pelo proxy da API vêm como caminho relativo (`/api/sprites/...`) */
+  spriteUrl(sprite: string | null | undefined): string {
+    if (!sprite) return '';
+    return sprite.startsWith('/') ? `${env.apiBase}${sprite}` : sprite;
   }
 
   // ===== FAVORITOS =====